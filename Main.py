@@ -1,12 +1,15 @@
 """
 Главный модуль приложения "Генератор паролей".
 
-Этот модуль является точкой входа в приложение. Он создает главное окно
-и запускает основной цикл обработки событий Tkinter.
+Этот модуль является точкой входа в приложение. Без аргументов он создает
+главное окно и запускает основной цикл обработки событий Tkinter. При вызове
+с подкомандой (например, "generate") работает как консольная утилита и
+не импортирует tkinter.
 """
 
-import tkinter as tk
-from gui.MainWindow import MainWindow
+import argparse
+import sys
+from typing import List, Optional
 
 
 def main() -> None:
@@ -22,6 +25,9 @@ def main() -> None:
     3. Запуск основного цикла обработки событий
     """
     try:
+        import tkinter as tk
+        from gui.MainWindow import MainWindow
+
         # Инициализация корневого окна
         root = tk.Tk()
 
@@ -37,5 +43,101 @@ def main() -> None:
         raise
 
 
+def build_parser() -> argparse.ArgumentParser:
+    """Создает парсер аргументов командной строки."""
+    from cli import (
+        Audit, CompileBlocklist, CompileWordlist, Generate, Hash, InsecureCorpus,
+        Passphrase, Serve
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="Main.py",
+        description="Генератор паролей (без аргументов запускается GUI)"
+    )
+    stats = parser.add_argument_group(
+        "метрики",
+        "метрики собираются в текущем процессе; для подкоманд с рабочими "
+        "процессами используйте --workers 1"
+    )
+    stats.add_argument("--stats", action="store_true",
+                       help="вывести в stderr счетчики и задержки горячих путей")
+    stats.add_argument("--stats-file", metavar="PATH",
+                       help="записать метрики в формате Prometheus")
+    stats.add_argument("--profile", metavar="PATH",
+                       help="сохранить выборочный профиль cProfile (pstats)")
+    stats.add_argument("--profile-every", type=int, default=100, metavar="N",
+                       help="профилировать каждый N-й вызов (по умолчанию 100)")
+    subparsers = parser.add_subparsers(dest="command")
+    Generate.add_parser(subparsers)
+    CompileBlocklist.add_parser(subparsers)
+    Audit.add_parser(subparsers)
+    Passphrase.add_parser(subparsers)
+    CompileWordlist.add_parser(subparsers)
+    Serve.add_parser(subparsers)
+    InsecureCorpus.add_parser(subparsers)
+    Hash.add_parser(subparsers)
+    return parser
+
+
+def run_cli(argv: List[str]) -> int:
+    """
+    Выполняет консольную подкоманду.
+
+    Возвращает код завершения процесса.
+    """
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        main()
+        return 0
+
+    collect = args.stats or args.stats_file or args.profile
+    try:
+        if collect:
+            from utils import Metrics
+            Metrics.enable()
+            if args.profile:
+                Metrics.enable_profiling(args.profile_every)
+        try:
+            return args.handler(args)
+        finally:
+            if collect:
+                report_metrics(args)
+    except ValueError as e:
+        print(f"Ошибка: {str(e)}", file=sys.stderr)
+        return 2
+    except ImportError as e:
+        print(f"Ошибка: {str(e)}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # Потребитель stdout (например, head) закрыл канал раньше времени;
+        # BrokenPipeError - подкласс OSError, поэтому проверяется первым
+        sys.stderr.close()
+        return 0
+    except OSError as e:
+        print(f"Ошибка ввода-вывода: {str(e)}", file=sys.stderr)
+        return 1
+
+
+def report_metrics(args: argparse.Namespace) -> None:
+    """Выводит и сохраняет собранные метрики и профиль."""
+    from utils import Metrics
+
+    if args.stats:
+        print(Metrics.format_stats(), file=sys.stderr)
+    if args.stats_file:
+        Metrics.write_prometheus(args.stats_file)
+    if args.profile:
+        Metrics.dump_profile(args.profile)
+
+
+def entry_point(argv: Optional[List[str]] = None) -> int:
+    """Точка входа: GUI без аргументов, иначе консольный режим."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        main()
+        return 0
+    return run_cli(argv)
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(entry_point())
@@ -0,0 +1,133 @@
+"""
+Модуль пакетного аудита паролей.
+
+Читает файл паролей построчно, делит его на порции и проверяет их
+(analyze_password) в пуле процессов. Результаты каждой порции
+возвращаются уже отформатированными (CSV или JSON Lines) вместе с
+гистограммой уровней по проверкам.
+"""
+
+import csv
+import io
+import json
+from collections import Counter
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from analyzer.Blocklist import set_blocklist
+from analyzer.PasswordAnalyzer import (
+    CHECK_NAMES, analyze_password, get_security_level
+)
+from analyzer.StrengthEstimator import estimate_strength, get_estimate_level
+from utils.Constants import OUTPUT_FORMATS
+from utils.OrderedPool import imap_ordered
+
+# Количество строк в одной порции
+CHUNK_LINES = 20000
+
+
+def _init_worker(blocklist: Optional[str]) -> None:
+    """Подключает индекс утекших паролей в рабочем процессе."""
+    if blocklist:
+        set_blocklist(blocklist)
+
+
+def _iter_chunks(stream: BinaryIO, output_format: str, with_password: bool,
+                 with_estimate: bool, chunk_lines: int) -> Iterator[Tuple]:
+    """Делит входной поток на порции строк."""
+    lines: List[bytes] = []
+    first_line = 1
+    for line in stream:
+        lines.append(line)
+        if len(lines) >= chunk_lines:
+            yield lines, first_line, output_format, with_password, with_estimate
+            first_line += len(lines)
+            lines = []
+    if lines:
+        yield lines, first_line, output_format, with_password, with_estimate
+
+
+def audit_chunk(lines: List[bytes], first_line: int, output_format: str,
+                with_password: bool,
+                with_estimate: bool = False) -> Tuple[bytes, Counter]:
+    """
+    Проверяет порцию строк.
+
+    Возвращает отформатированные результаты и количество паролей
+    каждого уровня по проверкам (checks_level). При with_estimate к
+    результатам добавляются балл, уровень (level) и энтропия из
+    analyzer.StrengthEstimator - тот же уровень, что показывает окно проверки.
+    """
+    histogram: Counter = Counter()
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n") if output_format == "csv" else None
+
+    for number, raw in enumerate(lines, first_line):
+        password = raw.rstrip(b"\r\n").decode("utf-8", "replace")
+        if not password:
+            continue
+        checks = analyze_password(password)
+        percent = checks.percent
+        checks_level = get_security_level(percent)
+        histogram[checks_level] += 1
+
+        estimate = estimate_strength(password) if with_estimate else None
+
+        if writer is not None:
+            row = [number, checks_level, percent]
+            row.extend(int(getattr(checks, name)) for name in CHECK_NAMES)
+            if estimate is not None:
+                row.extend((estimate.score, get_estimate_level(estimate),
+                            f"{estimate.entropy_bits:.1f}"))
+            if with_password:
+                row.append(password)
+            writer.writerow(row)
+        else:
+            record = {"line": number, "checks_level": checks_level, "percent": percent}
+            record.update(checks.as_dict())
+            if estimate is not None:
+                record["score"] = estimate.score
+                record["level"] = get_estimate_level(estimate)
+                record["bits"] = round(estimate.entropy_bits, 1)
+            if with_password:
+                record["password"] = password
+            buffer.write(json.dumps(record, ensure_ascii=False))
+            buffer.write("\n")
+
+    return buffer.getvalue().encode("utf-8"), histogram
+
+
+def csv_header(with_password: bool, with_estimate: bool = False) -> bytes:
+    """Возвращает строку заголовка CSV."""
+    columns = ["line", "checks_level", "percent", *CHECK_NAMES]
+    if with_estimate:
+        columns.extend(("score", "level", "bits"))
+    if with_password:
+        columns.append("password")
+    return (",".join(columns) + "\n").encode("utf-8")
+
+
+def audit_stream(source: BinaryIO, sink: BinaryIO, output_format: str = "csv",
+                 workers: Optional[int] = None, blocklist: Optional[str] = None,
+                 with_password: bool = False, with_estimate: bool = False,
+                 chunk_lines: int = CHUNK_LINES) -> Dict[str, int]:
+    """
+    Проверяет все пароли из source и записывает результаты в sink.
+
+    Возвращает гистограмму уровней по проверкам. В памяти одновременно
+    находится ограниченное число порций независимо от размера входа.
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Неизвестный формат вывода: {output_format}")
+
+    if output_format == "csv":
+        sink.write(csv_header(with_password, with_estimate))
+
+    histogram: Counter = Counter()
+    chunks = _iter_chunks(source, output_format, with_password, with_estimate,
+                          chunk_lines)
+    for block, counts in imap_ordered(audit_chunk, chunks, workers,
+                                      initializer=_init_worker,
+                                      initargs=(blocklist,)):
+        sink.write(block)
+        histogram.update(counts)
+    return dict(histogram)
@@ -0,0 +1,108 @@
+"""
+Модуль списков утекших паролей.
+
+Компилирует текстовые словари паролей или списки SHA-1 (в том числе в
+формате "HEX:количество") в индекс utils.HashIndex и проверяет пароли
+по нему через mmap, не загружая корпус в память.
+"""
+
+import os
+from typing import Iterator, Optional, Union
+
+from utils.Constants import (
+    CORPUS_FORMATS, DEFAULT_ERROR_RATE, DEFAULT_WIDTH, INDEX_FORMATS
+)
+from utils.HashIndex import (
+    BloomFilter, SortedHashIndex, hash_key, open_index,
+    write_bloom_filter, write_sorted_index
+)
+
+# Переменная окружения с путем к индексу по умолчанию
+BLOCKLIST_ENV = "PASSGEN_BLOCKLIST"
+
+_blocklist: Optional[Union[SortedHashIndex, BloomFilter]] = None
+_blocklist_loaded = False
+
+
+def iter_corpus_hashes(path: str, input_format: str = "plain") -> Iterator[bytes]:
+    """
+    Читает корпус и выдает SHA-1 каждой записи.
+
+    Пароли в текстовом формате приводятся к нижнему регистру, как и в
+    проверке распространенных паролей.
+    """
+    if input_format not in CORPUS_FORMATS:
+        raise ValueError(f"Неизвестный формат корпуса: {input_format}")
+
+    with open(path, "rb", buffering=1024 * 1024) as stream:
+        for line in stream:
+            line = line.rstrip(b"\r\n")
+            if not line:
+                continue
+            if input_format == "plain":
+                yield hash_key(line.decode("utf-8", "replace").lower())
+            else:
+                try:
+                    yield bytes.fromhex(line.split(b":", 1)[0].decode("ascii"))
+                except ValueError:
+                    raise ValueError(f"Некорректный SHA-1 в корпусе: {line[:64]!r}")
+
+
+def _count_lines(path: str) -> int:
+    """Считает непустые строки файла (для расчета размера фильтра Блума)."""
+    count = 0
+    with open(path, "rb", buffering=1024 * 1024) as stream:
+        for line in stream:
+            if line.strip():
+                count += 1
+    return count
+
+
+def compile_blocklist(source: str, target: str, input_format: str = "plain",
+                      index_format: str = "sorted", width: int = DEFAULT_WIDTH,
+                      error_rate: float = DEFAULT_ERROR_RATE) -> int:
+    """
+    Компилирует корпус source в файл индекса target.
+
+    Возвращает количество записей, помещенных в индекс.
+    """
+    if index_format not in INDEX_FORMATS:
+        raise ValueError(f"Неизвестный формат индекса: {index_format}")
+
+    digests = iter_corpus_hashes(source, input_format)
+    if index_format == "sorted":
+        return write_sorted_index(target, digests, width=width)
+    return write_bloom_filter(target, digests, _count_lines(source), error_rate)
+
+
+def is_blocklisted(index: Union[SortedHashIndex, BloomFilter], password: str) -> bool:
+    """
+    Проверяет пароль по индексу.
+
+    Проверяются как сам пароль, так и его вариант в нижнем регистре.
+    """
+    lower_pass = password.lower()
+    if index.contains_hash(hash_key(lower_pass)):
+        return True
+    return lower_pass != password and index.contains_hash(hash_key(password))
+
+
+def set_blocklist(path: Optional[str]) -> None:
+    """Подключает индекс утекших паролей (None - отключает)."""
+    global _blocklist, _blocklist_loaded
+    if _blocklist is not None:
+        _blocklist.close()
+    _blocklist = open_index(path) if path else None
+    _blocklist_loaded = True
+
+
+def get_blocklist() -> Optional[Union[SortedHashIndex, BloomFilter]]:
+    """
+    Возвращает подключенный индекс.
+
+    При первом обращении индекс открывается по пути из переменной
+    окружения PASSGEN_BLOCKLIST, если она задана.
+    """
+    if not _blocklist_loaded:
+        set_blocklist(os.environ.get(BLOCKLIST_ENV) or None)
+    return _blocklist
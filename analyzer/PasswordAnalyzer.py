@@ -0,0 +1,231 @@
+"""
+Модуль анализа надежности пароля.
+
+Не зависит от графического интерфейса: выполняет все проверки окна
+CheckWindow за один проход по паролю с использованием заранее
+построенных таблиц классов символов.
+"""
+
+import os
+import string
+from typing import Dict, FrozenSet, List, Tuple
+
+from analyzer.Blocklist import get_blocklist, is_blocklisted
+from analyzer.SequenceMatcher import get_default_matcher
+from utils.Metrics import timed
+
+# Битовые флаги классов символов
+LOWERCASE = 1
+UPPERCASE = 2
+DIGITS = 4
+SPECIAL = 8
+
+# Таблица "символ -> класс", строится один раз при импорте
+CHAR_CLASSES: Dict[str, int] = {}
+for _chars, _flag in ((string.ascii_lowercase, LOWERCASE),
+                      (string.ascii_uppercase, UPPERCASE),
+                      (string.digits, DIGITS),
+                      (string.punctuation, SPECIAL)):
+    for _char in _chars:
+        CHAR_CLASSES[_char] = _flag
+
+# Минимальная рекомендуемая длина пароля
+MIN_LENGTH = 12
+
+# Распространенные пароли (в нижнем регистре)
+COMMON_PASSWORDS: FrozenSet[str] = frozenset((
+    "password", "123456", "qwerty", "admin", "welcome",
+    "12345678", "abc123", "password1", "12345", "123456789"
+))
+
+# Названия проверок в порядке отображения
+CHECK_NAMES: Tuple[str, ...] = (
+    "length", "lowercase", "uppercase", "digits",
+    "special", "common", "repeats", "sequences"
+)
+
+
+class SecurityChecks:
+    """Результат проверки пароля: по одному флагу на каждую проверку."""
+
+    __slots__ = CHECK_NAMES
+
+    def __init__(self, length: bool, lowercase: bool, uppercase: bool,
+                 digits: bool, special: bool, common: bool, repeats: bool,
+                 sequences: bool) -> None:
+        self.length = length
+        self.lowercase = lowercase
+        self.uppercase = uppercase
+        self.digits = digits
+        self.special = special
+        self.common = common
+        self.repeats = repeats
+        self.sequences = sequences
+
+    @property
+    def passed(self) -> int:
+        """Количество пройденных проверок."""
+        return sum(getattr(self, name) for name in CHECK_NAMES)
+
+    @property
+    def percent(self) -> int:
+        """Доля пройденных проверок в процентах."""
+        return int((self.passed / len(CHECK_NAMES)) * 100)
+
+    def as_dict(self) -> Dict[str, bool]:
+        """Возвращает результаты в виде словаря (в порядке CHECK_NAMES)."""
+        return {name: getattr(self, name) for name in CHECK_NAMES}
+
+    def __repr__(self) -> str:
+        return f"SecurityChecks({self.as_dict()!r})"
+
+
+def get_security_level(percent: int) -> str:
+    """Возвращает название уровня безопасности по проценту пройденных проверок."""
+    if percent >= 90:
+        return "Отличный"
+    elif percent >= 70:
+        return "Хороший"
+    elif percent >= 50:
+        return "Средний"
+    return "Слабый"
+
+
+@timed("is_common_password")
+def is_common_password(password: str) -> bool:
+    """
+    Проверяет, входит ли пароль в список распространенных.
+
+    Если подключен индекс утекших паролей (analyzer.Blocklist), пароль
+    дополнительно проверяется по нему.
+    """
+    if password.lower() in COMMON_PASSWORDS:
+        return True
+    blocklist = get_blocklist()
+    return blocklist is not None and is_blocklisted(blocklist, password)
+
+
+def has_common_sequences(password: str) -> bool:
+    """Проверяет наличие простых последовательностей"""
+    return get_default_matcher().contains(password.lower())
+
+
+@timed("analyze_password")
+def analyze_password(password: str) -> SecurityChecks:
+    """
+    Выполняет комплексную проверку пароля за один проход.
+
+    За проход по символам накапливаются классы символов, отслеживаются
+    тройные повторы, а символы в нижнем регистре подаются в автомат
+    поиска последовательностей (analyzer.SequenceMatcher).
+    """
+    lower_pass = password.lower()
+    matcher = get_default_matcher()
+    transitions = matcher.transitions
+    outputs = matcher.outputs
+    classes = 0
+    repeats = False
+    # Для редких символов lower() меняет длину строки - тогда позиции
+    # не совпадают, и последовательности ищутся отдельно
+    aligned = len(lower_pass) == len(password)
+    sequences = False if aligned else matcher.contains(lower_pass)
+    state = 0
+    prev = prev2 = ""
+
+    for char, lower_char in zip(password, lower_pass if aligned else password):
+        classes |= CHAR_CLASSES.get(char, 0)
+        if not repeats and char == prev == prev2:
+            repeats = True
+        if aligned and not sequences:
+            state = transitions[state].get(lower_char, 0)
+            if outputs[state]:
+                sequences = True
+        prev2, prev = prev, char
+
+    return SecurityChecks(
+        length=len(password) >= MIN_LENGTH,
+        lowercase=bool(classes & LOWERCASE),
+        uppercase=bool(classes & UPPERCASE),
+        digits=bool(classes & DIGITS),
+        special=bool(classes & SPECIAL),
+        common=not is_common_password(password),
+        repeats=not repeats,
+        sequences=not sequences
+    )
+
+
+class IncrementalAnalyzer:
+    """
+    Анализатор для проверки по мере ввода.
+
+    Хранит состояние проверки после каждого символа предыдущего пароля.
+    При изменении пароля проход возобновляется с конца общего префикса,
+    поэтому добавление символа проверяет только новый хвост.
+    """
+
+    __slots__ = ("_password", "_snapshots")
+
+    def __init__(self) -> None:
+        self._password = ""
+        # Состояние после i-го символа: (классы, повтор, последовательность,
+        # состояние автомата)
+        self._snapshots: List[Tuple[int, bool, bool, int]] = []
+
+    def reset(self) -> None:
+        """Сбрасывает сохраненное состояние."""
+        self._password = ""
+        self._snapshots = []
+
+    @timed("analyze_incremental")
+    def update(self, password: str) -> SecurityChecks:
+        """Проверяет новый вариант пароля, используя общий с прежним префикс."""
+        lower_pass = password.lower()
+        if len(lower_pass) != len(password):
+            # Позиции в нижнем регистре не совпадают - полная проверка
+            self.reset()
+            return analyze_password(password)
+
+        matcher = get_default_matcher()
+        transitions = matcher.transitions
+        outputs = matcher.outputs
+        if password.startswith(self._password):
+            # Частый случай: к паролю добавлены символы
+            start = len(self._password)
+        elif self._password.startswith(password):
+            # Символы удалены с конца
+            start = len(password)
+        else:
+            start = len(os.path.commonprefix((self._password, password)))
+        snapshots = self._snapshots
+        del snapshots[start:]
+
+        if start:
+            classes, repeats, sequences, state = snapshots[-1]
+        else:
+            classes, repeats, sequences, state = 0, False, False, 0
+        prev = password[start - 1] if start >= 1 else ""
+        prev2 = password[start - 2] if start >= 2 else ""
+
+        for index in range(start, len(password)):
+            char = password[index]
+            classes |= CHAR_CLASSES.get(char, 0)
+            if not repeats and char == prev == prev2:
+                repeats = True
+            if not sequences:
+                state = transitions[state].get(lower_pass[index], 0)
+                if outputs[state]:
+                    sequences = True
+            snapshots.append((classes, repeats, sequences, state))
+            prev2, prev = prev, char
+
+        self._password = password
+        return SecurityChecks(
+            length=len(password) >= MIN_LENGTH,
+            lowercase=bool(classes & LOWERCASE),
+            uppercase=bool(classes & UPPERCASE),
+            digits=bool(classes & DIGITS),
+            special=bool(classes & SPECIAL),
+            common=not is_common_password(password),
+            repeats=not repeats,
+            sequences=not sequences
+        )
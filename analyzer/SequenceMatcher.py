@@ -0,0 +1,264 @@
+"""
+Модуль поиска клавиатурных и алфавитных последовательностей.
+
+Из словарей "обходов" (рядов клавиатуры, диагоналей, алфавитов) строится
+один автомат Ахо-Корасик, который находит все вхождения за один линейный
+проход по паролю. Автомат строится один раз при первом использовании.
+
+Небольшие автоматы (встроенные словари) хранят полную таблицу переходов
+ДКА. Ее размер - число состояний на размер алфавита, поэтому у больших
+автоматов (тысячи дополнительных обходов) строки переходов разреженные:
+только ребра бора и суффиксная ссылка.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Минимальная длина последовательности, считающейся слабой
+MIN_SEQUENCE_LENGTH = 3
+
+# Словари обходов: каждая строка задает последовательность соседних
+# символов; слабыми считаются все ее подстроки длиной от
+# MIN_SEQUENCE_LENGTH (в прямом и обратном направлении)
+DICTIONARIES: Dict[str, Tuple[str, ...]] = {
+    "digits": ("0123456789",),
+    "latin": ("abcdefghijklmnopqrstuvwxyz",),
+    "qwerty": ("1234567890-=", "qwertyuiop[]", "asdfghjkl;'", "zxcvbnm,./"),
+    "qwerty_diagonals": (
+        "1qaz", "2wsx", "3edc", "4rfv", "5tgb",
+        "6yhn", "7ujm", "8ik,", "9ol.", "0p;/",
+        "2qa", "3wsz", "4edx", "5rfc", "6tgv",
+        "7yhb", "8ujn", "9ikm", "0ol,", "-p;.",
+    ),
+    "cyrillic": ("абвгдеёжзийклмнопрстуфхцчшщъыьэюя",),
+    "jcuken": ("йцукенгшщзхъ", "фывапролджэ", "ячсмитьбю."),
+}
+
+DEFAULT_DICTIONARIES: Tuple[str, ...] = tuple(DICTIONARIES)
+
+# Наибольшее число состояний автомата с полной таблицей переходов
+# (у встроенных словарей около 2700 состояний)
+MAX_DENSE_STATES = 8192
+
+# Наибольшая суммарная длина дополнительных обходов build_matcher: бор
+# из случайных обходов растет почти на символ подстроки, и построение
+# 10 000 символов занимает около 0.4 с
+MAX_EXTRA_CHARS = 10_000
+
+
+class SequenceMatch(NamedTuple):
+    """Найденная последовательность: позиция, длина и словарь."""
+
+    start: int
+    length: int
+    dictionary: str
+
+
+def expand_walks(walks: Iterable[str], min_length: int = MIN_SEQUENCE_LENGTH,
+                 reverse: bool = True) -> List[str]:
+    """Возвращает все подстроки обходов длиной не менее min_length."""
+    patterns = []
+    for walk in walks:
+        variants = (walk, walk[::-1]) if reverse else (walk,)
+        for variant in variants:
+            for start in range(len(variant) - min_length + 1):
+                for end in range(start + min_length, len(variant) + 1):
+                    patterns.append(variant[start:end])
+    return patterns
+
+
+def walk_suffixes(walks: Iterable[str], min_length: int = MIN_SEQUENCE_LENGTH,
+                  reverse: bool = True) -> List[str]:
+    """
+    Возвращает суффиксы обходов длиной не менее min_length: их префиксы
+    (SequenceMatcher с min_prefix=min_length) - те же шаблоны, что и у
+    expand_walks, но бор строится за квадратичное, а не кубическое время.
+    """
+    suffixes = []
+    for walk in walks:
+        variants = (walk, walk[::-1]) if reverse else (walk,)
+        for variant in variants:
+            suffixes.extend(variant[start:]
+                            for start in range(len(variant) - min_length + 1))
+    return suffixes
+
+
+class _SparseRow(dict):
+    """
+    Строка переходов разреженного автомата: ребра бора и суффиксная ссылка.
+
+    get(char, 0) возвращает переход ДКА, проходя при необходимости по
+    суффиксным ссылкам, поэтому строка взаимозаменяема с полной.
+    """
+
+    __slots__ = ("fail",)
+
+    def get(self, char: str, default: int = 0) -> int:
+        row: Optional[_SparseRow] = self
+        while row is not None:
+            following = dict.get(row, char)
+            if following is not None:
+                return following
+            row = row.fail
+        return default
+
+
+class SequenceMatcher:
+    """
+    Автомат Ахо-Корасик по набору словарей шаблонов.
+
+    transitions[state].get(char, 0) - переход ДКА. При числе состояний не
+    более MAX_DENSE_STATES (или dense=True) строки хранят полную таблицу
+    переходов, и на символ текста приходится один поиск в словаре; иначе
+    строки разреженные (_SparseRow).
+    """
+
+    __slots__ = ("transitions", "outputs", "names")
+
+    def __init__(self, dictionaries: Dict[str, Iterable[str]],
+                 dense: Optional[bool] = None,
+                 min_prefix: Optional[int] = None) -> None:
+        """
+        При заданном min_prefix шаблонами считаются все префиксы строк
+        словарей длиной от min_prefix: для обходов достаточно передать их
+        суффиксы (см. walk_suffixes) вместо всех подстрок.
+        """
+        goto: List[Dict[str, int]] = [{}]
+        # Для каждого состояния: кортеж (длина, индекс словаря)
+        outputs: List[List[Tuple[int, int]]] = [[]]
+        self.names: Tuple[str, ...] = tuple(dictionaries)
+
+        for index, name in enumerate(self.names):
+            for pattern in dictionaries[name]:
+                first = len(pattern) if min_prefix is None else min_prefix
+                state = 0
+                for depth, char in enumerate(pattern, 1):
+                    following = goto[state].get(char)
+                    if following is None:
+                        following = len(goto)
+                        goto[state][char] = following
+                        goto.append({})
+                        outputs.append([])
+                    state = following
+                    if depth >= first and (depth, index) not in outputs[state]:
+                        outputs[state].append((depth, index))
+
+        # Обход в ширину: суффиксные ссылки и таблица переходов
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        order = []
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for char, following in goto[state].items():
+                link = fail[state]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                candidate = goto[link].get(char, 0)
+                fail[following] = candidate if candidate != following else 0
+                inherited = outputs[fail[following]]
+                if inherited:
+                    own = outputs[following]
+                    own.extend(output for output in inherited if output not in own)
+                queue.append(following)
+
+        if dense is None:
+            dense = len(goto) <= MAX_DENSE_STATES
+        if dense:
+            transitions: List[Dict[str, int]] = [dict(goto[0])]
+            transitions.extend({} for _ in range(len(goto) - 1))
+            for state in order:
+                table = dict(transitions[fail[state]])
+                table.update(goto[state])
+                transitions[state] = table
+        else:
+            rows = [_SparseRow(edges) for edges in goto]
+            rows[0].fail = None
+            for state in order:
+                rows[state].fail = rows[fail[state]]
+            transitions = rows
+
+        self.transitions = transitions
+        self.outputs = [tuple(output) for output in outputs]
+
+    def full_row(self, state: int) -> Dict[str, int]:
+        """Все переходы из состояния, ведущие не в начальное состояние."""
+        row = self.transitions[state]
+        if not isinstance(row, _SparseRow):
+            return row
+        chain = []
+        while row is not None:
+            chain.append(row)
+            row = row.fail
+        table: Dict[str, int] = {}
+        for row in reversed(chain):
+            table.update(row)
+        return table
+
+    def contains(self, text: str) -> bool:
+        """Проверяет, содержит ли текст хотя бы одну последовательность."""
+        transitions = self.transitions
+        outputs = self.outputs
+        state = 0
+        for char in text:
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                return True
+        return False
+
+    def find_all(self, text: str) -> List[SequenceMatch]:
+        """Возвращает все вхождения последовательностей в текст."""
+        transitions = self.transitions
+        outputs = self.outputs
+        names = self.names
+        matches = []
+        state = 0
+        for position, char in enumerate(text):
+            state = transitions[state].get(char, 0)
+            for length, index in outputs[state]:
+                matches.append(SequenceMatch(position - length + 1, length,
+                                             names[index]))
+        matches.sort()
+        return matches
+
+
+_default_matcher: Optional[SequenceMatcher] = None
+
+
+def build_matcher(names: Iterable[str] = DEFAULT_DICTIONARIES,
+                  extra: Optional[Dict[str, Iterable[str]]] = None) -> SequenceMatcher:
+    """
+    Строит автомат по встроенным словарям names и дополнительным обходам.
+
+    extra сопоставляет имени словаря набор обходов в нижнем регистре;
+    их суммарная длина не должна превышать MAX_EXTRA_CHARS.
+    """
+    dictionaries = {name: walk_suffixes(DICTIONARIES[name]) for name in names}
+    total = 0
+    for name, walks in (extra or {}).items():
+        walks = [walk.lower() for walk in walks]
+        total += sum(len(walk) for walk in walks)
+        if total > MAX_EXTRA_CHARS:
+            raise ValueError(f"Суммарная длина дополнительных обходов не должна "
+                             f"превышать {MAX_EXTRA_CHARS} символов")
+        dictionaries[name] = walk_suffixes(walks)
+    return SequenceMatcher(dictionaries, min_prefix=MIN_SEQUENCE_LENGTH)
+
+
+def get_default_matcher() -> SequenceMatcher:
+    """Возвращает автомат по словарям по умолчанию (строится один раз)."""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = build_matcher()
+    return _default_matcher
+
+
+def set_default_matcher(matcher: Optional[SequenceMatcher]) -> None:
+    """Заменяет автомат, используемый проверками (None - встроенный)."""
+    global _default_matcher
+    _default_matcher = matcher
+
+
+def find_sequences(password: str) -> List[SequenceMatch]:
+    """Находит все простые последовательности в пароле (без учета регистра)."""
+    return get_default_matcher().find_all(password.lower())
@@ -0,0 +1,456 @@
+"""
+Модуль оценки стойкости пароля по числу попыток подбора.
+
+Оценка строится в стиле zxcvbn: пароль раскладывается на фрагменты
+(словарные слова, последовательности, повторы и случайные участки),
+для каждого фрагмента оценивается число попыток подбора, а минимальное
+покрытие пароля фрагментами находится динамическим программированием.
+Результаты запоминаются в LRU-кэше ограниченного размера.
+"""
+
+import bisect
+import math
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from analyzer.SequenceMatcher import find_sequences
+
+# Пароли длиннее этого значения оцениваются по префиксу: в остаток
+# продолжается только последний повтор, а прочее дает лишь log10 своей
+# длины (вставленный длинный текст не считается случайным)
+MAX_ANALYZED_LENGTH = 256
+
+# Наибольшее число фрагментов разложения: разложения из большего числа
+# фрагментов проигрывают из-за множителя k! и не рассматриваются, что
+# ограничивает динамическое программирование
+MAX_COVER_SEGMENTS = 12
+
+# Случайный участок начинается в начале пароля или в конце одного из
+# стольких ближайших найденных фрагментов: участки, поглощающие много
+# найденных фрагментов, не бывают выгодными, а перебор всех пар
+# начало-конец квадратичен по числу фрагментов
+MAX_BRUTEFORCE_STARTS = 8
+
+# Размер кэша оценок
+CACHE_SIZE = 4096
+
+# Минимальное число попыток для фрагмента из одного и нескольких символов
+MIN_GUESSES_SINGLE = 10
+MIN_GUESSES_MULTI = 50
+
+# Самые распространенные пароли в порядке частоты (ранг = позиция + 1)
+COMMON_PASSWORD_RANKS: Tuple[str, ...] = (
+    "123456", "password", "12345678", "qwerty", "123456789", "12345",
+    "1234", "111111", "1234567", "dragon", "123123", "baseball", "abc123",
+    "football", "monkey", "letmein", "696969", "shadow", "master", "666666",
+    "qwertyuiop", "123321", "mustang", "1234567890", "michael", "654321",
+    "superman", "1qaz2wsx", "7777777", "121212", "000000", "qazwsx",
+    "123qwe", "killer", "trustno1", "jordan", "jennifer", "zxcvbnm",
+    "asdfgh", "hunter", "buster", "soccer", "harley", "batman", "andrew",
+    "tigger", "sunshine", "iloveyou", "2000", "charlie", "robert", "thomas",
+    "hockey", "ranger", "daniel", "starwars", "klaster", "112233",
+    "george", "computer", "michelle", "jessica", "pepper", "1111",
+    "zxcvbn", "555555", "11111111", "131313", "freedom", "777777", "pass",
+    "maggie", "159753", "aaaaaa", "ginger", "princess", "joshua", "cheese",
+    "amanda", "summer", "love", "ashley", "nicole", "chelsea", "biteme",
+    "matthew", "access", "yankees", "987654321", "dallas", "austin",
+    "thunder", "taylor", "matrix", "admin", "welcome", "password1",
+    "qwerty123", "1q2w3e4r", "login", "passw0rd", "solo",
+    "abc", "secret", "hello", "whatever", "qazwsxedc", "zaq12wsx",
+)
+
+# Распространенные слова (в порядке частоты)
+COMMON_WORD_RANKS: Tuple[str, ...] = (
+    "love", "password", "admin", "user", "test", "guest", "root", "qwerty",
+    "dragon", "monkey", "master", "shadow", "sunshine", "princess",
+    "football", "baseball", "welcome", "login", "secret", "summer",
+    "winter", "spring", "autumn", "flower", "hello", "world", "money",
+    "freedom", "angel", "star", "super", "magic", "tiger", "lucky",
+    "parol", "privet", "lubov", "solnce", "zvezda", "kotik", "marina",
+    "natasha", "sasha", "dima", "masha", "olga", "anna", "elena",
+    "пароль", "привет", "любовь", "солнце", "звезда", "котик", "наташа",
+    "саша", "маша", "дима", "ольга", "анна", "елена", "марина", "россия",
+)
+
+# Базовое число вариантов для последовательностей каждого словаря
+SEQUENCE_BASE_GUESSES: Dict[str, int] = {
+    "digits": 10,
+    "latin": 26,
+    "cyrillic": 33,
+    "qwerty": 47,
+    "qwerty_diagonals": 47,
+    "jcuken": 33,
+}
+
+# Пороговые значения log10(попыток) для оценок 1..4
+SCORE_THRESHOLDS = (3, 6, 8, 10)
+
+# Уровни безопасности по баллу оценки
+SCORE_LEVELS = ("Слабый", "Слабый", "Средний", "Хороший", "Отличный")
+
+_rank_tables: Dict[str, Dict[str, int]] = {}
+_max_word_length = 0
+
+
+class Segment:
+    """Фрагмент разложения пароля."""
+
+    __slots__ = ("kind", "start", "end", "token", "guesses")
+
+    def __init__(self, kind: str, start: int, end: int, token: str,
+                 guesses: float) -> None:
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.token = token
+        self.guesses = guesses
+
+    def __repr__(self) -> str:
+        return (f"Segment({self.kind!r}, {self.start}, {self.end}, "
+                f"guesses={self.guesses:.3g})")
+
+
+class StrengthEstimate:
+    """Результат оценки: число попыток, энтропия, балл 0-4 и разложение."""
+
+    __slots__ = ("guesses_log10", "segments")
+
+    def __init__(self, guesses_log10: float, segments: Tuple[Segment, ...]) -> None:
+        self.guesses_log10 = guesses_log10
+        self.segments = segments
+
+    @property
+    def guesses(self) -> float:
+        """Оценка числа попыток подбора."""
+        return 10 ** self.guesses_log10
+
+    @property
+    def entropy_bits(self) -> float:
+        """Оценка энтропии в битах (log2 числа попыток)."""
+        return self.guesses_log10 * math.log2(10)
+
+    @property
+    def score(self) -> int:
+        """Балл от 0 (очень слабый) до 4 (очень сильный)."""
+        return sum(self.guesses_log10 >= threshold for threshold in SCORE_THRESHOLDS)
+
+    def __repr__(self) -> str:
+        return (f"StrengthEstimate(score={self.score}, "
+                f"bits={self.entropy_bits:.1f}, segments={list(self.segments)})")
+
+
+def get_estimate_level(estimate: StrengthEstimate) -> str:
+    """Возвращает название уровня безопасности по оценке стойкости."""
+    return SCORE_LEVELS[estimate.score]
+
+
+def add_rank_table(name: str, words: Iterable[str]) -> None:
+    """
+    Добавляет словарь с рангами (слова в порядке убывания частоты).
+
+    Сбрасывает кэш оценок.
+    """
+    global _max_word_length
+    table: Dict[str, int] = {}
+    for rank, word in enumerate(words, 1):
+        word = word.strip().lower()
+        if word and word not in table:
+            table[word] = rank
+    _rank_tables[name] = table
+    _max_word_length = max((len(word) for table in _rank_tables.values()
+                            for word in table), default=0)
+    estimate_strength.cache_clear()
+
+
+def load_rank_table(name: str, path: str) -> None:
+    """Загружает словарь с рангами из файла (по одному слову в строке)."""
+    with open(path, encoding="utf-8", errors="replace") as stream:
+        add_rank_table(name, stream)
+
+
+def _uppercase_variations(token: str) -> float:
+    """Число вариантов регистра для словарного слова."""
+    upper = sum(1 for char in token if char.isupper())
+    lower = sum(1 for char in token if char.islower())
+    if upper == 0:
+        return 1
+    if lower == 0 or (upper == 1 and token[0].isupper()):
+        return 2
+    return sum(math.comb(upper + lower, i) for i in range(1, min(upper, lower) + 1))
+
+
+def _cardinality(token: str) -> int:
+    """Размер алфавита, из которого, предположительно, выбран фрагмент."""
+    size = 0
+    if any(char.islower() and char.isascii() for char in token):
+        size += 26
+    if any(char.isupper() and char.isascii() for char in token):
+        size += 26
+    if any(char.isdigit() for char in token):
+        size += 10
+    if any(not char.isalnum() and char.isascii() for char in token):
+        size += 33
+    if any(not char.isascii() for char in token):
+        size += 66
+    return size
+
+
+def _brute_force_log10(token: str, cardinality: int) -> float:
+    """
+    log10 числа попыток для случайного участка.
+
+    Алфавит берется по всему паролю, а не по участку: иначе дробление
+    случайной части на участки разных классов занижало бы оценку.
+    """
+    guesses_log10 = len(token) * math.log10(cardinality)
+    floor = MIN_GUESSES_SINGLE if len(token) == 1 else MIN_GUESSES_MULTI
+    return max(guesses_log10, math.log10(floor + 1))
+
+
+def _lowest_ends(length: int, repeats: List[Segment]) -> List[int]:
+    """
+    Для каждого начала - наименьший конец фрагмента, не лежащего целиком
+    внутри одного из повторов (повторы не перекрываются).
+    """
+    lowest = list(range(1, length + 1))
+    for repeat in repeats:
+        lowest[repeat.start] = repeat.end
+        for start in range(repeat.start + 1, repeat.end):
+            lowest[start] = repeat.end + 1
+    return lowest
+
+
+def _dictionary_matches(password: str, lowest_ends: List[int]) -> List[Segment]:
+    """
+    Находит словарные слова (в том числе записанные задом наперед).
+
+    Слова внутри повторов не ищутся: повтор всегда дешевле их разложения,
+    а иначе длинные повторы давали бы тысячи лишних фрагментов.
+    """
+    lower_pass = password.lower()
+    matches = []
+    length = len(password)
+    for start in range(length):
+        for end in range(lowest_ends[start], min(length, start + _max_word_length) + 1):
+            word = lower_pass[start:end]
+            reversed_word = word[::-1]
+            for table in _rank_tables.values():
+                rank = table.get(word)
+                reversed_rank = table.get(reversed_word) if end - start > 1 else None
+                if rank is None and reversed_rank is None:
+                    continue
+                token = password[start:end]
+                variations = _uppercase_variations(token)
+                if rank is not None:
+                    matches.append(Segment("dictionary", start, end, token,
+                                           rank * variations))
+                if reversed_rank is not None:
+                    matches.append(Segment("reversed", start, end, token,
+                                           reversed_rank * variations * 2))
+    return matches
+
+
+def _sequence_matches(password: str, lowest_ends: List[int]) -> List[Segment]:
+    """
+    Находит клавиатурные и алфавитные последовательности.
+
+    Оставляются только максимальные вхождения (не содержащиеся в другом
+    вхождении или в повторе), поэтому их число линейно по длине пароля.
+    """
+    matches = []
+    reach = 0
+    for match in sorted(find_sequences(password),
+                        key=lambda match: (match.start, -match.length)):
+        end = match.start + match.length
+        if end <= reach or end < lowest_ends[match.start]:
+            continue
+        reach = end
+        token = password[match.start:end]
+        base = SEQUENCE_BASE_GUESSES.get(match.dictionary, 26)
+        guesses = base * match.length * _uppercase_variations(token)
+        matches.append(Segment("sequence", match.start, end, token, guesses))
+    return matches
+
+
+_REPEAT_PATTERN = re.compile(r"(.+?)\1+", re.DOTALL)
+_GREEDY_REPEAT_PATTERN = re.compile(r"(.+)\1+", re.DOTALL)
+_REPEAT_UNIT_PATTERN = re.compile(r"(.+?)\1+\Z", re.DOTALL)
+
+
+def _repeat_matches(password: str) -> List[Segment]:
+    """
+    Находит повторы символа или блока ("aaaa", "abcabc").
+
+    Из кратчайшего и длиннейшего повторов с текущей позиции выбирается
+    более длинный ("aabaab", а не "aa"). Поиск
+    продолжается с конца найденного повтора, поэтому повторы не перекрываются.
+    """
+    matches = []
+    position = 0
+    while position < len(password):
+        found = _REPEAT_PATTERN.search(password, position)
+        if found is None:
+            break
+        greedy = _GREEDY_REPEAT_PATTERN.search(password, position)
+        if len(greedy.group(0)) > len(found.group(0)):
+            found = greedy
+            unit = _REPEAT_UNIT_PATTERN.match(greedy.group(0)).group(1)
+        else:
+            unit = found.group(1)
+        repeats = len(found.group(0)) // len(unit)
+        unit_guesses = (10 ** estimate_strength(unit).guesses_log10
+                        if len(unit) > 1 else _cardinality(unit))
+        matches.append(Segment("repeat", found.start(), found.end(),
+                               found.group(0), unit_guesses * repeats))
+        position = found.end()
+    return matches
+
+
+def _minimum_cover(password: str, matches: List[Segment]) -> StrengthEstimate:
+    """
+    Находит разложение пароля с минимальным числом попыток.
+
+    Общая оценка для разложения из k фрагментов: k! * произведение оценок
+    фрагментов (атакующий не знает порядок и состав фрагментов).
+    Промежутки между найденными фрагментами заполняются случайными участками.
+    """
+    length = len(password)
+    cardinality = _cardinality(password)
+    # Оценка случайного участка линейна по его длине, поэтому считается
+    # арифметически, а сам фрагмент создается только при восстановлении ответа
+    char_log10 = math.log10(cardinality)
+    floor_single = math.log10(MIN_GUESSES_SINGLE + 1)
+    floor_multi = math.log10(MIN_GUESSES_MULTI + 1)
+    by_end: Dict[int, List[Tuple[float, int, Optional[Segment]]]] = {}
+    for match in matches:
+        by_end.setdefault(match.end, []).append(
+            (math.log10(max(match.guesses, 1)), match.start, match))
+    # Два случайных участка подряд никогда не выгоднее одного, поэтому
+    # случайный участок начинается в начале пароля или после найденного
+    # фрагмента, а заканчивается в конце пароля или перед найденным фрагментом
+    starts = sorted({0, *(match.end for match in matches)})
+    ends = {length, *(match.start for match in matches)}
+
+    # best[i][k] = (log10 произведения, начало последнего фрагмента,
+    # фрагмент или None для случайного участка) для префикса длины i,
+    # покрытого k фрагментами
+    best: List[Dict[int, Tuple[float, int, Optional[Segment]]]] = [
+        dict() for _ in range(length + 1)]
+    best[0][0] = (0.0, 0, None)
+
+    for end in range(1, length + 1):
+        candidates = by_end.get(end, [])
+        if end in ends:
+            candidates = list(candidates)
+            nearest = bisect.bisect_left(starts, end)
+            for start in {0, *starts[max(0, nearest - MAX_BRUTEFORCE_STARTS):nearest]}:
+                size = end - start
+                floor = floor_single if size == 1 else floor_multi
+                candidates.append((max(size * char_log10, floor), start, None))
+        cell = best[end]
+        for cost, start, segment in candidates:
+            for count, (previous, _, _) in best[start].items():
+                if count >= MAX_COVER_SEGMENTS:
+                    continue
+                total = previous + cost
+                current = cell.get(count + 1)
+                if current is None or total < current[0]:
+                    cell[count + 1] = (total, start, segment)
+        # Разложение из большего числа фрагментов с не меньшим произведением
+        # никогда не выгоднее: такие варианты отбрасываются
+        lowest = math.inf
+        for count in sorted(cell):
+            if cell[count][0] < lowest:
+                lowest = cell[count][0]
+            else:
+                del cell[count]
+
+    final = best[length]
+    count, (product, _, _) = min(
+        final.items(),
+        key=lambda item: item[1][0] + math.log10(math.factorial(item[0]))
+    )
+    guesses_log10 = product + math.log10(math.factorial(count))
+
+    segments = []
+    position = length
+    while position > 0:
+        _, start, segment = best[position][count]
+        if segment is None:
+            token = password[start:position]
+            # Целое число: для длинных участков 10 ** log10 не помещается в float
+            floor = MIN_GUESSES_SINGLE if len(token) == 1 else MIN_GUESSES_MULTI
+            segment = Segment("bruteforce", start, position, token,
+                              max(cardinality ** len(token), floor + 1))
+        segments.append(segment)
+        position = start
+        count -= 1
+    segments.reverse()
+    return StrengthEstimate(guesses_log10, tuple(segments))
+
+
+def _add_tail(password: str, estimate: StrengthEstimate) -> StrengthEstimate:
+    """
+    Учитывает остаток пароля после первых MAX_ANALYZED_LENGTH символов.
+
+    Повтор, на котором обрывается разобранная часть, продолжается в остаток
+    (проверка линейна по длине). Оставшаяся часть не считается случайной:
+    она добавляет только число вариантов своей длины.
+    """
+    segments = list(estimate.segments)
+    guesses_log10 = estimate.guesses_log10
+    start = MAX_ANALYZED_LENGTH
+    repeat = next((segment for segment in reversed(segments)
+                   if segment.kind == "repeat"), None)
+    if repeat is not None:
+        period = len(_REPEAT_UNIT_PATTERN.match(repeat.token).group(1))
+        end = repeat.end
+        while password[end:end + period] == password[end - period:end]:
+            end += period
+        while end < len(password) and password[end] == password[end - period]:
+            end += 1
+        if end > start:
+            # Повтор поглощает фрагменты после себя, поэтому оценка
+            # пересчитывается по новому разложению
+            token = password[repeat.start:end]
+            repeats = len(token) // period
+            guesses = repeat.guesses * repeats / (len(repeat.token) // period)
+            del segments[segments.index(repeat):]
+            segments.append(Segment("repeat", repeat.start, end, token, guesses))
+            guesses_log10 = (sum(math.log10(max(segment.guesses, 1)) for segment in segments)
+                             + math.log10(math.factorial(len(segments))))
+            start = end
+
+    tail = password[start:]
+    if tail:
+        segments.append(Segment("tail", start, len(password), tail, len(tail)))
+        guesses_log10 += math.log10(len(tail) + 1)
+    return StrengthEstimate(guesses_log10, tuple(segments))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def estimate_strength(password: str) -> StrengthEstimate:
+    """
+    Оценивает стойкость пароля.
+
+    Результат кэшируется (LRU, не более CACHE_SIZE паролей); кэш можно
+    очистить вызовом estimate_strength.cache_clear().
+    """
+    if not password:
+        return StrengthEstimate(0.0, ())
+
+    head = password[:MAX_ANALYZED_LENGTH]
+    repeats = _repeat_matches(head)
+    lowest_ends = _lowest_ends(len(head), repeats)
+    matches = (_dictionary_matches(head, lowest_ends)
+               + _sequence_matches(head, lowest_ends) + repeats)
+    estimate = _minimum_cover(head, matches)
+
+    if len(password) > MAX_ANALYZED_LENGTH:
+        estimate = _add_tail(password, estimate)
+    return estimate
+
+
+add_rank_table("passwords", COMMON_PASSWORD_RANKS)
+add_rank_table("words", COMMON_WORD_RANKS)
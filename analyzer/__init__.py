@@ -0,0 +1,32 @@
+"""
+Пакет анализа надежности паролей.
+
+Функции модулей пакета доступны как атрибуты пакета и загружаются при
+первом обращении.
+"""
+
+import importlib
+
+# Атрибут пакета -> модуль, в котором он определен
+_EXPORTS = {
+    "analyze_password": "analyzer.PasswordAnalyzer",
+    "IncrementalAnalyzer": "analyzer.PasswordAnalyzer",
+    "SecurityChecks": "analyzer.PasswordAnalyzer",
+    "get_security_level": "analyzer.PasswordAnalyzer",
+    "has_common_sequences": "analyzer.PasswordAnalyzer",
+    "estimate_strength": "analyzer.StrengthEstimator",
+    "find_sequences": "analyzer.SequenceMatcher",
+    "compile_blocklist": "analyzer.Blocklist",
+    "set_blocklist": "analyzer.Blocklist",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,269 @@
+"""
+Набор микробенчмарков горячих путей генератора и проверки.
+
+Каждый бенчмарк регистрируется декоратором benchmark и представляет собой
+генератор подготовки, который выдает (функцию замера, число операций
+за один ее вызов), а после замера восстанавливает измененное глобальное
+состояние (подключенный индекс утекших паролей, бэкенд буфера обмена).
+Декоратор превращает его в контекстный менеджер. Подготовка (построение
+корпусов и индексов) в замер не входит.
+"""
+
+import atexit
+import os
+import random
+import shutil
+import string
+import tempfile
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from analyzer import Blocklist
+from analyzer.PasswordAnalyzer import analyze_password, has_common_sequences
+from analyzer.SequenceMatcher import build_matcher
+from analyzer.StrengthEstimator import estimate_strength
+from generator.PasswordGeneration import generate_password, generate_passwords
+from utils import Clipboard
+from utils.HashIndex import hash_key, write_bloom_filter, write_sorted_index
+
+Measured = Tuple[Callable[[], object], int]
+Setup = Callable[[], ContextManager[Measured]]
+
+BENCHMARKS: Dict[str, Setup] = {}
+
+# Зерно синтетических корпусов (корпуса не секретные)
+CORPUS_SEED = 20240101
+CORPUS_SIZE = 2000
+
+# Размеры словарей для проверок по индексу утекших паролей
+BLOCKLIST_SIZES = (1_000, 100_000, 1_000_000)
+
+# Пароли, на которых оценка стойкости делает больше всего работы:
+# длинные повторы, плотные словарные слова и последовательности
+ESTIMATE_WORST_CASE = (
+    "password" * 10, "qwerty" * 20, "1234567890" * 10, "a" * 64, "a" * 1000,
+    "x9$Kq!2mZr@7Lp#4" * 16,
+    "".join(f"{word}{index}" for index, word in enumerate(
+        ("password", "dragon", "monkey", "qwerty", "letmein", "sunshine") * 6)),
+    "abcdefghijklmnopqrstuvwxyz1qaz2wsx3edcqwertyuiopasdfghjkl" * 4 + "zyx",
+)
+
+# Абсолютные бюджеты (нс на операцию): Runner завершается с кодом 1 при
+# превышении, даже без базового файла для сравнения
+BUDGETS_NS: Dict[str, float] = {
+    # Холодная оценка этих паролей занимает в среднем около 2 мс
+    "check.estimate.worst-case": 20_000_000,
+}
+
+# Настройки генерации: (длина, цифры, спецсимволы)
+GENERATION_SETTINGS = (
+    (8, True, True), (12, True, True), (32, True, True),
+    (12, True, False), (12, False, True),
+)
+
+
+def benchmark(name: str) -> Callable[[Callable[[], Iterator[Measured]]], Setup]:
+    """Регистрирует генератор подготовки под именем name."""
+    def register(setup: Callable[[], Iterator[Measured]]) -> Setup:
+        BENCHMARKS[name] = contextmanager(setup)
+        return BENCHMARKS[name]
+    return register
+
+
+@contextmanager
+def _blocklist(path: Optional[str]) -> Iterator[None]:
+    """Подключает индекс утекших паролей и затем восстанавливает прежний."""
+    loaded = Blocklist._blocklist_loaded
+    previous = Blocklist._blocklist
+    previous_path = previous.path if previous is not None else None
+    Blocklist.set_blocklist(path)
+    try:
+        yield
+    finally:
+        Blocklist.set_blocklist(previous_path)
+        Blocklist._blocklist_loaded = loaded
+
+
+def synthetic_corpus(size: int = CORPUS_SIZE, seed: int = CORPUS_SEED) -> List[str]:
+    """
+    Строит воспроизводимый корпус паролей: смесь случайных строк,
+    словарных слов с цифрами, клавиатурных обходов и повторов.
+    """
+    rng = random.Random(seed)
+    words = ("password", "qwerty", "dragon", "monkey", "admin", "пароль",
+             "sunshine", "welcome", "football", "letmein")
+    walks = ("qwerty", "asdfgh", "123456", "1qaz2wsx", "йцукен", "zxcvbn")
+    alphabet = string.ascii_letters + string.digits + string.punctuation
+    corpus = []
+    for index in range(size):
+        kind = index % 4
+        if kind == 0:
+            corpus.append("".join(rng.choice(alphabet)
+                                  for _ in range(rng.randint(8, 20))))
+        elif kind == 1:
+            word = rng.choice(words)
+            corpus.append(word.capitalize() + str(rng.randint(0, 9999)))
+        elif kind == 2:
+            corpus.append(rng.choice(walks) + rng.choice(string.punctuation))
+        else:
+            corpus.append(rng.choice(string.ascii_letters) * rng.randint(3, 12)
+                          + str(rng.randint(0, 99)))
+    return corpus
+
+
+def _register_generation() -> None:
+    for length, digits, special in GENERATION_SETTINGS:
+        suffix = f"len{length}" + ("-digits" if digits else "") + \
+            ("-special" if special else "")
+
+        def single(length=length, digits=digits, special=special):
+            def run():
+                for _ in range(1000):
+                    generate_password(length, digits, special)
+            yield run, 1000
+
+        def bulk(length=length, digits=digits, special=special):
+            yield (lambda: generate_passwords(100_000, length, digits, special),
+                   100_000)
+
+        benchmark(f"generate.single.{suffix}")(single)
+        benchmark(f"generate.bulk.{suffix}")(bulk)
+
+
+_register_generation()
+
+
+@benchmark("check.analyze")
+def _check_analyze():
+    corpus = synthetic_corpus()
+
+    def run():
+        for password in corpus:
+            analyze_password(password)
+    with _blocklist(None):
+        yield run, len(corpus)
+
+
+@benchmark("check.sequences")
+def _check_sequences():
+    corpus = synthetic_corpus()
+
+    def run():
+        for password in corpus:
+            has_common_sequences(password)
+    with _blocklist(None):
+        yield run, len(corpus)
+
+
+@benchmark("check.sequences.1000-extra-walks")
+def _check_sequences_large():
+    rng = random.Random(CORPUS_SEED)
+    walks = ["".join(rng.choice(string.ascii_lowercase) for _ in range(8))
+             for _ in range(1000)]
+    matcher = build_matcher(extra={"extra": walks})
+    corpus = [password.lower() for password in synthetic_corpus()]
+
+    def run():
+        for password in corpus:
+            matcher.contains(password)
+    yield run, len(corpus)
+
+
+@benchmark("check.estimate")
+def _check_estimate():
+    corpus = synthetic_corpus()
+
+    def run():
+        # Кэш сбрасывается, чтобы замерять саму оценку, а не LRU
+        estimate_strength.cache_clear()
+        for password in corpus:
+            estimate_strength(password)
+    with _blocklist(None):
+        yield run, len(corpus)
+
+
+@benchmark("check.estimate.worst-case")
+def _check_estimate_worst_case():
+    def run():
+        estimate_strength.cache_clear()
+        for password in ESTIMATE_WORST_CASE:
+            estimate_strength(password)
+    with _blocklist(None):
+        yield run, len(ESTIMATE_WORST_CASE)
+
+
+_index_directory = None
+
+
+def _index_path(name: str) -> str:
+    """Путь к индексу во временном каталоге (удаляется при выходе)."""
+    global _index_directory
+    if _index_directory is None:
+        _index_directory = tempfile.mkdtemp(prefix="passgen-bench-")
+        atexit.register(shutil.rmtree, _index_directory, True)
+    return os.path.join(_index_directory, name)
+
+
+def _register_blocklists() -> None:
+    for size in BLOCKLIST_SIZES:
+        for index_format in ("sorted", "bloom"):
+            def setup(size=size, index_format=index_format):
+                path = _index_path(f"{index_format}-{size}.idx")
+                if not os.path.exists(path):
+                    digests = (hash_key(f"leaked-{i}") for i in range(size))
+                    if index_format == "sorted":
+                        write_sorted_index(path, digests)
+                    else:
+                        write_bloom_filter(path, digests, size)
+                corpus = synthetic_corpus()
+                corpus += [f"leaked-{i}" for i in range(0, size, max(1, size // 500))]
+
+                def run():
+                    for password in corpus:
+                        analyze_password(password)
+                with _blocklist(path):
+                    yield run, len(corpus)
+
+            benchmark(f"check.common.{index_format}.{size}")(setup)
+
+
+_register_blocklists()
+
+
+class _MemoryTkRoot:
+    """Заглушка корня Tk с буфером обмена в памяти (для запуска без дисплея)."""
+
+    def __init__(self) -> None:
+        self.value = ""
+
+    def clipboard_clear(self) -> None:
+        self.value = ""
+
+    def clipboard_append(self, text: str) -> None:
+        self.value += text
+
+    def clipboard_get(self) -> str:
+        return self.value
+
+    def after(self, delay: int, callback: Callable[[], None]) -> None:
+        pass
+
+
+@benchmark("clipboard.copy.tk")
+def _clipboard_copy():
+    passwords = generate_passwords(1000)
+
+    def run():
+        for password in passwords:
+            Clipboard.copy_to_clipboard(password)
+
+    # Бэкенд подменяется напрямую: use_tk_root закрыл бы прежний
+    # вспомогательный процесс, и его нельзя было бы вернуть
+    with Clipboard._backend_lock:
+        backend, last_digest = Clipboard._backend, Clipboard._last_digest
+        Clipboard._backend = Clipboard.TkClipboard(_MemoryTkRoot())
+    try:
+        yield run, len(passwords)
+    finally:
+        with Clipboard._backend_lock:
+            Clipboard._backend, Clipboard._last_digest = backend, last_digest
@@ -0,0 +1,122 @@
+"""
+Проверка бюджета времени импорта.
+
+Запускает интерпретатор с ключом -X importtime для каждого сценария,
+суммирует время импорта модулей верхнего уровня (без модулей, которые
+загружаются при старте любого интерпретатора) и сравнивает результат
+с бюджетом. Дополнительно проверяет, что в сценариях не загружаются лишние модули
+(например, tkinter и pyperclip в консольном режиме).
+
+Запуск из корня репозитория:
+
+    python bench/ImportBudget.py [--repeat 5] [--scale 1.0]
+
+Код завершения 1, если хотя бы один сценарий превысил бюджет.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Scenario(NamedTuple):
+    """Сценарий проверки: аргументы интерпретатора и бюджет в мс."""
+
+    name: str
+    args: Tuple[str, ...]
+    budget_ms: float
+    forbidden: Tuple[str, ...] = ("tkinter", "pyperclip")
+
+
+SCENARIOS: Tuple[Scenario, ...] = (
+    Scenario("import generator", ("-c", "import generator"), 5),
+    Scenario("import analyzer", ("-c", "import analyzer"), 5),
+    Scenario("generator.PasswordGeneration",
+             ("-c", "import generator.PasswordGeneration"), 30),
+    Scenario("Main.py generate", ("Main.py", "generate", "--count", "1"), 60),
+    # Окно проверки, анализатор и буфер обмена загружаются при первом
+    # использовании, а не вместе с главным окном
+    Scenario("gui.MainWindow", ("-c", "import gui.MainWindow"), 100,
+             forbidden=("gui.CheckWindow", "analyzer.PasswordAnalyzer",
+                        "utils.Clipboard", "pyperclip")),
+)
+
+
+def _startup_modules() -> Set[str]:
+    """Модули, загружаемые при старте пустого интерпретатора."""
+    return set(_measure(("-c", "pass"))[1])
+
+
+def _measure(args: Tuple[str, ...]) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Запускает сценарий и возвращает накопленное время импорта (мкс)
+    модулей верхнего уровня и всех загруженных модулей.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True
+    )
+    top_level: Dict[str, int] = {}
+    modules: Dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        # Вложенные импорты выводятся с отступом после "| "
+        modules[name.strip()] = int(cumulative)
+        if not name[1:].startswith(" "):
+            top_level[name.strip()] = int(cumulative)
+    return top_level, modules
+
+
+def check(scenarios: Tuple[Scenario, ...], repeat: int, scale: float) -> List[str]:
+    """Проверяет сценарии и возвращает список нарушений."""
+    startup = _startup_modules()
+    failures = []
+    for scenario in scenarios:
+        timings = []
+        loaded: Set[str] = set()
+        for _ in range(repeat):
+            top_level, modules = _measure(scenario.args)
+            loaded = set(modules)
+            timings.append(sum(
+                time for name, time in top_level.items() if name not in startup
+            ) / 1000)
+        best = min(timings)
+        budget = scenario.budget_ms * scale
+        status = "OK" if best <= budget else "ПРЕВЫШЕН"
+        print(f"{scenario.name:<32} {best:8.1f} мс (бюджет {budget:.0f} мс) {status}")
+        if best > budget:
+            failures.append(f"{scenario.name}: {best:.1f} мс > {budget:.0f} мс")
+        for module in scenario.forbidden:
+            if module in loaded:
+                failures.append(f"{scenario.name}: загружен {module}")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Проверка бюджета времени импорта")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Число запусков каждого сценария (берется минимум)")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Множитель бюджетов (для медленных машин)")
+    args = parser.parse_args()
+
+    failures = check(SCENARIOS, args.repeat, args.scale)
+    for failure in failures:
+        print(f"Ошибка: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Запуск бенчмарков и проверка регрессий.
+
+Запуск из корня репозитория:
+
+    python bench/Runner.py [--filter generate] [--save baseline.json]
+                           [--compare baseline.json --threshold 0.25]
+
+Результаты (наносекунды на операцию) печатаются и при необходимости
+сохраняются в JSON. При сравнении с базовым файлом код завершения 1,
+если хотя бы один бенчмарк стал медленнее более чем на threshold.
+Код завершения 1 и при превышении абсолютного бюджета из BUDGETS_NS
+(бюджеты умножаются на --budget-scale для медленных машин).
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from bench.Benchmarks import BENCHMARKS, BUDGETS_NS  # noqa: E402
+
+
+def measure(name: str, repeat: int, min_time: float) -> float:
+    """
+    Выполняет бенчмарк и возвращает лучшее время на операцию в нс.
+
+    Каждый повтор вызывает функцию замера, пока не наберется min_time
+    секунд; из повторов берется минимум.
+    """
+    best = float("inf")
+    with BENCHMARKS[name]() as (run, operations):
+        run()  # прогрев
+        for _ in range(repeat):
+            calls = 0
+            started = time.perf_counter_ns()
+            while True:
+                run()
+                calls += 1
+                elapsed = time.perf_counter_ns() - started
+                if elapsed >= min_time * 1e9:
+                    break
+            best = min(best, elapsed / (calls * operations))
+    return best
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            threshold: float) -> int:
+    """Сравнивает результаты с базовыми и возвращает число регрессий."""
+    regressions = 0
+    for name, value in sorted(results.items()):
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        change = value / reference - 1
+        if change > threshold:
+            regressions += 1
+            print(f"РЕГРЕССИЯ {name}: {reference:,.0f} -> {value:,.0f} нс "
+                  f"(+{change:.0%})", file=sys.stderr)
+    return regressions
+
+
+def check_budgets(results: Dict[str, float], scale: float) -> int:
+    """Сравнивает результаты с абсолютными бюджетами, возвращает число превышений."""
+    exceeded = 0
+    for name, value in sorted(results.items()):
+        budget = BUDGETS_NS.get(name)
+        if budget is not None and value > budget * scale:
+            exceeded += 1
+            print(f"БЮДЖЕТ {name}: {value:,.0f} нс > {budget * scale:,.0f} нс",
+                  file=sys.stderr)
+    return exceeded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки генератора паролей")
+    parser.add_argument("--filter", default="",
+                        help="Запускать только бенчмарки, содержащие строку")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Число повторов замера")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="Минимальная длительность одного повтора, с")
+    parser.add_argument("--save", default=None,
+                        help="Сохранить результаты в JSON")
+    parser.add_argument("--compare", default=None,
+                        help="Базовый JSON для проверки регрессий")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Допустимое замедление (0.25 = 25%%)")
+    parser.add_argument("--budget-scale", type=float, default=1.0,
+                        help="Множитель абсолютных бюджетов")
+    args = parser.parse_args()
+
+    results: Dict[str, float] = {}
+    for name in BENCHMARKS:
+        if args.filter not in name:
+            continue
+        results[name] = measure(name, args.repeat, args.min_time)
+        print(f"{name:<45} {results[name]:>14,.0f} нс/оп")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as stream:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results
+            }, stream, indent=2)
+
+    failed = check_budgets(results, args.budget_scale) > 0
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as stream:
+            baseline = json.load(stream)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"Регрессий: {regressions}", file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Команда audit: потоковая проверка файла паролей.
+"""
+
+import argparse
+import sys
+import time
+
+from cli.Output import open_sink, report_throughput
+from utils.Constants import OUTPUT_FORMATS
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Регистрирует команду audit."""
+    parser = subparsers.add_parser("audit", help="Проверить файл паролей")
+    parser.add_argument("source", help="Файл паролей (по одному в строке)")
+    parser.add_argument("--out", default=None,
+                        help="Файл результатов (по умолчанию stdout)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="csv",
+                        help="Формат результатов")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Число процессов (0 - по числу ядер)")
+    parser.add_argument("--blocklist", default=None,
+                        help="Индекс утекших паролей (compile-blocklist)")
+    parser.add_argument("--with-password", action="store_true",
+                        help="Включать пароль в результаты")
+    parser.add_argument("--estimate", action="store_true",
+                        help="Добавить оценку стойкости (балл, уровень и энтропию)")
+    parser.add_argument("--summary", default=None,
+                        help="Файл для гистограммы уровней по проверкам (JSON)")
+    parser.set_defaults(handler=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Выполняет команду audit."""
+    import json
+
+    from analyzer.BatchAudit import audit_stream
+
+    if args.workers < 0:
+        raise ValueError("Число процессов не может быть отрицательным")
+
+    started = time.perf_counter()
+    with open(args.source, "rb", buffering=1024 * 1024) as source, \
+            open_sink(args.out) as sink:
+        histogram = audit_stream(
+            source,
+            sink,
+            output_format=args.format,
+            workers=args.workers or None,
+            blocklist=args.blocklist,
+            with_password=args.with_password,
+            with_estimate=args.estimate
+        )
+
+    total = sum(histogram.values())
+    print("Уровни по проверкам:", file=sys.stderr)
+    for level in ("Отличный", "Хороший", "Средний", "Слабый"):
+        count = histogram.get(level, 0)
+        share = count / total * 100 if total else 0.0
+        print(f"{level:>10}: {count} ({share:.1f}%)", file=sys.stderr)
+
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as stream:
+            json.dump({"total": total, "checks_levels": histogram}, stream,
+                      ensure_ascii=False, indent=2)
+
+    report_throughput("Проверено паролей", total, started)
+    return 0
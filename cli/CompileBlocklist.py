@@ -0,0 +1,47 @@
+"""
+Команда compile-blocklist: компиляция корпуса утекших паролей в индекс.
+"""
+
+import argparse
+import time
+
+from cli.Output import report_throughput
+from utils.Constants import (
+    CORPUS_FORMATS, DEFAULT_ERROR_RATE, DEFAULT_WIDTH, INDEX_FORMATS
+)
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Регистрирует команду compile-blocklist."""
+    parser = subparsers.add_parser(
+        "compile-blocklist",
+        help="Скомпилировать список утекших паролей в индекс"
+    )
+    parser.add_argument("source", help="Файл корпуса (по одной записи в строке)")
+    parser.add_argument("target", help="Файл индекса")
+    parser.add_argument("--input-format", choices=CORPUS_FORMATS, default="plain",
+                        help="Формат корпуса: пароли или SHA-1")
+    parser.add_argument("--format", choices=INDEX_FORMATS, default="sorted",
+                        help="Формат индекса")
+    parser.add_argument("--width", type=int, default=DEFAULT_WIDTH,
+                        help="Ширина записи отсортированного индекса, байт")
+    parser.add_argument("--error-rate", type=float, default=DEFAULT_ERROR_RATE,
+                        help="Доля ложных срабатываний фильтра Блума")
+    parser.set_defaults(handler=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Выполняет команду compile-blocklist."""
+    from analyzer.Blocklist import compile_blocklist
+
+    started = time.perf_counter()
+    count = compile_blocklist(
+        args.source,
+        args.target,
+        input_format=args.input_format,
+        index_format=args.format,
+        width=args.width,
+        error_rate=args.error_rate
+    )
+    report_throughput("Записей в индексе", count, started)
+    return 0
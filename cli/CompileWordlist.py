@@ -0,0 +1,30 @@
+"""
+Команда compile-wordlist: компиляция словаря для парольных фраз.
+"""
+
+import argparse
+import time
+
+from cli.Output import report_throughput
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Регистрирует команду compile-wordlist."""
+    parser = subparsers.add_parser(
+        "compile-wordlist",
+        help="Скомпилировать словарь для парольных фраз"
+    )
+    parser.add_argument("source",
+                        help="Текстовый словарь (слово в строке или формат EFF)")
+    parser.add_argument("target", help="Файл скомпилированного словаря")
+    parser.set_defaults(handler=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Выполняет команду compile-wordlist."""
+    from generator.Passphrase import compile_wordlist
+
+    started = time.perf_counter()
+    count = compile_wordlist(args.source, args.target)
+    report_throughput("Слов в словаре", count, started)
+    return 0
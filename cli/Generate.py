@@ -0,0 +1,162 @@
+"""
+Команда generate: потоковая генерация паролей без графического интерфейса.
+"""
+
+import argparse
+import time
+
+from cli.Output import open_sink, report_throughput
+
+# Количество паролей, генерируемых и записываемых за одну итерацию
+CHUNK_SIZE = 8192
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Регистрирует команду generate."""
+    parser = subparsers.add_parser("generate", help="Сгенерировать пароли")
+    parser.add_argument("--count", type=int, default=1,
+                        help="Количество паролей")
+    parser.add_argument("--length", type=int, default=12,
+                        help="Длина пароля")
+    # Минимум символов исключенного класса невыполним: argparse отклоняет
+    # такие сочетания сам
+    digits = parser.add_mutually_exclusive_group()
+    digits.add_argument("--no-digits", action="store_true",
+                        help="Не использовать цифры")
+    digits.add_argument("--min-digits", type=int, default=None,
+                        help="Минимум цифр (политика)")
+    special = parser.add_mutually_exclusive_group()
+    special.add_argument("--no-special", action="store_true",
+                         help="Не использовать спецсимволы")
+    special.add_argument("--min-special", type=int, default=None,
+                         help="Минимум спецсимволов (политика)")
+    parser.add_argument("--out", default=None,
+                        help="Файл для записи (по умолчанию stdout)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Число процессов (0 - по числу ядер)")
+
+    unique = parser.add_argument_group(
+        "уникальность",
+        "Пароли проверяются по индексу выданных паролей (utils.IssuedIndex) "
+        "и никогда не повторяются, в том числе между запусками"
+    )
+    unique.add_argument("--unique-index", default=None, metavar="DIR",
+                        help="Каталог индекса выданных паролей")
+    unique.add_argument("--index-capacity", type=int, default=None, metavar="N",
+                        help="Расчетный размер нового индекса (по умолчанию 10M)")
+
+    policy = parser.add_argument_group(
+        "политика",
+        "При указании любого из параметров (а также --min-digits и "
+        "--min-special) пароли генерируются по политике "
+        "(generator.PasswordPolicy) и гарантированно ей соответствуют"
+    )
+    policy.add_argument("--min-lowercase", type=int, default=None,
+                        help="Минимум строчных букв")
+    policy.add_argument("--min-uppercase", type=int, default=None,
+                        help="Минимум заглавных букв")
+    policy.add_argument("--exclude-ambiguous", action="store_true",
+                        help="Исключить похожие символы (Il1|O0o...)")
+    policy.add_argument("--max-repeat", type=int, default=None,
+                        help="Максимальная длина серии одинаковых символов")
+    policy.add_argument("--no-sequences", action="store_true",
+                        help="Запретить клавиатурные и алфавитные последовательности")
+    parser.set_defaults(handler=run)
+
+
+def build_policy(args: argparse.Namespace):
+    """Возвращает политику по аргументам или None, если она не задана."""
+    minimums = (args.min_lowercase, args.min_uppercase,
+                args.min_digits, args.min_special)
+    if (all(value is None for value in minimums) and not args.exclude_ambiguous
+            and args.max_repeat is None and not args.no_sequences):
+        return None
+
+    from generator.PasswordPolicy import get_policy
+
+    return get_policy(
+        length=args.length,
+        use_digits=not args.no_digits,
+        use_special_chars=not args.no_special,
+        min_lowercase=1 if args.min_lowercase is None else args.min_lowercase,
+        min_uppercase=1 if args.min_uppercase is None else args.min_uppercase,
+        min_digits=1 if args.min_digits is None else args.min_digits,
+        min_special=1 if args.min_special is None else args.min_special,
+        exclude_ambiguous=args.exclude_ambiguous,
+        max_repeat=args.max_repeat,
+        no_sequences=args.no_sequences
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Выполняет команду generate.
+
+    Пароли генерируются пакетами по CHUNK_SIZE и сразу записываются
+    в приемник, поэтому расход памяти не зависит от --count. При
+    --workers больше 1 пакеты генерируются в пуле процессов. Параметры
+    политики переключают генерацию на generator.PasswordPolicy,
+    --unique-index включает проверку по индексу выданных паролей.
+    """
+    from generator.PasswordGeneration import _validate, generate_lines
+
+    if args.count < 0:
+        raise ValueError("Количество паролей не может быть отрицательным")
+    if args.workers < 0:
+        raise ValueError("Число процессов не может быть отрицательным")
+
+    use_digits = not args.no_digits
+    use_special_chars = not args.no_special
+    started = time.perf_counter()
+
+    policy = build_policy(args)
+    if policy is None:
+        # Параметры проверяются и при --count 0
+        _validate(args.length, use_digits, use_special_chars)
+
+    if args.unique_index is not None:
+        return run_unique(args, policy, started)
+
+    with open_sink(args.out) as sink:
+        if policy is not None:
+            from generator.ParallelGeneration import iter_policy_lines
+
+            for block in iter_policy_lines(policy, args.count,
+                                           workers=args.workers or None):
+                sink.write(block)
+        elif args.workers != 1:
+            from generator.ParallelGeneration import write_parallel
+
+            write_parallel(sink, args.count, args.length, use_digits,
+                           use_special_chars, workers=args.workers or None)
+        else:
+            remaining = args.count
+            while remaining > 0:
+                batch = min(CHUNK_SIZE, remaining)
+                sink.write(generate_lines(batch, args.length, use_digits,
+                                          use_special_chars))
+                remaining -= batch
+
+    report_throughput("Сгенерировано паролей", args.count, started)
+    return 0
+
+
+def run_unique(args: argparse.Namespace, policy, started: float) -> int:
+    """Генерирует пароли, которые не выдавались ранее."""
+    from generator.UniqueGeneration import iter_unique_lines
+    from utils.IssuedIndex import DEFAULT_CAPACITY, IssuedIndex
+
+    capacity = args.index_capacity or DEFAULT_CAPACITY
+    if capacity < 1:
+        raise ValueError("Размер индекса должен быть положительным")
+
+    with IssuedIndex(args.unique_index, capacity=capacity) as index:
+        with open_sink(args.out) as sink:
+            for block in iter_unique_lines(index, args.count, args.length,
+                                           not args.no_digits, not args.no_special,
+                                           policy=policy,
+                                           workers=args.workers or None):
+                sink.write(block)
+
+    report_throughput("Сгенерировано уникальных паролей", args.count, started)
+    return 0
@@ -0,0 +1,121 @@
+"""
+Команда hash: медленное хеширование паролей для выгрузки учетных записей.
+"""
+
+import argparse
+import sys
+import time
+
+from cli.Output import open_sink, report_throughput
+from utils.Constants import HASH_ALGORITHMS, OUTPUT_FORMATS
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Регистрирует команду hash."""
+    parser = subparsers.add_parser(
+        "hash",
+        help="Сгенерировать или прочитать пароли и вычислить их хеши (PBKDF2/scrypt)"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--source", default=None,
+                        help="Файл паролей (по одному в строке, \"-\" - stdin)")
+    source.add_argument("--count", type=int, default=None,
+                        help="Сгенерировать указанное количество паролей")
+    parser.add_argument("--ids", action="store_true",
+                        help="Строки файла имеют вид \"id<TAB>пароль\"")
+    parser.add_argument("--first-id", type=int, default=1,
+                        help="Первый номер записи при генерации")
+    parser.add_argument("--length", type=int, default=12,
+                        help="Длина генерируемого пароля")
+    parser.add_argument("--no-digits", action="store_true",
+                        help="Не использовать цифры")
+    parser.add_argument("--no-special", action="store_true",
+                        help="Не использовать спецсимволы")
+
+    cost = parser.add_argument_group("параметры хеширования")
+    cost.add_argument("--algorithm", default="pbkdf2-sha256",
+                      choices=HASH_ALGORITHMS,
+                      help="Функция хеширования")
+    cost.add_argument("--iterations", type=int, default=None,
+                      help="Число итераций PBKDF2 (по умолчанию 600000 для "
+                           "sha256 и 210000 для sha512)")
+    cost.add_argument("--scrypt-n", type=int, default=1 << 15,
+                      help="Параметр n (стоимость) scrypt")
+    cost.add_argument("--scrypt-r", type=int, default=8,
+                      help="Параметр r (размер блока) scrypt")
+    cost.add_argument("--scrypt-p", type=int, default=1,
+                      help="Параметр p (параллелизм) scrypt")
+    cost.add_argument("--salt-bytes", type=int, default=16,
+                      help="Длина соли, байт")
+
+    parser.add_argument("--out", default=None,
+                        help="Файл результатов (по умолчанию stdout)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="csv",
+                        help="Формат результатов")
+    parser.add_argument("--with-password", action="store_true",
+                        help="Включать пароль в результаты (при --count включен всегда)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Число процессов (0 - по числу ядер)")
+    parser.add_argument("--chunk", type=int, default=None,
+                        help="Количество записей в порции (по умолчанию 32)")
+    parser.set_defaults(handler=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Выполняет команду hash.
+
+    Сгенерированные пароли всегда включаются в результат: иначе они
+    были бы потеряны.
+    """
+    from generator.PasswordGeneration import _validate
+    from pipeline.Hashing import (
+        CHUNK_RECORDS, HashScheme, csv_header, iter_file_records,
+        iter_generated_records, iter_hashed
+    )
+
+    # Все аргументы проверяются до открытия приемника: иначе ошибочный
+    # вызов успел бы обнулить существующий файл результатов
+    if args.workers < 0:
+        raise ValueError("Число процессов не может быть отрицательным")
+    if args.chunk is not None and args.chunk < 1:
+        raise ValueError("Размер порции должен быть положительным")
+    if args.count is not None:
+        if args.count < 0:
+            raise ValueError("Количество паролей не может быть отрицательным")
+        _validate(args.length, not args.no_digits, not args.no_special)
+
+    scheme = HashScheme(args.algorithm, iterations=args.iterations,
+                        n=args.scrypt_n, r=args.scrypt_r, p=args.scrypt_p,
+                        salt_bytes=args.salt_bytes)
+    with_password = args.with_password or args.count is not None
+    started = time.perf_counter()
+    total = 0
+
+    if args.count is not None:
+        records = iter_generated_records(args.count, args.length,
+                                         not args.no_digits, not args.no_special,
+                                         args.first_id)
+        stream = None
+    elif args.source == "-":
+        stream = sys.stdin.buffer
+        records = iter_file_records(stream, args.ids)
+    else:
+        stream = open(args.source, "rb", buffering=1024 * 1024)
+        records = iter_file_records(stream, args.ids)
+
+    try:
+        with open_sink(args.out) as sink:
+            if args.format == "csv":
+                sink.write(csv_header(with_password))
+            for block in iter_hashed(records, scheme, args.format, with_password,
+                                     workers=args.workers or None,
+                                     chunk_records=args.chunk or CHUNK_RECORDS):
+                sink.write(block)
+                total += block.count(b"\n")
+    finally:
+        if stream is not None and stream is not sys.stdin.buffer:
+            stream.close()
+
+    report_throughput("Захешировано паролей", total, started)
+    return 0
@@ -0,0 +1,53 @@
+"""
+Команда insecure-corpus: синтетические НЕСЕКРЕТНЫЕ пароли для нагрузочных тестов.
+"""
+
+import argparse
+import sys
+import time
+
+from cli.Output import open_sink, report_throughput
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Регистрирует команду insecure-corpus."""
+    parser = subparsers.add_parser(
+        "insecure-corpus",
+        help="НЕКРИПТОГРАФИЧЕСКИЙ корпус для нагрузочных тестов (требует numpy)"
+    )
+    parser.add_argument("--seed", type=int, required=True,
+                        help="Зерно генератора (корпус воспроизводим)")
+    parser.add_argument("--count", type=int, default=1_000_000,
+                        help="Количество паролей")
+    parser.add_argument("--length", type=int, default=12,
+                        help="Длина пароля")
+    parser.add_argument("--no-digits", action="store_true",
+                        help="Не использовать цифры")
+    parser.add_argument("--no-special", action="store_true",
+                        help="Не использовать спецсимволы")
+    parser.add_argument("--raw", action="store_true",
+                        help="Записи фиксированной ширины без переводов строки")
+    parser.add_argument("--out", default=None,
+                        help="Файл для записи (по умолчанию stdout)")
+    parser.set_defaults(handler=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Выполняет команду insecure-corpus."""
+    from synthetic.InsecureCorpus import write_insecure_corpus
+
+    print("ВНИМАНИЕ: пароли предсказуемы и предназначены только для тестов",
+          file=sys.stderr)
+    started = time.perf_counter()
+    with open_sink(args.out) as sink:
+        write_insecure_corpus(
+            sink,
+            args.count,
+            args.length,
+            use_digits=not args.no_digits,
+            use_special_chars=not args.no_special,
+            seed=args.seed,
+            newline=not args.raw
+        )
+    report_throughput("Синтетических паролей", args.count, started)
+    return 0
@@ -0,0 +1,38 @@
+"""
+Вспомогательные функции вывода для консольных команд.
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional
+
+# Размер буфера записи в выходной файл
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+@contextmanager
+def open_sink(path: Optional[str]) -> Iterator[BinaryIO]:
+    """
+    Открывает приемник для бинарной записи.
+
+    Если путь не указан или равен "-", используется stdout.
+    """
+    if path is None or path == "-":
+        stream = sys.stdout.buffer
+        try:
+            yield stream
+        finally:
+            stream.flush()
+    else:
+        with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as stream:
+            yield stream
+
+
+def report_throughput(label: str, count: int, started: float) -> None:
+    """Печатает в stderr количество обработанных элементов и скорость."""
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    print(
+        f"{label}: {count} за {elapsed:.3f} с ({count / elapsed:,.0f} в секунду)",
+        file=sys.stderr
+    )
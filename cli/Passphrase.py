@@ -0,0 +1,54 @@
+"""
+Команда passphrase: потоковая генерация парольных фраз (diceware).
+"""
+
+import argparse
+import time
+
+from cli.Output import open_sink, report_throughput
+
+# Количество фраз, генерируемых и записываемых за одну итерацию
+CHUNK_SIZE = 4096
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Регистрирует команду passphrase."""
+    parser = subparsers.add_parser("passphrase",
+                                   help="Сгенерировать парольные фразы")
+    parser.add_argument("--wordlist", default=None,
+                        help="Словарь: текстовый или скомпилированный "
+                             "(по умолчанию PASSGEN_WORDLIST)")
+    parser.add_argument("--count", type=int, default=1,
+                        help="Количество фраз")
+    parser.add_argument("--words", type=int, default=6,
+                        help="Количество слов во фразе")
+    parser.add_argument("--separator", default="-",
+                        help="Разделитель слов")
+    parser.add_argument("--out", default=None,
+                        help="Файл для записи (по умолчанию stdout)")
+    parser.set_defaults(handler=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Выполняет команду passphrase."""
+    from generator.Passphrase import (
+        default_wordlist_path, generate_passphrases, open_wordlist
+    )
+
+    if args.count < 0:
+        raise ValueError("Количество фраз не может быть отрицательным")
+
+    wordlist = open_wordlist(args.wordlist or default_wordlist_path())
+    started = time.perf_counter()
+
+    with open_sink(args.out) as sink:
+        remaining = args.count
+        while remaining > 0:
+            batch = min(CHUNK_SIZE, remaining)
+            phrases = generate_passphrases(wordlist, batch, args.words,
+                                           args.separator)
+            sink.write(("\n".join(phrases) + "\n").encode("utf-8"))
+            remaining -= batch
+
+    report_throughput("Сгенерировано фраз", args.count, started)
+    return 0
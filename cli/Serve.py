@@ -0,0 +1,49 @@
+"""
+Команды serve и loadtest: локальный HTTP-сервис и его нагрузочный тест.
+"""
+
+import argparse
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Регистрирует команды serve и loadtest."""
+    serve = subparsers.add_parser("serve", help="Запустить локальный HTTP-сервис")
+    serve.add_argument("--host", default="127.0.0.1", help="Адрес")
+    serve.add_argument("--port", type=int, default=8765, help="Порт")
+    serve.set_defaults(handler=run_serve)
+
+    load = subparsers.add_parser("loadtest",
+                                 help="Нагрузочный тест HTTP-сервиса")
+    load.add_argument("--host", default="127.0.0.1", help="Адрес")
+    load.add_argument("--port", type=int, default=8765, help="Порт")
+    load.add_argument("--endpoint", choices=("generate", "check"),
+                      default="generate", help="Конечная точка")
+    load.add_argument("--connections", type=int, default=32,
+                      help="Число одновременных соединений")
+    load.add_argument("--requests", type=int, default=200,
+                      help="Число запросов на соединение")
+    load.add_argument("--count", type=int, default=1,
+                      help="Число паролей в запросе")
+    load.set_defaults(handler=run_loadtest)
+
+
+def run_serve(args: argparse.Namespace) -> int:
+    """Выполняет команду serve."""
+    from service.HttpService import serve
+
+    serve(args.host, args.port)
+    return 0
+
+
+def run_loadtest(args: argparse.Namespace) -> int:
+    """Выполняет команду loadtest."""
+    import asyncio
+
+    from service.LoadTest import format_summary, run_load_test
+
+    summary = asyncio.run(run_load_test(
+        args.host, args.port, args.endpoint,
+        args.connections, args.requests, args.count
+    ))
+    print(format_summary(summary))
+    return 0 if not summary["errors"] else 1
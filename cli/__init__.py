@@ -0,0 +1,6 @@
+"""
+Консольный интерфейс генератора паролей.
+
+Модули пакета не импортируют tkinter и могут использоваться на серверах
+без графического окружения.
+"""
@@ -0,0 +1,87 @@
+"""
+Параллельная генерация паролей в пуле процессов.
+
+Запрошенное количество паролей делится на шарды фиксированного размера.
+Каждый рабочий процесс получает энтропию из собственного вызова
+os.urandom, то есть независимого потока CSPRNG ядра,
+и возвращает родителю готовый блок байт, а не список строк Python.
+Родитель получает блоки в исходном порядке и передает их в приемник.
+"""
+
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+from generator.PasswordGeneration import _validate, generate_lines
+from generator.PasswordPolicy import PasswordPolicy
+from utils.OrderedPool import imap_ordered
+
+# Количество паролей в одном шарде
+SHARD_SIZE = 65536
+
+
+def _iter_shards(count: int, length: int, use_digits: bool,
+                 use_special_chars: bool, shard_size: int) -> Iterator[Tuple]:
+    """Делит count паролей на задания по shard_size."""
+    remaining = count
+    while remaining > 0:
+        batch = min(shard_size, remaining)
+        yield batch, length, use_digits, use_special_chars
+        remaining -= batch
+
+
+def iter_parallel_lines(count: int, length: int = 12, use_digits: bool = True,
+                        use_special_chars: bool = True,
+                        workers: Optional[int] = None,
+                        shard_size: int = SHARD_SIZE) -> Iterator[bytes]:
+    """
+    Генерирует count паролей в пуле процессов и выдает блоки по порядку.
+
+    Каждый блок содержит до shard_size паролей, разделенных переводом строки.
+    Одновременно в работе находится не более 2 * workers шардов, поэтому
+    расход памяти ограничен независимо от count.
+    """
+    _validate(length, use_digits, use_special_chars)
+    if count < 0:
+        raise ValueError("Количество паролей не может быть отрицательным")
+    if shard_size < 1:
+        raise ValueError("Размер шарда должен быть положительным")
+
+    shards = _iter_shards(count, length, use_digits, use_special_chars, shard_size)
+    return imap_ordered(generate_lines, shards, workers)
+
+
+def _policy_shard(policy: PasswordPolicy, count: int) -> bytes:
+    """Функция рабочего процесса: генерирует шард паролей по политике."""
+    return policy.generate_lines(count)
+
+
+def iter_policy_lines(policy: PasswordPolicy, count: int,
+                      workers: Optional[int] = None,
+                      shard_size: int = SHARD_SIZE) -> Iterator[bytes]:
+    """
+    Генерирует count паролей по политике и выдает блоки по порядку.
+
+    При workers == 1 шарды генерируются в текущем процессе.
+    """
+    if count < 0:
+        raise ValueError("Количество паролей не может быть отрицательным")
+    if shard_size < 1:
+        raise ValueError("Размер шарда должен быть положительным")
+
+    shards = ((policy, min(shard_size, count - offset))
+              for offset in range(0, count, shard_size))
+    return imap_ordered(_policy_shard, shards, workers)
+
+
+def write_parallel(sink: BinaryIO, count: int, length: int = 12,
+                   use_digits: bool = True, use_special_chars: bool = True,
+                   workers: Optional[int] = None,
+                   shard_size: int = SHARD_SIZE) -> int:
+    """
+    Генерирует count паролей параллельно и записывает их в sink.
+
+    Возвращает количество записанных паролей.
+    """
+    for block in iter_parallel_lines(count, length, use_digits,
+                                     use_special_chars, workers, shard_size):
+        sink.write(block)
+    return count
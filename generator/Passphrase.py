@@ -0,0 +1,269 @@
+"""
+Модуль генерации парольных фраз (diceware).
+
+Словари хранятся в компактном формате на диске и открываются через mmap:
+
+    заголовок (16 байт): сигнатура "PGWL", версия, резерв, число слов N
+    смещения: N + 1 беззнаковых 64-битных чисел (little-endian)
+    данные: слова в UTF-8 подряд, слово i - data[offset[i]:offset[i + 1]]
+
+Слово выбирается по случайному индексу без загрузки всего словаря
+в память, поэтому размер словаря (EFF, русские словари на 100k+ слов)
+не влияет на время запуска. Индексы берутся пакетами через
+generator.PasswordGeneration.random_below.
+
+Текстовые словари компилируются автоматически в каталог кэша
+(PASSGEN_CACHE_DIR, иначе XDG_CACHE_HOME/passgen или ~/.cache/passgen,
+в Windows - LOCALAPPDATA/passgen); файл записывается во временный и
+атомарно переименовывается.
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from functools import lru_cache
+from typing import Iterator, List
+
+from generator.PasswordGeneration import random_below
+
+HEADER = struct.Struct("<4sBBHQ")
+WORDLIST_MAGIC = b"PGWL"
+FORMAT_VERSION = 1
+# Версия разбора текстовых словарей (_iter_words); входит в ключ кэша,
+# чтобы словари, скомпилированные прежним разбором, пересобирались
+PARSER_VERSION = 2
+OFFSET = struct.Struct("<Q")
+
+# Расширение скомпилированного словаря
+COMPILED_SUFFIX = ".pgwl"
+
+# Переменная окружения с путем к словарю по умолчанию
+WORDLIST_ENV = "PASSGEN_WORDLIST"
+
+# Переменная окружения с каталогом скомпилированных словарей
+CACHE_DIR_ENV = "PASSGEN_CACHE_DIR"
+
+DEFAULT_WORDS = 6
+DEFAULT_SEPARATOR = "-"
+
+
+def _iter_words(path: str) -> Iterator[str]:
+    """
+    Читает слова из текстового словаря (одна запись в строке).
+
+    В формате EFF ("11111<tab>слово") номер из цифр 1-6 отбрасывается,
+    иначе записью считается вся строка без крайних пробелов (в том числе
+    из нескольких слов). Повторяющиеся записи пропускаются.
+    """
+    seen = set()
+    with open(path, encoding="utf-8", errors="strict") as stream:
+        for line in stream:
+            word = line.strip()
+            if not word:
+                continue
+            fields = word.split(None, 1)
+            if len(fields) == 2 and not fields[0].strip("123456"):
+                word = fields[1]
+            if word not in seen:
+                seen.add(word)
+                yield word
+
+
+def compile_wordlist(source: str, target: str) -> int:
+    """
+    Компилирует текстовый словарь source в файл target.
+
+    Файл пишется во временный файл рядом с target и атомарно заменяет
+    его (os.replace): читатели никогда не видят частично записанный
+    словарь. Возвращает количество слов.
+    """
+    offsets = array("Q", [0])
+    with tempfile.TemporaryFile() as blob:
+        position = 0
+        for word in _iter_words(source):
+            encoded = word.encode("utf-8")
+            blob.write(encoded)
+            position += len(encoded)
+            offsets.append(position)
+
+        count = len(offsets) - 1
+        if count < 2:
+            raise ValueError("Словарь должен содержать не менее двух слов")
+        if sys.byteorder == "big":
+            offsets.byteswap()
+
+        directory = os.path.dirname(os.path.abspath(target))
+        descriptor, temporary = tempfile.mkstemp(
+            prefix=os.path.basename(target) + ".", suffix=".tmp", dir=directory
+        )
+        try:
+            with open(descriptor, "wb", buffering=1024 * 1024) as stream:
+                stream.write(HEADER.pack(WORDLIST_MAGIC, FORMAT_VERSION, 0, 0, count))
+                offsets.tofile(stream)
+                blob.seek(0)
+                while True:
+                    chunk = blob.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    stream.write(chunk)
+            os.replace(temporary, target)
+        except BaseException:
+            os.remove(temporary)
+            raise
+    return count
+
+
+class Wordlist:
+    """Скомпилированный словарь, открытый через mmap."""
+
+    __slots__ = ("path", "count", "_file", "_map", "_data_start")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Файл словаря пуст: {path}")
+        try:
+            magic, version, _, _, count = HEADER.unpack_from(self._map, 0)
+        except struct.error:
+            self.close()
+            raise ValueError(f"Файл словаря поврежден: {path}") from None
+        if magic != WORDLIST_MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Неизвестный формат словаря: {path}")
+        self.count = count
+        self._data_start = HEADER.size + (count + 1) * OFFSET.size
+        # Таблица смещений и данные должны целиком помещаться в файл
+        if (count < 1 or self._data_start > len(self._map)
+                or self._data_start + self._offset(count) > len(self._map)):
+            self.close()
+            raise ValueError(f"Файл словаря поврежден: {path}")
+
+    def _offset(self, index: int) -> int:
+        return OFFSET.unpack_from(self._map, HEADER.size + index * OFFSET.size)[0]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> str:
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        start = self._offset(index)
+        end = self._offset(index + 1)
+        return self._map[self._data_start + start:self._data_start + end].decode("utf-8")
+
+    def close(self) -> None:
+        """Закрывает отображение и файл."""
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+def is_compiled(path: str) -> bool:
+    """Проверяет, является ли файл скомпилированным словарем."""
+    with open(path, "rb") as stream:
+        return stream.read(len(WORDLIST_MAGIC)) == WORDLIST_MAGIC
+
+
+def cache_dir() -> str:
+    """Каталог скомпилированных словарей."""
+    path = os.environ.get(CACHE_DIR_ENV)
+    if path:
+        return path
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "passgen")
+
+
+def _compiled_path(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Путь скомпилированного словаря в каталоге кэша.
+
+    Имя зависит от пути, времени изменения и размера исходного файла
+    и от PARSER_VERSION, поэтому измененный словарь компилируется заново.
+    Если каталог кэша недоступен для записи, используется временный каталог.
+    """
+    key = f"{path}\0{mtime_ns}\0{size}\0{PARSER_VERSION}".encode(
+        "utf-8", "surrogateescape")
+    name = hashlib.sha256(key).hexdigest()[:32] + COMPILED_SUFFIX
+    for directory in (cache_dir(), os.path.join(tempfile.gettempdir(), "passgen")):
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError:
+            continue
+        if os.access(directory, os.W_OK):
+            return os.path.join(directory, name)
+    raise OSError(f"Нет доступного для записи каталога кэша словарей ({CACHE_DIR_ENV})")
+
+
+def open_wordlist(path: str) -> Wordlist:
+    """
+    Открывает словарь (кэшируется по пути, времени изменения и размеру).
+
+    Текстовый словарь при первом использовании компилируется в каталог
+    кэша (cache_dir) и затем переиспользуется, пока исходный файл не
+    изменится.
+    """
+    path = os.path.abspath(path)
+    status = os.stat(path)
+    return _open_wordlist(path, status.st_mtime_ns, status.st_size)
+
+
+@lru_cache(maxsize=8)
+def _open_wordlist(path: str, mtime_ns: int, size: int) -> Wordlist:
+    if is_compiled(path):
+        return Wordlist(path)
+
+    compiled = _compiled_path(path, mtime_ns, size)
+    if not os.path.exists(compiled):
+        compile_wordlist(path, compiled)
+    return Wordlist(compiled)
+
+
+def default_wordlist_path() -> str:
+    """Возвращает путь к словарю из переменной окружения PASSGEN_WORDLIST."""
+    path = os.environ.get(WORDLIST_ENV)
+    if not path:
+        raise ValueError(f"Словарь не задан (переменная окружения {WORDLIST_ENV})")
+    return path
+
+
+def _validate(wordlist: Wordlist, words: int) -> None:
+    if words < 3:
+        raise ValueError("Парольная фраза должна содержать не менее 3 слов")
+    if len(wordlist) < 2:
+        raise ValueError("Словарь должен содержать не менее двух слов")
+
+
+def generate_passphrase(wordlist: Wordlist, words: int = DEFAULT_WORDS,
+                        separator: str = DEFAULT_SEPARATOR) -> str:
+    """Генерирует одну парольную фразу из words слов словаря."""
+    _validate(wordlist, words)
+    return separator.join(wordlist[index]
+                          for index in random_below(words, len(wordlist)))
+
+
+def generate_passphrases(wordlist: Wordlist, count: int,
+                         words: int = DEFAULT_WORDS,
+                         separator: str = DEFAULT_SEPARATOR) -> List[str]:
+    """Генерирует count парольных фраз; индексы слов берутся одним пакетом."""
+    _validate(wordlist, words)
+    indices = random_below(count * words, len(wordlist))
+    return [separator.join(wordlist[index] for index in indices[start:start + words])
+            for start in range(0, count * words, words)]
+
+
+def passphrase_entropy_bits(wordlist: Wordlist, words: int = DEFAULT_WORDS) -> float:
+    """Энтропия фразы в битах: words * log2(размер словаря)."""
+    return words * math.log2(len(wordlist))
@@ -1,8 +1,20 @@
-import secrets
+import os
 import string
+from functools import lru_cache
+from typing import Iterator, List, Tuple
 
-def generate_password(length: int = 12, use_digits: bool = True,
-                      use_special_chars: bool = True) -> str:
+from utils.Metrics import timed
+
+# Модуль secrets не импортируется: он тянет base64, hmac и random, а
+# generate_packed берет энтропию из того же источника (os.urandom) напрямую
+
+# Размер блока случайных байт, запрашиваемого у CSPRNG за один вызов
+ENTROPY_BLOCK_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=None)
+def get_alphabet(use_digits: bool = True, use_special_chars: bool = True) -> str:
+    """Возвращает (кэшированный) алфавит для заданных настроек."""
     chars = string.ascii_letters
 
     if use_digits:
@@ -11,12 +23,166 @@ def generate_password(length: int = 12, use_digits: bool = True,
     if use_special_chars:
         chars += string.punctuation
 
+    return chars
+
+
+@lru_cache(maxsize=None)
+def _get_translation(alphabet: str) -> Tuple[bytes, bytes]:
+    """
+    Строит таблицу для отображения случайных байт на алфавит.
+
+    Байты из диапазона [0, limit) переводятся в alphabet[b % n], где limit -
+    наибольшее кратное n, не превышающее 256. Остальные байты отбрасываются
+    (rejection sampling), поэтому распределение символов остается равномерным.
+    """
+    size = len(alphabet)
+    limit = 256 - 256 % size
+    encoded = alphabet.encode("ascii")
+    table = bytes(encoded[b % size] if b < limit else 0 for b in range(256))
+    rejected = bytes(range(limit, 256))
+    return table, rejected
+
+
+def _validate(length: int, use_digits: bool, use_special_chars: bool) -> str:
+    """Проверяет параметры генерации и возвращает алфавит."""
+    chars = get_alphabet(use_digits, use_special_chars)
+
     if len(chars) == len(string.ascii_letters):
         raise ValueError("Пароль должен содержать хотя бы цифры или специальные символы")
 
     if length < 8:
         raise ValueError("Длина пароля должна быть не менее 8 символов")
 
-    password = ''.join(secrets.choice(chars) for _ in range(length))
+    return chars
+
+
+@timed("generate_password")
+def generate_password(length: int = 12, use_digits: bool = True,
+                      use_special_chars: bool = True) -> str:
+    password = generate_packed(1, length, use_digits, use_special_chars).decode("ascii")
 
     return password
+
+
+@timed("generate_packed")
+def generate_packed(count: int, length: int = 12, use_digits: bool = True,
+                    use_special_chars: bool = True) -> bytes:
+    """
+    Генерирует count паролей, упакованных подряд в одну строку байт.
+
+    Каждый пароль занимает ровно length байт (ASCII), i-й пароль находится
+    в срезе [i * length, (i + 1) * length). Энтропия берется блоками
+    через os.urandom.
+    """
+    chars = _validate(length, use_digits, use_special_chars)
+    if count < 0:
+        raise ValueError("Количество паролей не может быть отрицательным")
+
+    table, rejected = _get_translation(chars)
+    need = count * length
+    # Доля принимаемых байт, с небольшим запасом на отбраковку
+    accept_ratio = (256 - len(rejected)) / 256
+    parts = []
+    collected = 0
+
+    while collected < need:
+        request = min(ENTROPY_BLOCK_SIZE, int((need - collected) / accept_ratio) + 16)
+        mapped = os.urandom(request).translate(table, rejected)
+        parts.append(mapped)
+        collected += len(mapped)
+
+    return b"".join(parts)[:need]
+
+
+def random_below(count: int, limit: int) -> List[int]:
+    """
+    Возвращает count равномерно распределенных чисел из [0, limit).
+
+    Энтропия берется блоками: из os.urandom читаются 32-битные слова,
+    маскируются до нужного числа бит, а значения вне диапазона
+    отбрасываются (rejection sampling). Используется для выбора слов
+    из больших словарей.
+    """
+    if not 1 <= limit <= 1 << 32:
+        raise ValueError("Граница должна быть в интервале [1, 2^32]")
+    if count < 0:
+        raise ValueError("Количество чисел не может быть отрицательным")
+    if limit == 1:
+        return [0] * count
+
+    mask = (1 << (limit - 1).bit_length()) - 1
+    result: List[int] = []
+    while len(result) < count:
+        # После маскирования принимается не менее половины значений
+        words = min(ENTROPY_BLOCK_SIZE // 4, 2 * (count - len(result)) + 4)
+        block = memoryview(os.urandom(words * 4)).cast("I")
+        result.extend(value for value in (word & mask for word in block)
+                      if value < limit)
+    del result[count:]
+    return result
+
+
+def generate_lines(count: int, length: int = 12, use_digits: bool = True,
+                   use_special_chars: bool = True) -> bytes:
+    """
+    Генерирует count паролей в виде готового к записи блока байт.
+
+    Каждый пароль завершается символом перевода строки.
+    """
+    packed = generate_packed(count, length, use_digits, use_special_chars)
+    if not packed:
+        return b""
+    return b"\n".join(
+        packed[offset:offset + length]
+        for offset in range(0, count * length, length)
+    ) + b"\n"
+
+
+def iter_passwords(count: int, length: int = 12, use_digits: bool = True,
+                   use_special_chars: bool = True,
+                   batch_size: int = 4096) -> Iterator[str]:
+    """
+    Лениво генерирует count паролей, запрашивая энтропию пакетами.
+
+    В памяти одновременно находится не более batch_size паролей, поэтому
+    генератор подходит для потоковой выдачи сколь угодно больших объемов.
+    Параметры проверяются при вызове, а не при первом обращении к итератору.
+    """
+    _validate(length, use_digits, use_special_chars)
+    if count < 0:
+        raise ValueError("Количество паролей не может быть отрицательным")
+    if batch_size < 1:
+        raise ValueError("Размер пакета должен быть положительным")
+
+    return _iter_batches(count, length, use_digits, use_special_chars, batch_size)
+
+
+def _iter_batches(count: int, length: int, use_digits: bool,
+                  use_special_chars: bool, batch_size: int) -> Iterator[str]:
+    """Генератор для iter_passwords (параметры уже проверены)."""
+    remaining = count
+    while remaining > 0:
+        batch = min(batch_size, remaining)
+        packed = generate_packed(batch, length, use_digits, use_special_chars)
+        text = packed.decode("ascii")
+        for offset in range(0, batch * length, length):
+            yield text[offset:offset + length]
+        remaining -= batch
+
+
+def generate_passwords(count: int, length: int = 12, use_digits: bool = True,
+                       use_special_chars: bool = True) -> List[str]:
+    """
+    Генерирует список из count паролей.
+
+    Использует те же алфавиты и правила проверки, что и generate_password,
+    но запрашивает случайные байты одним блоком на весь пакет.
+    """
+    _validate(length, use_digits, use_special_chars)
+    if count < 0:
+        raise ValueError("Количество паролей не может быть отрицательным")
+
+    packed = generate_packed(count, length, use_digits, use_special_chars)
+    text = packed.decode("ascii")
+    return [text[offset:offset + length]
+            for offset in range(0, count * length, length)]
@@ -0,0 +1,290 @@
+"""
+Модуль политик паролей.
+
+Политика компилируется один раз: для каждого класса символов хранится
+алфавит и минимальное количество, а также ограничения на повторы и
+простые последовательности. Выполнимость проверяется при создании
+политики. Пароль генерируется за один проход без повторных попыток:
+позиции обязательных классов дополняются позициями общего алфавита и
+перемешиваются (Фишер-Йейтс), затем каждая позиция слева направо
+заполняется символом своего класса. Символ, нарушающий ограничения,
+выбирается заново среди оставшихся; проверка при создании гарантирует,
+что допустимый символ есть всегда.
+"""
+
+import os
+import string
+import threading
+import weakref
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# Символы, которые легко спутать при чтении
+AMBIGUOUS_CHARS = "Il1|O0o`'\""
+
+# Максимальное число попыток выбрать символ перед явным перебором
+_MAX_CHAR_ATTEMPTS = 32
+
+# Буферы энтропии всех политик (для сброса в дочернем процессе)
+_buffers: "weakref.WeakSet[_EntropyBuffer]" = weakref.WeakSet()
+
+
+class _EntropyBuffer:
+    """
+    Буфер случайных байт из os.urandom для несмещенного выбора чисел.
+
+    Буфер принадлежит политике; потоки генерируют пароль, удерживая lock,
+    поэтому одни и те же байты никогда не выдаются дважды. В дочернем
+    процессе после fork буфер сбрасывается, чтобы процессы не повторяли
+    энтропию друг друга.
+    """
+
+    __slots__ = ("data", "position", "lock", "__weakref__")
+
+    BLOCK_SIZE = 4096
+
+    def __init__(self) -> None:
+        self.data = b""
+        self.position = 0
+        self.lock = threading.Lock()
+        _buffers.add(self)
+
+    def reset(self) -> None:
+        self.data = b""
+        self.position = 0
+        self.lock = threading.Lock()
+
+    def take(self, size: int) -> bytes:
+        if self.position + size > len(self.data):
+            self.data = os.urandom(max(self.BLOCK_SIZE, size))
+            self.position = 0
+        chunk = self.data[self.position:self.position + size]
+        self.position += size
+        return chunk
+
+    def below(self, limit: int) -> int:
+        """Возвращает равномерно распределенное число из [0, limit)."""
+        if limit == 1:
+            return 0
+        bits = (limit - 1).bit_length()
+        size = (bits + 7) // 8
+        mask = (1 << bits) - 1
+        while True:
+            value = int.from_bytes(self.take(size), "little") & mask
+            if value < limit:
+                return value
+
+
+def _reset_buffers() -> None:
+    for buffer in list(_buffers):
+        buffer.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_buffers)
+
+
+@lru_cache(maxsize=4)
+def _forbidden_chars(matcher) -> FrozenSet[FrozenSet[str]]:
+    """
+    Различные наборы символов, завершающих последовательность,
+    по всем состояниям автомата (вычисляются один раз на автомат).
+    """
+    outputs = matcher.outputs
+    return frozenset(
+        frozenset(char for char, following in matcher.full_row(state).items()
+                  if outputs[following])
+        for state in range(len(matcher.transitions))
+    )
+
+
+def _fewest_allowed(alphabet: str, forbidden: FrozenSet[FrozenSet[str]],
+                    max_repeat: Optional[int]) -> int:
+    """Наименьшее число допустимых символов алфавита в любой позиции."""
+    lowered: Dict[str, int] = {}
+    for char in alphabet:
+        lowered[char.lower()] = lowered.get(char.lower(), 0) + 1
+    worst = max((sum(lowered.get(char, 0) for char in chars) for chars in forbidden),
+                default=0)
+    # Символ предыдущей серии запрещается при достижении max_repeat
+    return len(alphabet) - worst - (max_repeat is not None)
+
+
+class PasswordPolicy:
+    """
+    Скомпилированная политика генерации паролей.
+
+    classes - кортеж пар (алфавит класса, минимальное число символов).
+    max_repeat - максимальная длина серии одинаковых символов (None - без
+    ограничения). no_sequences - запрет последовательностей из
+    analyzer.SequenceMatcher (клавиатурные ряды, алфавиты).
+    """
+
+    __slots__ = ("length", "classes", "alphabet", "max_repeat",
+                 "no_sequences", "_matcher", "_entropy")
+
+    def __init__(self, length: int, classes: Tuple[Tuple[str, int], ...],
+                 max_repeat: Optional[int] = None,
+                 no_sequences: bool = False) -> None:
+        if length < 8:
+            raise ValueError("Длина пароля должна быть не менее 8 символов")
+        if not classes or any(not chars for chars, _ in classes):
+            raise ValueError("Алфавит класса символов не может быть пустым")
+        if any(minimum < 0 for _, minimum in classes):
+            raise ValueError("Минимальное количество не может быть отрицательным")
+        if sum(minimum for _, minimum in classes) > length:
+            raise ValueError("Сумма минимальных количеств превышает длину пароля")
+        if max_repeat is not None and max_repeat < 1:
+            raise ValueError("Максимальная длина повтора должна быть не менее 1")
+
+        self.length = length
+        self.classes = classes
+        self.alphabet = "".join(dict.fromkeys("".join(chars for chars, _ in classes)))
+        self.max_repeat = max_repeat
+        self.no_sequences = no_sequences
+        if no_sequences:
+            from analyzer.SequenceMatcher import get_default_matcher
+            self._matcher = get_default_matcher()
+        else:
+            self._matcher = None
+        self._check_feasible()
+        # Один буфер на политику: 4 КиБ энтропии расходуются на много паролей
+        self._entropy = _EntropyBuffer()
+
+    def _check_feasible(self) -> None:
+        """
+        Проверяет, что в каждой позиции всегда найдется допустимый символ.
+
+        Тогда генерация не может зайти в тупик ни при каком выборе
+        предыдущих символов.
+        """
+        if self.max_repeat is None and self._matcher is None:
+            return
+        forbidden = (_forbidden_chars(self._matcher) if self._matcher is not None
+                     else frozenset())
+        alphabets = [self.alphabet, *(chars for chars, minimum in self.classes if minimum)]
+        for chars in alphabets:
+            if _fewest_allowed(chars, forbidden, self.max_repeat) < 1:
+                raise ValueError(f"Политику невозможно выполнить: символов «{chars}» "
+                                 f"недостаточно при заданных ограничениях")
+
+    def __getstate__(self) -> tuple:
+        # Автомат не передается в рабочие процессы: он строится заново
+        return self.length, self.classes, self.max_repeat, self.no_sequences
+
+    def __setstate__(self, state: tuple) -> None:
+        self.__init__(*state)
+
+    def _slot_alphabets(self, entropy: _EntropyBuffer) -> List[str]:
+        """Алфавиты позиций: обязательные классы, остальное - общий алфавит."""
+        slots = [chars for chars, minimum in self.classes for _ in range(minimum)]
+        slots.extend([self.alphabet] * (self.length - len(slots)))
+        # Несмещенное перемешивание Фишера-Йейтса
+        for index in range(len(slots) - 1, 0, -1):
+            other = entropy.below(index + 1)
+            slots[index], slots[other] = slots[other], slots[index]
+        return slots
+
+    def _generate(self, entropy: _EntropyBuffer) -> str:
+        max_repeat = self.max_repeat
+        matcher = self._matcher
+        transitions = matcher.transitions if matcher else None
+        outputs = matcher.outputs if matcher else None
+        state = 0
+        run = 0
+        previous = ""
+        chars: List[str] = []
+
+        for alphabet in self._slot_alphabets(entropy):
+            for attempt in range(_MAX_CHAR_ATTEMPTS + 1):
+                if attempt < _MAX_CHAR_ATTEMPTS:
+                    char = alphabet[entropy.below(len(alphabet))]
+                else:
+                    # Почти все символы запрещены - выбираем из допустимых явно
+                    # (список не пуст, см. _check_feasible)
+                    allowed = [candidate for candidate in alphabet
+                               if self._allowed(candidate, previous, run, state)]
+                    char = allowed[entropy.below(len(allowed))]
+                if max_repeat is not None and char == previous and run >= max_repeat:
+                    continue
+                if transitions is not None:
+                    following = transitions[state].get(char.lower(), 0)
+                    if outputs[following]:
+                        continue
+                    state = following
+                break
+            run = run + 1 if char == previous else 1
+            previous = char
+            chars.append(char)
+
+        return "".join(chars)
+
+    def _allowed(self, char: str, previous: str, run: int, state: int) -> bool:
+        """Проверяет, не нарушает ли символ ограничения политики."""
+        if self.max_repeat is not None and char == previous and run >= self.max_repeat:
+            return False
+        if self._matcher is not None:
+            following = self._matcher.transitions[state].get(char.lower(), 0)
+            return not self._matcher.outputs[following]
+        return True
+
+    def generate(self) -> str:
+        """Генерирует один пароль, соответствующий политике."""
+        entropy = self._entropy
+        with entropy.lock:
+            return self._generate(entropy)
+
+    def generate_many(self, count: int) -> List[str]:
+        """Генерирует count паролей."""
+        if count < 0:
+            raise ValueError("Количество паролей не может быть отрицательным")
+        entropy = self._entropy
+        passwords = []
+        for _ in range(count):
+            with entropy.lock:
+                passwords.append(self._generate(entropy))
+        return passwords
+
+    def generate_lines(self, count: int) -> bytes:
+        """Генерирует count паролей в виде блока строк, готового к записи."""
+        passwords = self.generate_many(count)
+        if not passwords:
+            return b""
+        return ("\n".join(passwords) + "\n").encode("utf-8")
+
+    def __repr__(self) -> str:
+        classes = ", ".join(f"{chars[:6]}...x{minimum}" for chars, minimum in self.classes)
+        return (f"PasswordPolicy(length={self.length}, classes=[{classes}], "
+                f"max_repeat={self.max_repeat}, no_sequences={self.no_sequences})")
+
+
+@lru_cache(maxsize=64)
+def get_policy(length: int = 12, use_digits: bool = True,
+               use_special_chars: bool = True, min_lowercase: int = 1,
+               min_uppercase: int = 1, min_digits: int = 1,
+               min_special: int = 1, exclude_ambiguous: bool = False,
+               max_repeat: Optional[int] = None,
+               no_sequences: bool = False) -> PasswordPolicy:
+    """
+    Возвращает (кэшированную) политику с настройками generate_password.
+
+    Минимальные количества применяются только к включенным классам.
+    """
+    if not use_digits and not use_special_chars:
+        raise ValueError("Пароль должен содержать хотя бы цифры или специальные символы")
+
+    def clean(chars: str) -> str:
+        if exclude_ambiguous:
+            return "".join(char for char in chars if char not in AMBIGUOUS_CHARS)
+        return chars
+
+    classes = [
+        (clean(string.ascii_lowercase), min_lowercase),
+        (clean(string.ascii_uppercase), min_uppercase),
+    ]
+    if use_digits:
+        classes.append((clean(string.digits), min_digits))
+    if use_special_chars:
+        classes.append((clean(string.punctuation), min_special))
+
+    return PasswordPolicy(length, tuple(classes), max_repeat, no_sequences)
@@ -0,0 +1,204 @@
+"""
+Модуль пула заранее сгенерированных паролей.
+
+Для каждой комбинации настроек (длина, цифры, спецсимволы) хранится
+кольцевой буфер фиксированного размера с упакованными паролями.
+Выдача пароля - это чтение одного слота буфера за O(1), а пополнение
+пакетами через generate_packed выполняется в фоне: в собственном
+рабочем потоке пула или через переданную функцию schedule (в GUI -
+gui.TaskDispatcher).
+
+Каждый пароль выдается ровно один раз, после чего его слот затирается
+нулями; буферы удаляемых пулов (давно не запрашиваемых, вытесненных и
+закрытых) тоже затираются. Копию, возвращенную вызывающему строкой
+Python, затереть нельзя - пул стирает только свою.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
+from generator.PasswordGeneration import generate_packed
+
+PoolKey = Tuple[int, bool, bool]
+
+DEFAULT_CAPACITY = 1024
+DEFAULT_MAX_POOLS = 8
+DEFAULT_IDLE_TIMEOUT = 300.0
+
+
+class _Ring:
+    """Кольцевой буфер паролей фиксированной длины."""
+
+    __slots__ = ("length", "capacity", "buffer", "head", "size", "last_used")
+
+    def __init__(self, length: int, capacity: int) -> None:
+        self.length = length
+        self.capacity = capacity
+        self.buffer = bytearray(length * capacity)
+        self.head = 0
+        self.size = 0
+        self.last_used = time.monotonic()
+
+    @property
+    def free(self) -> int:
+        return self.capacity - self.size
+
+    def push(self, packed: bytes) -> None:
+        """Добавляет упакованные пароли (не больше свободного места)."""
+        length = self.length
+        count = min(len(packed) // length, self.free)
+        for index in range(count):
+            slot = (self.head + self.size) % self.capacity
+            self.buffer[slot * length:(slot + 1) * length] = \
+                packed[index * length:(index + 1) * length]
+            self.size += 1
+
+    def pop(self) -> str:
+        """Выдает пароль; слот освобождается для следующего пополнения."""
+        start = self.head * self.length
+        password = self.buffer[start:start + self.length].decode("ascii")
+        self.buffer[start:start + self.length] = bytes(self.length)
+        self.head = (self.head + 1) % self.capacity
+        self.size -= 1
+        return password
+
+    def wipe(self) -> None:
+        """Затирает буфер перед удалением."""
+        self.buffer[:] = bytes(len(self.buffer))
+        self.head = self.size = 0
+
+
+class PasswordPool:
+    """
+    Пул паролей с пополнением через внешний исполнитель.
+
+    capacity - размер буфера для одной комбинации настроек;
+    refill_threshold - доля заполнения, ниже которой буфер пополняется;
+    max_pools - максимальное число одновременно хранимых буферов;
+    idle_timeout - через сколько секунд без запросов буфер удаляется;
+    schedule - функция, запускающая задачу пополнения в фоне (вызывается
+    из потока, вызвавшего get). По умолчанию задачи выполняет собственный
+    рабочий поток пула, который останавливается в close.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY,
+                 refill_threshold: float = 0.5,
+                 max_pools: int = DEFAULT_MAX_POOLS,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 schedule: Optional[Callable[[Callable[[], None]], None]] = None) -> None:
+        if capacity < 1:
+            raise ValueError("Размер пула должен быть положительным")
+        if not 0 < refill_threshold <= 1:
+            raise ValueError("Порог пополнения должен быть в интервале (0, 1]")
+        if max_pools < 1:
+            raise ValueError("Число пулов должно быть положительным")
+
+        self.capacity = capacity
+        self.refill_below = max(1, int(capacity * refill_threshold))
+        self.max_pools = max_pools
+        self.idle_timeout = idle_timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if schedule is None:
+            self._executor = ThreadPoolExecutor(max_workers=1,
+                                                thread_name_prefix="password-pool")
+            schedule = self._executor.submit
+        self.schedule = schedule
+        self.pools: "OrderedDict[PoolKey, _Ring]" = OrderedDict()
+        self.lock = threading.Lock()
+        # Задача пополнения уже запланирована и еще не завершилась
+        self.refill_pending = False
+        self.closed = False
+
+    def get(self, length: int = 12, use_digits: bool = True,
+            use_special_chars: bool = True) -> str:
+        """
+        Выдает пароль с заданными настройками.
+
+        Если буфер пуст (например, при первом запросе), пароль генерируется
+        синхронно, а пополнение буфера планируется через schedule.
+        """
+        key = (length, use_digits, use_special_chars)
+        with self.lock:
+            if self.closed:
+                raise RuntimeError("Пул паролей закрыт")
+            ring = self.pools.get(key)
+            if ring is None:
+                # Проверка настроек до создания буфера
+                generate_packed(0, length, use_digits, use_special_chars)
+                ring = self._create(key)
+            else:
+                self.pools.move_to_end(key)
+            ring.last_used = time.monotonic()
+
+            password = ring.pop() if ring.size else None
+            start_refill = ring.size < self.refill_below and not self.refill_pending
+            if start_refill:
+                self.refill_pending = True
+
+        if start_refill:
+            self.schedule(self._refill)
+        if password is None:
+            password = generate_packed(1, length, use_digits,
+                                       use_special_chars).decode("ascii")
+        return password
+
+    def _create(self, key: PoolKey) -> _Ring:
+        """Создает буфер, вытесняя самый давно использованный при переполнении."""
+        while len(self.pools) >= self.max_pools:
+            self.pools.popitem(last=False)[1].wipe()
+        ring = _Ring(key[0], self.capacity)
+        self.pools[key] = ring
+        return ring
+
+    def _next_refill(self) -> Optional[Tuple[PoolKey, int]]:
+        """Выбирает буфер для пополнения и удаляет неиспользуемые (под блокировкой)."""
+        now = time.monotonic()
+        for key in [key for key, ring in self.pools.items()
+                    if now - ring.last_used > self.idle_timeout]:
+            self.pools.pop(key).wipe()
+        for key, ring in self.pools.items():
+            if ring.size < self.refill_below:
+                return key, ring.free
+        return None
+
+    def _refill(self) -> None:
+        """Задача пополнения: заполняет все буферы ниже порога."""
+        while True:
+            with self.lock:
+                task = None if self.closed else self._next_refill()
+                if task is None:
+                    self.refill_pending = False
+                    return
+
+            key, free = task
+            # Генерация выполняется без блокировки, запросы не ждут
+            packed = generate_packed(free, *key)
+
+            with self.lock:
+                ring = self.pools.get(key)
+                if ring is not None:
+                    ring.push(packed)
+
+    def stats(self) -> dict:
+        """Возвращает заполнение буферов: {настройки: число паролей}."""
+        with self.lock:
+            return {key: ring.size for key, ring in self.pools.items()}
+
+    def close(self) -> None:
+        """Останавливает пополнение и освобождает буферы."""
+        with self.lock:
+            self.closed = True
+            for ring in self.pools.values():
+                ring.wipe()
+            self.pools.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "PasswordPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
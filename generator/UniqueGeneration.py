@@ -0,0 +1,57 @@
+"""
+Генерация паролей, которые никогда не выдавались ранее.
+
+Кандидаты генерируются обычным путем (в том числе в пуле процессов
+или по политике), затем отсеиваются по индексу выданных паролей
+utils.IssuedIndex. Отбракованные пароли догенерируются, поэтому
+выдается ровно count новых паролей.
+"""
+
+from typing import Iterator, Optional
+
+from generator.PasswordGeneration import _validate
+from generator.PasswordPolicy import PasswordPolicy
+from utils.IssuedIndex import IssuedIndex
+
+# Число подряд идущих раундов без новых паролей, после которого
+# пространство паролей считается исчерпанным
+MAX_STALLED_ROUNDS = 8
+
+
+def iter_unique_lines(index: IssuedIndex, count: int, length: int = 12,
+                      use_digits: bool = True, use_special_chars: bool = True,
+                      policy: Optional[PasswordPolicy] = None,
+                      workers: Optional[int] = 1) -> Iterator[bytes]:
+    """
+    Генерирует count паролей, отсутствующих в индексе, и регистрирует их.
+
+    Выдает блоки паролей, завершенных переводом строки. Каждый блок
+    регистрируется в индексе до выдачи. При заданной политике пароли
+    генерируются по ней (length и наборы символов берутся из политики).
+    """
+    from generator.ParallelGeneration import iter_parallel_lines, iter_policy_lines
+
+    if policy is None:
+        _validate(length, use_digits, use_special_chars)
+    if count < 0:
+        raise ValueError("Количество паролей не может быть отрицательным")
+
+    remaining = count
+    stalled = 0
+    while remaining > 0:
+        if policy is not None:
+            blocks = iter_policy_lines(policy, remaining, workers)
+        else:
+            blocks = iter_parallel_lines(remaining, length, use_digits,
+                                         use_special_chars, workers)
+        issued = 0
+        for block in blocks:
+            fresh = index.add_new(block.split(b"\n")[:-1])
+            if fresh:
+                issued += len(fresh)
+                yield b"\n".join(fresh) + b"\n"
+        stalled = 0 if issued else stalled + 1
+        if stalled >= MAX_STALLED_ROUNDS:
+            raise ValueError("Не удалось сгенерировать новые пароли: "
+                             "пространство паролей исчерпано")
+        remaining -= issued
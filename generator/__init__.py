@@ -0,0 +1,37 @@
+"""
+Пакет генерации паролей.
+
+Функции модулей пакета доступны как атрибуты пакета и загружаются при
+первом обращении, поэтому "import generator" почти ничего не стоит.
+"""
+
+import importlib
+
+# Атрибут пакета -> модуль, в котором он определен
+_EXPORTS = {
+    "generate_password": "generator.PasswordGeneration",
+    "generate_passwords": "generator.PasswordGeneration",
+    "generate_packed": "generator.PasswordGeneration",
+    "generate_lines": "generator.PasswordGeneration",
+    "iter_passwords": "generator.PasswordGeneration",
+    "PasswordPolicy": "generator.PasswordPolicy",
+    "get_policy": "generator.PasswordPolicy",
+    "generate_passphrase": "generator.Passphrase",
+    "generate_passphrases": "generator.Passphrase",
+    "open_wordlist": "generator.Passphrase",
+    "PasswordPool": "generator.PasswordPool",
+    "iter_parallel_lines": "generator.ParallelGeneration",
+    "write_parallel": "generator.ParallelGeneration",
+    "iter_unique_lines": "generator.UniqueGeneration",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,212 @@
+"""
+Хранилища данных для пакетного просмотра паролей.
+
+Пароли и результаты проверки хранятся в компактных буферах (bytes, mmap,
+array), а не в виджете Tk: таблица окна BulkWindow запрашивает только
+видимые строки. Модуль не зависит от tkinter; длинные операции принимают
+функции progress (доля от 0 до 1) и stopped (проверка отмены).
+"""
+
+import csv
+import mmap
+from array import array
+from typing import Callable, Optional, Tuple
+
+from analyzer.PasswordAnalyzer import analyze_password, get_security_level
+from utils.OrderedPool import imap_ordered, thread_safe_start_method
+
+# Значение в массиве процентов для еще не проверенного пароля
+UNKNOWN = 255
+
+# Как часто длинные операции сообщают о прогрессе и проверяют отмену
+PROGRESS_STEP = 16384
+
+
+def _never_stopped() -> bool:
+    return False
+
+
+def _analyze_chunk(lines: list) -> bytes:
+    """Функция рабочего процесса: проценты пройденных проверок порции."""
+    return bytes(analyze_password(line.decode("utf-8", "replace")).percent
+                 for line in lines)
+
+
+class PackedPasswords:
+    """Пароли одинаковой длины, упакованные подряд в одну строку байт."""
+
+    __slots__ = ("data", "width")
+
+    def __init__(self, data: bytes, width: int) -> None:
+        self.data = data
+        self.width = width
+
+    def __len__(self) -> int:
+        return len(self.data) // self.width
+
+    def raw(self, index: int) -> bytes:
+        offset = index * self.width
+        return self.data[offset:offset + self.width]
+
+    def close(self) -> None:
+        self.data = b""
+
+
+class FilePasswords:
+    """Пароли из текстового файла (по одному в строке), открытого через mmap."""
+
+    __slots__ = ("path", "_file", "_map", "offsets")
+
+    def __init__(self, path: str,
+                 progress: Optional[Callable[[float], None]] = None,
+                 stopped: Callable[[], bool] = _never_stopped) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        self._map: Optional[mmap.mmap] = None
+        # Начала непустых строк, за которыми следуют их концы
+        self.offsets = array("Q")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Пустой файл нельзя отобразить в память
+            return
+        self._index_lines(progress, stopped)
+
+    def _index_lines(self, progress: Optional[Callable[[float], None]],
+                     stopped: Callable[[], bool]) -> None:
+        """Запоминает смещения непустых строк."""
+        data = self._map
+        size = len(data)
+        find = data.find
+        offsets = self.offsets
+        ends = array("Q")
+        start = 0
+        while start < size:
+            end = find(b"\n", start)
+            if end < 0:
+                end = size
+            line_end = end - 1 if end > start and data[end - 1] == 0x0D else end
+            if line_end > start:
+                offsets.append(start)
+                ends.append(line_end)
+            start = end + 1
+            if len(offsets) % PROGRESS_STEP == 0:
+                if stopped():
+                    break
+                if progress is not None:
+                    progress(start / size)
+        offsets.extend(ends)
+
+    def __len__(self) -> int:
+        return len(self.offsets) // 2
+
+    def raw(self, index: int) -> bytes:
+        count = len(self.offsets) // 2
+        return self._map[self.offsets[index]:self.offsets[count + index]]
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+class BulkResults:
+    """Пароли, проценты пройденных проверок и порядок отображения."""
+
+    def __init__(self, passwords) -> None:
+        self.passwords = passwords
+        self.percents = bytearray([UNKNOWN]) * len(passwords)
+        # Порядок строк: None - исходный, иначе массив индексов
+        self.order: Optional[array] = None
+        self.analyzed = False
+
+    def __len__(self) -> int:
+        return len(self.percents)
+
+    def password(self, index: int) -> str:
+        return self.passwords.raw(index).decode("utf-8", "replace")
+
+    def record(self, position: int) -> Tuple[int, str, Optional[int]]:
+        """(номер, пароль, процент или None) для позиции в текущем порядке."""
+        index = self.order[position] if self.order is not None else position
+        percent = self.percents[index]
+        return index + 1, self.password(index), None if percent == UNKNOWN else percent
+
+    def row(self, position: int) -> Tuple[int, str, str, str]:
+        """
+        Строка таблицы для позиции position в текущем порядке.
+
+        Уровень определяется по доле пройденных проверок (не по оценке
+        analyzer.StrengthEstimator): оценка слишком медленна для миллионов строк.
+        """
+        number, password, percent = self.record(position)
+        if percent is None:
+            return number, password, "…", "…"
+        return number, password, get_security_level(percent), f"{percent}%"
+
+    def analyze(self, progress: Optional[Callable[[float], None]] = None,
+                stopped: Callable[[], bool] = _never_stopped,
+                workers: Optional[int] = None) -> None:
+        """
+        Проверяет все пароли (вызывается в фоновом потоке).
+
+        Порции по PROGRESS_STEP паролей проверяются в пуле процессов
+        (при workers == 1 - в текущем процессе). Вызывающий процесс
+        многопоточный (Tk, TaskDispatcher), поэтому процессы запускаются
+        без fork.
+        """
+        percents = self.percents
+        total = len(percents)
+        raw = self.passwords.raw
+        chunks = (([raw(index) for index in range(start, min(start + PROGRESS_STEP, total))],)
+                  for start in range(0, total, PROGRESS_STEP))
+        results = imap_ordered(_analyze_chunk, chunks, workers,
+                               start_method=thread_safe_start_method())
+        start = 0
+        try:
+            for chunk in results:
+                percents[start:start + len(chunk)] = chunk
+                start += len(chunk)
+                if stopped():
+                    return
+                if progress is not None:
+                    progress(start / total)
+        finally:
+            results.close()
+        self.analyzed = True
+
+    def sort_by_strength(self, descending: bool = True) -> array:
+        """
+        Возвращает порядок строк по проценту пройденных проверок.
+
+        Сортировка устойчивая: пароли одного уровня идут в исходном порядке.
+        Результат нужно присвоить order в потоке интерфейса.
+        """
+        percents = self.percents
+        key = (lambda index: -percents[index]) if descending else percents.__getitem__
+        return array("I", sorted(range(len(percents)), key=key))
+
+    def export(self, path: str, progress: Optional[Callable[[float], None]] = None,
+               stopped: Callable[[], bool] = _never_stopped) -> int:
+        """Сохраняет строки в текущем порядке в CSV, возвращает их число."""
+        total = len(self)
+        with open(path, "w", encoding="utf-8", newline="") as stream:
+            writer = csv.writer(stream, lineterminator="\n")
+            writer.writerow(("number", "password", "checks_level", "percent"))
+            for start in range(0, total, PROGRESS_STEP):
+                if stopped():
+                    return start
+                for position in range(start, min(start + PROGRESS_STEP, total)):
+                    number, password, percent = self.record(position)
+                    if percent is None:
+                        writer.writerow((number, password, "", ""))
+                    else:
+                        writer.writerow((number, password,
+                                         get_security_level(percent), percent))
+                if progress is not None:
+                    progress(min(start + PROGRESS_STEP, total) / total)
+        return total
+
+    def close(self) -> None:
+        self.passwords.close()
@@ -0,0 +1,333 @@
+import os
+import threading
+import tkinter as tk
+from tkinter import filedialog, ttk
+from typing import Optional
+
+from gui.BulkStore import BulkResults, FilePasswords, PackedPasswords
+from gui.TaskDispatcher import TaskDispatcher
+
+# Количество строк таблицы: виджет содержит только их, а не все пароли
+VISIBLE_ROWS = 20
+
+# Максимальное количество паролей при генерации
+MAX_COUNT = 10_000_000
+
+# Колонки таблицы: (ключ, заголовок, ширина)
+COLUMNS = (
+    ("number", "№", 90),
+    ("password", "Пароль", 330),
+    ("level", "Уровень проверок", 120),
+    ("percent", "Проверок", 100),
+)
+
+# Цвета строк по уровню безопасности
+LEVEL_TAGS = {
+    "Отличный": "green",
+    "Хороший": "#4CAF50",
+    "Средний": "orange",
+    "Слабый": "red"
+}
+
+
+def generate_results(count: int, length: int, use_digits: bool,
+                     use_special_chars: bool) -> BulkResults:
+    """Генерирует пароли одним упакованным блоком (в фоновом потоке)."""
+    from generator.PasswordGeneration import generate_packed
+
+    packed = generate_packed(count, length, use_digits, use_special_chars)
+    return BulkResults(PackedPasswords(packed, length))
+
+
+class BulkWindow:
+    """
+    Окно пакетной генерации и проверки.
+
+    Таблица виртуальная: в ttk.Treeview всегда VISIBLE_ROWS строк, а при
+    прокрутке меняются только их значения. Пароли и результаты хранятся
+    в gui.BulkStore.
+    """
+
+    def __init__(self, master: tk.Toplevel, length: int = 12,
+                 use_digits: bool = True, use_special_chars: bool = True) -> None:
+        self.master = master
+        self.settings = (length, use_digits, use_special_chars)
+        self.results: Optional[BulkResults] = None
+        self.top = 0
+        self.descending = True
+        # Сигнал остановки длинных операций при замене данных и закрытии
+        self.stop_event = threading.Event()
+        self.setup_window()
+        self.create_widgets()
+        self.dispatcher = TaskDispatcher(
+            self.master,
+            on_busy_change=self.on_busy_change
+        )
+        self.master.bind("<Destroy>", self.on_destroy, add="+")
+
+    def setup_window(self) -> None:
+        self.master.title("📋 Пакетная генерация и проверка")
+        self.master.geometry("760x620")
+        self.master.resizable(False, False)
+        self.master.configure(bg="#f0f0f0")
+
+    def create_widgets(self) -> None:
+        main_frame = ttk.Frame(self.master)
+        main_frame.pack(pady=15, padx=15, fill="both", expand=True)
+
+        controls = ttk.Frame(main_frame)
+        controls.pack(fill="x", pady=(0, 10))
+
+        ttk.Label(controls, text="Количество:").pack(side="left")
+        self.count_var = tk.IntVar(value=100_000)
+        ttk.Spinbox(
+            controls,
+            from_=1,
+            to=MAX_COUNT,
+            increment=100_000,
+            textvariable=self.count_var,
+            width=10
+        ).pack(side="left", padx=5)
+
+        self.buttons = [
+            ttk.Button(controls, text="🔄 Сгенерировать", command=self.generate),
+            ttk.Button(controls, text="📂 Проверить файл...", command=self.open_file),
+            ttk.Button(controls, text="💾 Экспорт...", command=self.export),
+        ]
+        for button in self.buttons:
+            button.pack(side="left", padx=5)
+
+        table_frame = ttk.Frame(main_frame)
+        table_frame.pack(fill="both", expand=True)
+
+        self.table = ttk.Treeview(
+            table_frame,
+            columns=[key for key, _, _ in COLUMNS],
+            show="headings",
+            height=VISIBLE_ROWS,
+            selectmode="browse"
+        )
+        for key, title, width in COLUMNS:
+            self.table.heading(key, text=title)
+            self.table.column(key, width=width, anchor="w" if key == "password" else "e")
+        self.table.heading("percent", command=self.sort_by_strength)
+        self.table.heading("level", command=self.sort_by_strength)
+        for level, color in LEVEL_TAGS.items():
+            self.table.tag_configure(level, foreground=color)
+        for row in range(VISIBLE_ROWS):
+            self.table.insert("", "end", iid=str(row), values=("",) * len(COLUMNS))
+        self.table.pack(side="left", fill="both", expand=True)
+
+        self.scrollbar = ttk.Scrollbar(table_frame, orient="vertical",
+                                       command=self.on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.scrollbar.set(0, 1)
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.table.bind(sequence, self.on_mouse_wheel)
+        self.table.bind("<Up>", lambda e: self.scroll_to(self.top - 1))
+        self.table.bind("<Down>", lambda e: self.scroll_to(self.top + 1))
+        self.table.bind("<Prior>", lambda e: self.scroll_to(self.top - VISIBLE_ROWS))
+        self.table.bind("<Next>", lambda e: self.scroll_to(self.top + VISIBLE_ROWS))
+        self.table.bind("<Home>", lambda e: self.scroll_to(0))
+        self.table.bind("<End>", lambda e: self.scroll_to(self.row_count))
+
+        self.status_label = ttk.Label(main_frame, text="Нет данных")
+        self.status_label.pack(anchor="w", pady=(10, 5))
+
+        self.progress = ttk.Progressbar(main_frame, mode="determinate",
+                                        maximum=1.0, length=300)
+        self.progress.pack(anchor="w")
+
+    @property
+    def row_count(self) -> int:
+        return len(self.results) if self.results is not None else 0
+
+    def scroll_to(self, top: int) -> str:
+        """Прокручивает таблицу так, чтобы первой была строка top."""
+        self.top = max(0, min(top, self.row_count - VISIBLE_ROWS))
+        self.render()
+        # Стандартная обработка клавиш Treeview не нужна
+        return "break"
+
+    def on_scroll(self, action: str, value: str, unit: str = "") -> None:
+        """Обработчик полосы прокрутки (протокол yscrollcommand)."""
+        if action == "moveto":
+            self.scroll_to(int(float(value) * self.row_count))
+        elif action == "scroll":
+            step = VISIBLE_ROWS if unit == "pages" else 1
+            self.scroll_to(self.top + int(value) * step)
+
+    def on_mouse_wheel(self, event: tk.Event) -> str:
+        """Прокрутка колесом мыши (Windows/macOS и X11)."""
+        if event.num == 4 or event.delta > 0:
+            return self.scroll_to(self.top - 3)
+        return self.scroll_to(self.top + 3)
+
+    def render(self) -> None:
+        """Заполняет видимые строки таблицы."""
+        total = self.row_count
+        for row in range(VISIBLE_ROWS):
+            position = self.top + row
+            if position < total:
+                values = self.results.row(position)
+                self.table.item(str(row), values=values, tags=(values[2],))
+            else:
+                self.table.item(str(row), values=("",) * len(COLUMNS), tags=())
+        if total > VISIBLE_ROWS:
+            self.scrollbar.set(self.top / total, (self.top + VISIBLE_ROWS) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def set_results(self, results: BulkResults) -> None:
+        """Показывает новые данные и запускает их проверку в фоне."""
+        self.replace_results(results)
+        self.set_status(f"Паролей: {len(results):,}, проверка...")
+        stop_event = self.stop_event
+        self.dispatcher.submit(
+            "analyze",
+            lambda progress: results.analyze(progress, stop_event.is_set),
+            on_done=lambda _: self.on_analyzed(results),
+            on_error=self.on_error,
+            on_progress=self.on_progress
+        )
+
+    def replace_results(self, results: Optional[BulkResults]) -> None:
+        """
+        Останавливает операции над прежними данными и заменяет их.
+
+        Прежнее хранилище не закрывается явно: отмененная операция может
+        еще работать с ним, и оно освобождается вместе с последней ссылкой.
+        """
+        self.stop_event.set()
+        for key in ("analyze", "sort", "export"):
+            self.dispatcher.cancel(key)
+        self.stop_event = threading.Event()
+        self.results = results
+        self.top = 0
+        self.render()
+
+    def stopped(self) -> bool:
+        return self.stop_event.is_set()
+
+    def generate(self) -> None:
+        """Генерирует пароли с настройками главного окна."""
+        try:
+            count = self.count_var.get()
+        except tk.TclError:
+            self.set_status("Некорректное количество")
+            return
+        if not 1 <= count <= MAX_COUNT:
+            self.set_status(f"Количество должно быть от 1 до {MAX_COUNT:,}")
+            return
+        self.replace_results(None)
+        self.set_status("Генерация...")
+        self.dispatcher.submit(
+            "generate",
+            generate_results,
+            count,
+            *self.settings,
+            on_done=self.set_results,
+            on_error=self.on_error
+        )
+
+    def open_file(self) -> None:
+        """Загружает пароли из файла (по одному в строке) для проверки."""
+        path = filedialog.askopenfilename(
+            parent=self.master,
+            title="Файл с паролями",
+            filetypes=[("Текстовые файлы", "*.txt"), ("Все файлы", "*")]
+        )
+        if not path:
+            return
+        self.replace_results(None)
+        self.set_status(f"Чтение {os.path.basename(path)}...")
+        stop_event = self.stop_event
+        self.dispatcher.submit(
+            "generate",
+            lambda progress: BulkResults(FilePasswords(path, progress,
+                                                       stop_event.is_set)),
+            on_done=self.set_results,
+            on_error=self.on_error,
+            on_progress=self.on_progress
+        )
+
+    def on_analyzed(self, results: BulkResults) -> None:
+        """Обновляет таблицу после проверки всех паролей."""
+        if results is not self.results or not results.analyzed:
+            return
+        self.set_status(f"Паролей: {len(results):,} (сортировка - "
+                        f"щелчок по заголовку «Уровень проверок» или «Проверок»)")
+        self.render()
+
+    def sort_by_strength(self) -> None:
+        """Сортирует по проценту пройденных проверок (повторно - в обратном порядке)."""
+        results = self.results
+        if results is None or not results.analyzed:
+            self.set_status("Сортировка доступна после проверки")
+            return
+
+        def apply(order) -> None:
+            if results is self.results:
+                results.order = order
+                self.descending = not self.descending
+                self.top = 0
+                self.render()
+                self.set_status(f"Паролей: {len(results):,}, отсортировано "
+                                f"{'по убыванию' if order_descending else 'по возрастанию'}")
+
+        order_descending = self.descending
+        self.set_status("Сортировка...")
+        self.dispatcher.submit(
+            "sort",
+            results.sort_by_strength,
+            order_descending,
+            on_done=apply,
+            on_error=self.on_error
+        )
+
+    def export(self) -> None:
+        """Сохраняет все строки в текущем порядке в CSV."""
+        results = self.results
+        if results is None:
+            self.set_status("Нет данных для экспорта")
+            return
+        path = filedialog.asksaveasfilename(
+            parent=self.master,
+            title="Экспорт",
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("Все файлы", "*")]
+        )
+        if not path:
+            return
+        self.set_status("Экспорт...")
+        stop_event = self.stop_event
+        self.dispatcher.submit(
+            "export",
+            lambda progress: results.export(path, progress, stop_event.is_set),
+            on_done=lambda count: self.set_status(
+                f"Сохранено строк: {count:,} в {os.path.basename(path)}"),
+            on_error=self.on_error,
+            on_progress=self.on_progress
+        )
+
+    def set_status(self, text: str) -> None:
+        self.status_label.config(text=text)
+
+    def on_progress(self, fraction: float) -> None:
+        """Обновляет индикатор и видимые строки (по мере проверки)."""
+        self.progress.config(value=fraction)
+        self.render()
+
+    def on_error(self, error: Exception) -> None:
+        self.set_status(f"Ошибка: {error}")
+
+    def on_busy_change(self, busy: bool) -> None:
+        """Сбрасывает индикатор выполнения и блокирует экспорт во время работы."""
+        self.progress.config(value=0)
+        self.buttons[2].state(["disabled"] if busy else ["!disabled"])
+
+    def on_destroy(self, event: tk.Event) -> None:
+        """Останавливает фоновые операции при закрытии окна."""
+        if event.widget is self.master:
+            self.stop_event.set()
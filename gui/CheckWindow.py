@@ -1,15 +1,40 @@
 import tkinter as tk
 from tkinter import ttk
-import string
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+from analyzer.PasswordAnalyzer import (
+    COMMON_PASSWORDS, IncrementalAnalyzer, get_security_level, has_common_sequences
+)
+from analyzer.StrengthEstimator import estimate_strength, get_estimate_level
+from gui.TaskDispatcher import POLL_INTERVAL_MS, TaskDispatcher
+
+# Цвета отображения уровней безопасности
+LEVEL_COLORS = {
+    "Отличный": "green",
+    "Хороший": "#4CAF50",
+    "Средний": "orange",
+    "Слабый": "red"
+}
+
+# Задержка проверки после последнего нажатия клавиши, мс
+DEBOUNCE_MS = 150
 
 
 class CheckWindow:
     def __init__(self, master: tk.Toplevel) -> None:
         self.master = master
+        self.analyzer = IncrementalAnalyzer()
+        self.pending_check: Optional[str] = None
+        # Отображаемые строки результатов: (текст, тег)
+        self.shown_lines: List[Tuple[str, str]] = []
         self.setup_window()
         self.create_widgets()
         self.setup_style()
+        self.setup_live_check()
+        self.dispatcher = TaskDispatcher(
+            self.master,
+            on_busy_change=self.on_busy_change
+        )
 
     def setup_window(self) -> None:
         self.master.title("🔍 Проверка надежности пароля")
@@ -109,6 +134,26 @@ class CheckWindow:
         )
         self.security_level.pack(pady=10)
 
+        # Индикатор фоновой проверки
+        self.progress = ttk.Progressbar(
+            main_frame,
+            mode="indeterminate",
+            length=200
+        )
+        self.progress.pack()
+
+    def setup_live_check(self) -> None:
+        """Настраивает проверку пароля по мере ввода."""
+        self.results_text.tag_config("green", foreground="green")
+        self.results_text.tag_config("red", foreground="red")
+        self.password_var.trace_add("write", self.on_password_change)
+
+    def on_password_change(self, *args) -> None:
+        """Откладывает проверку до паузы во вводе (debounce)."""
+        if self.pending_check is not None:
+            self.master.after_cancel(self.pending_check)
+        self.pending_check = self.master.after(DEBOUNCE_MS, self.check_password)
+
     def toggle_password_visibility(self) -> None:
         """Переключает видимость пароля"""
         show = self.show_password_var.get()
@@ -116,76 +161,80 @@ class CheckWindow:
 
     def check_password(self) -> None:
         """Проверяет пароль по нескольким критериям"""
+        if self.pending_check is not None:
+            self.master.after_cancel(self.pending_check)
+            self.pending_check = None
+
         password = self.password_var.get()
         if not password:
+            self.dispatcher.cancel("check")
             self.show_result("Введите пароль для проверки")
             return
 
+        # Проверка выполняется в фоновом потоке; устаревшие проверки
+        # отменяются диспетчером
+        self.dispatcher.submit(
+            "check",
+            self.evaluate_password,
+            password,
+            on_done=lambda checks: self.display_results(checks, password),
+            on_error=lambda error: self.show_result(f"Ошибка проверки: {error}")
+        )
+
+    def evaluate_password(self, password: str) -> Dict[str, bool]:
+        """
+        Выполняет проверки и оценку стойкости (в фоновом потоке).
+
+        Оценка сохраняется в кэше estimate_strength и при отображении
+        результатов повторно не вычисляется.
+        """
         checks = self.run_security_checks(password)
-        self.display_results(checks, password)
+        estimate_strength(password)
+        return checks
+
+    def on_busy_change(self, busy: bool) -> None:
+        """Запускает или останавливает индикатор выполнения."""
+        if busy:
+            self.progress.start(POLL_INTERVAL_MS)
+        else:
+            self.progress.stop()
 
     def run_security_checks(self, password: str) -> Dict[str, bool]:
         """Выполняет комплексную проверку пароля"""
-        checks = {
-            "length": len(password) >= 12,
-            "lowercase": any(c in string.ascii_lowercase for c in password),
-            "uppercase": any(c in string.ascii_uppercase for c in password),
-            "digits": any(c in string.digits for c in password),
-            "special": any(c in string.punctuation for c in password),
-            "common": password.lower() not in self.get_common_passwords(),
-            "repeats": not any(password[i] == password[i + 1] == password[i + 2]
-                               for i in range(len(password) - 2)),
-            "sequences": not self.has_common_sequences(password)
-        }
-        return checks
+        return self.analyzer.update(password).as_dict()
 
     def get_common_passwords(self) -> List[str]:
         """Возвращает список распространенных паролей"""
-        return [
-            "password", "123456", "qwerty", "admin", "welcome",
-            "12345678", "abc123", "password1", "12345", "123456789"
-        ]
+        return sorted(COMMON_PASSWORDS)
 
     def has_common_sequences(self, password: str) -> bool:
         """Проверяет наличие простых последовательностей"""
-        sequences = [
-            "123", "234", "345", "456", "567", "678", "789",
-            "qwe", "wer", "ert", "rty", "tyu", "yui", "uio", "iop",
-            "asd", "sdf", "dfg", "fgh", "ghj", "hjk", "jkl",
-            "zxc", "xcv", "cvb", "vbn", "bnm"
-        ]
-        lower_pass = password.lower()
-        return any(seq in lower_pass for seq in sequences)
+        return has_common_sequences(password)
 
     def display_results(self, checks: Dict[str, bool], password: str) -> None:
-        """Отображает результаты проверки"""
-        self.results_text.config(state="normal")
-        self.results_text.delete(1.0, tk.END)
+        """
+        Отображает результаты проверки.
 
+        Перерисовываются только строки, текст или статус которых изменился.
+        """
         # Подсчет выполненных проверок
         passed = sum(checks.values())
         total = len(checks)
         security_percent = int((passed / total) * 100)
 
-        # Определение уровня безопасности
-        if security_percent >= 90:
-            level = "Отличный"
-            color = "green"
-        elif security_percent >= 70:
-            level = "Хороший"
-            color = "#4CAF50"
-        elif security_percent >= 50:
-            level = "Средний"
-            color = "orange"
-        else:
-            level = "Слабый"
-            color = "red"
+        # Определение уровня безопасности по оценке числа попыток подбора
+        estimate = estimate_strength(password)
+        level = get_estimate_level(estimate)
+        color = LEVEL_COLORS[level]
 
-        # Отображение уровня безопасности
-        self.security_level.config(
-            text=f"Уровень безопасности: {level} ({security_percent}%)",
-            foreground=color
-        )
+        # Отображение уровня безопасности; уровень по проверкам (как в
+        # пакетном окне, аудите и HTTP-сервисе) подписан отдельно
+        level_text = (f"Уровень безопасности: {level} "
+                      f"(≈{estimate.entropy_bits:.0f} бит)\n"
+                      f"Уровень проверок: {get_security_level(security_percent)} "
+                      f"(пройдено {security_percent}%)")
+        if self.security_level.cget("text") != level_text:
+            self.security_level.config(text=level_text, foreground=color)
 
         # Детали проверки
         check_details = {
@@ -199,18 +248,24 @@ class CheckWindow:
             "sequences": "Нет простых последовательностей"
         }
 
-        for check, passed in checks.items():
-            status = "✓" if passed else "✗"
-            color = "green" if passed else "red"
-            self.results_text.insert(
-                tk.END,
-                f"{status} {check_details[check]}\n",
-                "green" if passed else "red"
-            )
+        lines = [
+            (f"{'✓' if passed else '✗'} {check_details[check]}",
+             "green" if passed else "red")
+            for check, passed in checks.items()
+        ]
 
-        self.results_text.tag_config("green", foreground="green")
-        self.results_text.tag_config("red", foreground="red")
+        self.results_text.config(state="normal")
+        if len(lines) != len(self.shown_lines):
+            self.results_text.delete(1.0, tk.END)
+            for text, tag in lines:
+                self.results_text.insert(tk.END, f"{text}\n", tag)
+        else:
+            for row, (line, shown) in enumerate(zip(lines, self.shown_lines), 1):
+                if line != shown:
+                    self.results_text.delete(f"{row}.0", f"{row}.end")
+                    self.results_text.insert(f"{row}.0", line[0], line[1])
         self.results_text.config(state="disabled")
+        self.shown_lines = lines
 
     def show_result(self, message: str) -> None:
         """Показывает простое сообщение"""
@@ -218,4 +273,5 @@ class CheckWindow:
         self.results_text.delete(1.0, tk.END)
         self.results_text.insert(tk.END, message)
         self.results_text.config(state="disabled")
-        self.security_level.config(text="", foreground="black")
\ No newline at end of file
+        self.security_level.config(text="", foreground="black")
+        self.shown_lines = []
@@ -0,0 +1,113 @@
+import tkinter as tk
+from tkinter import filedialog, ttk
+
+from utils import Metrics
+
+# Период обновления таблицы метрик, мс
+REFRESH_MS = 1000
+
+# Колонки таблицы: (ключ, заголовок, ширина)
+COLUMNS = (
+    ("count", "Вызовов", 80),
+    ("errors", "Ошибок", 60),
+    ("mean_ns", "Среднее, мкс", 100),
+    ("p50_ns", "p50, мкс", 80),
+    ("p99_ns", "p99, мкс", 80),
+    ("max_ns", "Макс., мкс", 90),
+)
+
+
+class DiagnosticsWindow:
+    """Панель диагностики: счетчики и задержки горячих путей."""
+
+    def __init__(self, master: tk.Toplevel) -> None:
+        self.master = master
+        self.refresh_id = None
+        self.setup_window()
+        self.create_widgets()
+        self.refresh()
+        self.master.bind("<Destroy>", self.on_destroy, add="+")
+
+    def setup_window(self) -> None:
+        self.master.title("📊 Диагностика")
+        self.master.geometry("720x360")
+        self.master.configure(bg="#f0f0f0")
+
+    def create_widgets(self) -> None:
+        main_frame = ttk.Frame(self.master)
+        main_frame.pack(pady=15, padx=15, fill="both", expand=True)
+
+        controls = ttk.Frame(main_frame)
+        controls.pack(fill="x", pady=(0, 10))
+
+        self.enabled_var = tk.BooleanVar(value=Metrics.is_enabled())
+        ttk.Checkbutton(
+            controls,
+            text="Сбор метрик",
+            variable=self.enabled_var,
+            command=lambda: Metrics.enable(self.enabled_var.get())
+        ).pack(side="left")
+
+        ttk.Button(
+            controls,
+            text="Экспорт...",
+            command=self.export
+        ).pack(side="right", padx=5)
+
+        ttk.Button(
+            controls,
+            text="Сбросить",
+            command=self.reset
+        ).pack(side="right", padx=5)
+
+        self.table = ttk.Treeview(
+            main_frame,
+            columns=[key for key, _, _ in COLUMNS],
+            height=10
+        )
+        self.table.heading("#0", text="Операция")
+        self.table.column("#0", width=180)
+        for key, title, width in COLUMNS:
+            self.table.heading(key, text=title)
+            self.table.column(key, width=width, anchor="e")
+        self.table.pack(fill="both", expand=True)
+
+    def refresh(self) -> None:
+        """Обновляет таблицу, изменяя только строки с новыми значениями."""
+        stats = Metrics.get_stats()
+        for name, values in stats.items():
+            row = tuple(
+                values[key] if key in ("count", "errors")
+                else f"{values[key] / 1000:.2f}"
+                for key, _, _ in COLUMNS
+            )
+            if not self.table.exists(name):
+                self.table.insert("", "end", iid=name, text=name, values=row)
+            elif tuple(self.table.item(name, "values")) != tuple(map(str, row)):
+                self.table.item(name, values=row)
+        for name in self.table.get_children():
+            if name not in stats:
+                self.table.delete(name)
+        self.refresh_id = self.master.after(REFRESH_MS, self.refresh)
+
+    def reset(self) -> None:
+        """Сбрасывает собранные метрики."""
+        Metrics.reset()
+        self.table.delete(*self.table.get_children())
+
+    def export(self) -> None:
+        """Сохраняет метрики в формате Prometheus."""
+        path = filedialog.asksaveasfilename(
+            parent=self.master,
+            title="Экспорт метрик",
+            defaultextension=".prom",
+            filetypes=[("Prometheus", "*.prom"), ("Все файлы", "*")]
+        )
+        if path:
+            Metrics.write_prometheus(path)
+
+    def on_destroy(self, event: tk.Event) -> None:
+        """Останавливает обновление при закрытии окна."""
+        if event.widget is self.master and self.refresh_id is not None:
+            self.master.after_cancel(self.refresh_id)
+            self.refresh_id = None
@@ -1,8 +1,20 @@
+import os
 import tkinter as tk
-from tkinter import ttk
-from generator.PasswordGeneration import generate_password
-from utils.Clipboard import copy_to_clipboard
-from gui.CheckWindow import CheckWindow  # Импортируем класс окна проверки
+from tkinter import filedialog, ttk
+from generator.PasswordPool import PasswordPool
+from gui.TaskDispatcher import POLL_INTERVAL_MS, TaskDispatcher
+
+
+def generate_passphrase(wordlist_path: str, words: int) -> str:
+    """Генерирует парольную фразу (вызывается в фоновом потоке)."""
+    from generator.Passphrase import generate_passphrase, open_wordlist
+
+    return generate_passphrase(open_wordlist(wordlist_path), words)
+
+
+# Размер пула паролей для каждой комбинации настроек
+POOL_CAPACITY = 64
+
 
 class MainWindow:
     def __init__(self, master: tk.Tk) -> None:
@@ -11,10 +23,25 @@ class MainWindow:
         self.setup_style()
         self.create_widgets()
         self.setup_bindings()
+        self.dispatcher = TaskDispatcher(
+            self.master,
+            on_busy_change=self.on_busy_change
+        )
+        # Пул заранее сгенерированных паролей: F5 и кнопка отвечают сразу.
+        # Пополнение идет через отдельный диспетчер, чтобы не включать
+        # индикатор выполнения
+        self.pool_dispatcher = TaskDispatcher(self.master)
+        self.password_pool = PasswordPool(
+            capacity=POOL_CAPACITY,
+            schedule=lambda job: self.pool_dispatcher.submit(
+                "refill", job, on_done=lambda _: None
+            )
+        )
+        self.master.bind("<Destroy>", self.on_destroy, add="+")
 
     def setup_window(self) -> None:
         self.master.title("🔐 Генератор паролей PRO")
-        self.master.geometry("800x600")
+        self.master.geometry("800x700")
         self.master.resizable(False, False)
         self.master.configure(bg="#f0f0f0")
         self.center_window()
@@ -78,8 +105,25 @@ class MainWindow:
             style="Nav.TButton"
         ).pack(side="right")
 
+        ttk.Button(
+            nav_frame,
+            text="📋 Пакетный режим",
+            command=self.open_bulk_window,
+            style="Nav.TButton"
+        ).pack(side="right", padx=(0, 10))
+
+        ttk.Button(
+            nav_frame,
+            text="📊 Диагностика",
+            command=self.open_diagnostics_window,
+            style="Nav.TButton"
+        ).pack(side="right", padx=(0, 10))
+
     def open_check_window(self) -> None:
         """Открывает окно проверки пароля"""
+        # Окно проверки и анализатор загружаются при первом открытии
+        from gui.CheckWindow import CheckWindow
+
         # Создаем новое окно
         check_window = tk.Toplevel(self.master)
         CheckWindow(check_window)  # Инициализируем окно проверки
@@ -88,6 +132,26 @@ class MainWindow:
         check_window.transient(self.master)
         check_window.grab_set()
 
+    def open_bulk_window(self) -> None:
+        """Открывает окно пакетной генерации и проверки"""
+        from gui.BulkWindow import BulkWindow
+
+        try:
+            settings = (self.length_var.get(), self.digits_var.get(),
+                        self.symbols_var.get())
+        except tk.TclError:
+            settings = ()
+        bulk_window = tk.Toplevel(self.master)
+        BulkWindow(bulk_window, *settings)
+        bulk_window.transient(self.master)
+
+    def open_diagnostics_window(self) -> None:
+        """Открывает панель диагностики (счетчики и задержки)"""
+        from gui.DiagnosticsWindow import DiagnosticsWindow
+
+        diagnostics_window = tk.Toplevel(self.master)
+        DiagnosticsWindow(diagnostics_window)
+        diagnostics_window.transient(self.master)
 
     def create_header(self) -> None:
         """Создает заголовок приложения."""
@@ -115,13 +179,20 @@ class MainWindow:
         self.password_entry.pack(pady=10, ipady=8)
 
     def create_generate_button(self) -> None:
-        """Создает кнопку генерации пароля."""
+        """Создает кнопку генерации пароля и индикатор выполнения."""
         ttk.Button(
             self.main_frame,
             text="🔄 Сгенерировать пароль",
             command=self.on_generate_click,
             style="TButton"
-        ).pack(pady=20)
+        ).pack(pady=(20, 5))
+
+        self.progress = ttk.Progressbar(
+            self.main_frame,
+            mode="indeterminate",
+            length=200
+        )
+        self.progress.pack(pady=(0, 10))
 
     def create_control_panel(self) -> None:
         """Создает панель управления с настройками."""
@@ -134,6 +205,9 @@ class MainWindow:
         # Чекбоксы настроек
         self.create_checkboxes(control_frame)
 
+        # Режим парольной фразы
+        self.create_passphrase_controls(control_frame)
+
         # Кнопка копирования
         self.create_copy_button(control_frame)
 
@@ -177,6 +251,54 @@ class MainWindow:
             style="TCheckbutton"
         ).grid(row=1, column=1, padx=5, pady=5, sticky="w")
 
+    def create_passphrase_controls(self, parent: ttk.Frame) -> None:
+        """Создает элементы управления режимом парольной фразы."""
+        self.passphrase_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            parent,
+            text="Парольная фраза, слов:",
+            variable=self.passphrase_var,
+            style="TCheckbutton"
+        ).grid(row=2, column=0, padx=5, pady=5, sticky="w")
+
+        self.words_var = tk.IntVar(value=6)
+        ttk.Spinbox(
+            parent,
+            from_=3,
+            to=12,
+            textvariable=self.words_var,
+            width=5,
+            font=("Arial", 10),
+            wrap=True
+        ).grid(row=2, column=1, padx=5, sticky="w")
+
+        self.wordlist_path = os.environ.get("PASSGEN_WORDLIST", "")
+        self.wordlist_label = ttk.Label(
+            parent,
+            text=os.path.basename(self.wordlist_path) or "Словарь не выбран",
+            font=("Arial", 9)
+        )
+        self.wordlist_label.grid(row=3, column=1, padx=5, sticky="w")
+
+        ttk.Button(
+            parent,
+            text="📖 Словарь...",
+            command=self.choose_wordlist,
+            style="Nav.TButton"
+        ).grid(row=3, column=0, padx=5, pady=5, sticky="w")
+
+    def choose_wordlist(self) -> None:
+        """Выбирает словарь для парольных фраз."""
+        path = filedialog.askopenfilename(
+            parent=self.master,
+            title="Словарь для парольных фраз",
+            filetypes=[("Словари", "*.txt *.pgwl"), ("Все файлы", "*")]
+        )
+        if path:
+            self.wordlist_path = path
+            self.wordlist_label.config(text=os.path.basename(path))
+            self.passphrase_var.set(True)
+
     def create_copy_button(self, parent: ttk.Frame) -> None:
         """Создает кнопку копирования пароля."""
         ttk.Button(
@@ -184,7 +306,7 @@ class MainWindow:
             text="📋 Копировать",
             command=self.handle_copy,
             style="TButton"
-        ).grid(row=2, columnspan=2, pady=10)
+        ).grid(row=4, columnspan=2, pady=10)
 
     def setup_bindings(self) -> None:
         """Настраивает обработчики событий."""
@@ -198,25 +320,66 @@ class MainWindow:
         """
         Обработчик нажатия кнопки генерации пароля.
 
-        Генерирует новый пароль с текущими настройками и отображает его.
+        Пароль берется из пула (пополняется в фоне). Парольная фраза
+        генерируется в фоновом потоке; предыдущая незавершенная генерация
+        отменяется.
         """
         try:
-            password = generate_password(
-                length=self.length_var.get(),
-                use_digits=self.digits_var.get(),
-                use_special_chars=self.symbols_var.get()
-            )
-            self.password_var.set(password)
-        except Exception as e:
-            self.password_var.set("Ошибка генерации!")
-            self.master.after(2000, lambda: self.password_var.set(""))
+            if not self.passphrase_var.get():
+                self.dispatcher.cancel("generate")
+                self.password_var.set(self.password_pool.get(
+                    self.length_var.get(),
+                    self.digits_var.get(),
+                    self.symbols_var.get()
+                ))
+                return
+
+            if not self.wordlist_path:
+                self.choose_wordlist()
+                if not self.wordlist_path:
+                    return
+            settings = (self.wordlist_path, self.words_var.get())
+        except (tk.TclError, ValueError) as e:
+            self.on_generate_error(e)
+            return
+
+        self.dispatcher.submit(
+            "generate",
+            generate_passphrase,
+            *settings,
+            on_done=self.password_var.set,
+            on_error=self.on_generate_error
+        )
+
+    def on_destroy(self, event: tk.Event) -> None:
+        """Останавливает пул паролей при закрытии окна."""
+        if event.widget is self.master:
+            self.password_pool.close()
+
+    def on_generate_error(self, error: Exception) -> None:
+        """Показывает сообщение об ошибке генерации."""
+        self.password_var.set("Ошибка генерации!")
+        self.master.after(2000, lambda: self.password_var.set(""))
+
+    def on_busy_change(self, busy: bool) -> None:
+        """Запускает или останавливает индикатор выполнения."""
+        if busy:
+            self.progress.start(POLL_INTERVAL_MS)
+        else:
+            self.progress.stop()
 
     def handle_copy(self) -> None:
         """
         Обработчик копирования пароля в буфер обмена.
 
         При успешном копировании временно меняет цвет текста на зеленый.
+        Модуль буфера обмена загружается при первом копировании.
         """
+        from utils.Clipboard import copy_to_clipboard, get_tk_root, use_tk_root
+
+        if get_tk_root() is not self.master:
+            use_tk_root(self.master)
+
         if self.password_var.get():
             if copy_to_clipboard(self.password_var.get()):
                 original_color = self.password_entry.cget("foreground")
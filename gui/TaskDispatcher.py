@@ -0,0 +1,151 @@
+"""
+Модуль фонового выполнения задач для графического интерфейса.
+
+Тяжелые операции (генерация, проверка, оценка стойкости) выполняются
+в пуле потоков, а результаты доставляются в поток Tk через очередь,
+которую главный цикл опрашивает с помощью master.after. Новая задача
+с тем же ключом отменяет предыдущую: если та еще не началась, она
+снимается с очереди, иначе ее результат просто отбрасывается.
+"""
+
+import queue
+import tkinter as tk
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Период опроса очереди результатов (около 60 кадров в секунду), мс
+POLL_INTERVAL_MS = 16
+
+
+class TaskDispatcher:
+    """Диспетчер фоновых задач, привязанный к окну Tk."""
+
+    def __init__(self, master: tk.Misc, max_workers: int = 1,
+                 executor: Optional[Executor] = None,
+                 on_busy_change: Optional[Callable[[bool], None]] = None) -> None:
+        self.master = master
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="passgen-task"
+        )
+        self.on_busy_change = on_busy_change
+        self.results: "queue.Queue[Tuple[str, int, str, Any]]" = queue.Queue()
+        # Для каждого ключа: (номер поколения, future, обработчики)
+        self.active: Dict[str, Tuple[int, Future, Callable, Optional[Callable],
+                                     Optional[Callable]]] = {}
+        self.generation = 0
+        self.poll_id: Optional[str] = None
+        self.master.bind("<Destroy>", self.on_destroy, add="+")
+
+    @property
+    def busy(self) -> bool:
+        """Есть ли задачи в работе."""
+        return bool(self.active)
+
+    def submit(self, key: str, function: Callable[..., Any], *args: Any,
+               on_done: Callable[[Any], None],
+               on_error: Optional[Callable[[Exception], None]] = None,
+               on_progress: Optional[Callable[[float], None]] = None) -> None:
+        """
+        Запускает function(*args) в фоне.
+
+        Обработчики on_done, on_error и on_progress вызываются в потоке Tk.
+        Если задан on_progress, функции передается именованный аргумент
+        progress - вызываемый объект, принимающий долю выполнения от 0 до 1.
+        """
+        was_busy = self.busy
+        previous = self.active.pop(key, None)
+        if previous is not None:
+            previous[1].cancel()
+
+        self.generation += 1
+        generation = self.generation
+        kwargs = {}
+        if on_progress is not None:
+            kwargs["progress"] = lambda fraction: self.results.put(
+                (key, generation, "progress", fraction)
+            )
+
+        future = self.executor.submit(function, *args, **kwargs)
+        self.active[key] = (generation, future, on_done, on_error, on_progress)
+        future.add_done_callback(
+            lambda done: self._collect(key, generation, done)
+        )
+
+        if not was_busy:
+            self._notify_busy(True)
+        if self.poll_id is None:
+            self.poll_id = self.master.after(POLL_INTERVAL_MS, self.poll)
+
+    def cancel(self, key: str) -> None:
+        """Отменяет задачу с ключом key (ее результат будет отброшен)."""
+        entry = self.active.pop(key, None)
+        if entry is not None:
+            entry[1].cancel()
+            if not self.active:
+                self._notify_busy(False)
+
+    def _collect(self, key: str, generation: int, future: Future) -> None:
+        """Вызывается в рабочем потоке: кладет результат в очередь."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.results.put((key, generation, "error", error))
+        else:
+            self.results.put((key, generation, "done", future.result()))
+
+    def poll(self) -> None:
+        """Доставляет накопившиеся результаты в поток Tk."""
+        self.poll_id = None
+        while True:
+            try:
+                key, generation, kind, payload = self.results.get_nowait()
+            except queue.Empty:
+                break
+
+            entry = self.active.get(key)
+            if entry is None or entry[0] != generation:
+                # Результат отмененной или замененной задачи
+                continue
+
+            _, _, on_done, on_error, on_progress = entry
+            if kind == "progress":
+                if on_progress is not None:
+                    on_progress(payload)
+                continue
+
+            del self.active[key]
+            if not self.active:
+                self._notify_busy(False)
+            if kind == "done":
+                on_done(payload)
+            elif on_error is not None:
+                on_error(payload)
+
+        if self.active:
+            self.poll_id = self.master.after(POLL_INTERVAL_MS, self.poll)
+
+    def _notify_busy(self, busy: bool) -> None:
+        """Сообщает окну о начале или завершении фоновой работы."""
+        if self.on_busy_change is not None:
+            self.on_busy_change(busy)
+
+    def on_destroy(self, event: tk.Event) -> None:
+        """Останавливает пул при закрытии окна."""
+        if event.widget is not self.master:
+            return
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Отменяет все задачи и останавливает пул."""
+        if self.poll_id is not None:
+            try:
+                self.master.after_cancel(self.poll_id)
+            except tk.TclError:
+                pass
+            self.poll_id = None
+        for _, future, *_ in self.active.values():
+            future.cancel()
+        self.active.clear()
+        self.executor.shutdown(wait=False, cancel_futures=True)
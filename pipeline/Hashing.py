@@ -0,0 +1,210 @@
+"""
+Модуль параллельного хеширования паролей для выгрузки учетных записей.
+
+Пароли (сгенерированные или прочитанные из файла) делятся на порции
+и хешируются медленной функцией (PBKDF2 или scrypt из hashlib) в пуле
+процессов. Для каждой записи рабочий процесс создает собственную соль
+через os.urandom и возвращает уже отформатированный блок CSV или
+JSON Lines с полями id, hash, salt и scheme. В памяти одновременно
+находится ограниченное число порций, поэтому расход памяти не зависит
+от количества записей.
+
+Поле scheme описывает алгоритм и параметры стоимости, например
+"pbkdf2-sha256:i=600000" или "scrypt:n=32768,r=8,p=1"; хеш и соль
+записываются в шестнадцатеричном виде.
+"""
+
+import csv
+import hashlib
+import hmac
+import io
+import json
+import os
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from utils.Constants import HASH_ALGORITHMS, OUTPUT_FORMATS
+from utils.OrderedPool import imap_ordered
+
+# Параметры стоимости по умолчанию (рекомендации OWASP)
+DEFAULT_ITERATIONS = {"pbkdf2-sha256": 600_000, "pbkdf2-sha512": 210_000}
+DEFAULT_SCRYPT = (1 << 15, 8, 1)
+
+# Длина соли и хеша, байт
+SALT_BYTES = 16
+HASH_BYTES = 32
+
+# Количество записей в одной порции: медленный хеш занимает
+# сотни миллисекунд, поэтому порции небольшие
+CHUNK_RECORDS = 32
+
+
+class HashScheme:
+    """Алгоритм медленного хеширования и его параметры стоимости."""
+
+    __slots__ = ("algorithm", "iterations", "n", "r", "p", "salt_bytes")
+
+    def __init__(self, algorithm: str = "pbkdf2-sha256",
+                 iterations: Optional[int] = None, n: int = DEFAULT_SCRYPT[0],
+                 r: int = DEFAULT_SCRYPT[1], p: int = DEFAULT_SCRYPT[2],
+                 salt_bytes: int = SALT_BYTES) -> None:
+        if algorithm not in HASH_ALGORITHMS:
+            raise ValueError(f"Неизвестный алгоритм хеширования: {algorithm}")
+        if algorithm == "scrypt":
+            if n < 2 or n & (n - 1):
+                raise ValueError("Параметр n для scrypt должен быть степенью двойки")
+            if r < 1 or p < 1:
+                raise ValueError("Параметры r и p для scrypt должны быть положительными")
+            iterations = None
+        else:
+            if iterations is None:
+                iterations = DEFAULT_ITERATIONS[algorithm]
+            if iterations < 1:
+                raise ValueError("Число итераций должно быть положительным")
+        if not 8 <= salt_bytes <= 64:
+            raise ValueError("Длина соли должна быть от 8 до 64 байт")
+        self.algorithm = algorithm
+        self.iterations = iterations
+        self.n = n
+        self.r = r
+        self.p = p
+        self.salt_bytes = salt_bytes
+
+    def hash(self, password: bytes, salt: bytes) -> bytes:
+        """Вычисляет хеш пароля с заданной солью."""
+        if self.algorithm == "scrypt":
+            # Памяти scrypt нужно 128 * r * (n + p + 2) байт; без явного
+            # maxmem OpenSSL ограничивает ее 32 МБ
+            maxmem = 128 * self.r * (self.n + self.p + 2) + (1 << 20)
+            return hashlib.scrypt(password, salt=salt, n=self.n, r=self.r,
+                                  p=self.p, maxmem=maxmem, dklen=HASH_BYTES)
+        digest = self.algorithm.split("-", 1)[1]
+        return hashlib.pbkdf2_hmac(digest, password, salt, self.iterations,
+                                   dklen=HASH_BYTES)
+
+    def describe(self) -> str:
+        """Возвращает строку схемы для поля scheme."""
+        if self.algorithm == "scrypt":
+            return f"scrypt:n={self.n},r={self.r},p={self.p}"
+        return f"{self.algorithm}:i={self.iterations}"
+
+    @classmethod
+    def parse(cls, text: str) -> "HashScheme":
+        """Восстанавливает схему из строки describe()."""
+        algorithm, _, params = text.partition(":")
+        try:
+            values = dict(item.split("=", 1) for item in params.split(",") if item)
+            if algorithm == "scrypt":
+                return cls(algorithm, n=int(values["n"]), r=int(values["r"]),
+                           p=int(values["p"]))
+            return cls(algorithm, iterations=int(values["i"]))
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"Некорректная схема хеширования: {text}") from e
+
+    def __repr__(self) -> str:
+        return f"HashScheme({self.describe()!r})"
+
+
+def verify_password(password: str, scheme: str, salt_hex: str, hash_hex: str) -> bool:
+    """Проверяет пароль по записи выгрузки (scheme, salt, hash)."""
+    expected = bytes.fromhex(hash_hex)
+    actual = HashScheme.parse(scheme).hash(password.encode("utf-8"),
+                                           bytes.fromhex(salt_hex))
+    return hmac.compare_digest(actual, expected)
+
+
+def hash_chunk(records: List[Tuple[str, str]], scheme: HashScheme,
+               output_format: str, with_password: bool) -> bytes:
+    """
+    Функция рабочего процесса: хеширует порцию записей (id, пароль).
+
+    Возвращает отформатированные строки результата.
+    """
+    described = scheme.describe()
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n") if output_format == "csv" else None
+
+    for record_id, password in records:
+        salt = os.urandom(scheme.salt_bytes)
+        digest = scheme.hash(password.encode("utf-8"), salt).hex()
+        if writer is not None:
+            row = [record_id, digest, salt.hex(), described]
+            if with_password:
+                row.append(password)
+            writer.writerow(row)
+        else:
+            record = {"id": record_id, "hash": digest, "salt": salt.hex(),
+                      "scheme": described}
+            if with_password:
+                record["password"] = password
+            buffer.write(json.dumps(record, ensure_ascii=False))
+            buffer.write("\n")
+
+    return buffer.getvalue().encode("utf-8")
+
+
+def csv_header(with_password: bool) -> bytes:
+    """Возвращает строку заголовка CSV."""
+    columns = ["id", "hash", "salt", "scheme"]
+    if with_password:
+        columns.append("password")
+    return (",".join(columns) + "\n").encode("utf-8")
+
+
+def iter_hashed(records: Iterable[Tuple[str, str]], scheme: HashScheme,
+                output_format: str = "csv", with_password: bool = False,
+                workers: Optional[int] = None,
+                chunk_records: int = CHUNK_RECORDS) -> Iterator[bytes]:
+    """
+    Хеширует записи (id, пароль) в пуле процессов.
+
+    Выдает блоки результатов в исходном порядке (заголовок CSV не
+    включается, см. csv_header).
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Неизвестный формат вывода: {output_format}")
+    if chunk_records < 1:
+        raise ValueError("Размер порции должен быть положительным")
+
+    def chunks() -> Iterator[Tuple]:
+        chunk: List[Tuple[str, str]] = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= chunk_records:
+                yield chunk, scheme, output_format, with_password
+                chunk = []
+        if chunk:
+            yield chunk, scheme, output_format, with_password
+
+    return imap_ordered(hash_chunk, chunks(), workers)
+
+
+def iter_generated_records(count: int, length: int = 12, use_digits: bool = True,
+                           use_special_chars: bool = True,
+                           first_id: int = 1) -> Iterator[Tuple[str, str]]:
+    """Генерирует записи (id, пароль) с последовательными номерами."""
+    from generator.PasswordGeneration import iter_passwords
+
+    for number, password in enumerate(
+            iter_passwords(count, length, use_digits, use_special_chars), first_id):
+        yield str(number), password
+
+
+def iter_file_records(lines: Iterable[bytes],
+                      with_ids: bool = False) -> Iterator[Tuple[str, str]]:
+    """
+    Читает записи из строк файла.
+
+    Без with_ids каждая непустая строка - пароль, а id - номер строки.
+    С with_ids строка имеет вид "id<TAB>пароль".
+    """
+    for number, raw in enumerate(lines, 1):
+        line = raw.rstrip(b"\r\n").decode("utf-8", "replace")
+        if not line:
+            continue
+        if with_ids:
+            record_id, tab, password = line.partition("\t")
+            if not tab:
+                raise ValueError(f"Строка {number}: ожидается \"id<TAB>пароль\"")
+            yield record_id, password
+        else:
+            yield str(number), line
@@ -0,0 +1,375 @@
+"""
+Локальный HTTP/JSON сервис генерации и проверки паролей на asyncio.
+
+Конечные точки:
+
+    POST /generate  {"count": 10, "length": 12, "digits": true, "special": true}
+                    -> {"passwords": [...]}
+    POST /check     {"passwords": ["...", ...]}
+                    -> {"results": [{"checks_level": ..., "percent": ..., <проверки>}]}
+    GET  /health    -> {"status": "ok", "pending": N}
+
+checks_level - уровень по доле пройденных проверок (get_security_level),
+а не по оценке числа попыток подбора (analyzer.StrengthEstimator).
+
+Мелкие одновременные запросы объединяются: они попадают в ограниченную
+очередь, из которой пакетировщик забирает все накопившиеся задания и
+выполняет их одним вызовом generate_packed (для каждой комбинации
+настроек) или одним проходом анализатора. Если очередь заполнена,
+сервис отвечает 503 с заголовком Retry-After (обратное давление).
+Соединения HTTP/1.1 по умолчанию остаются открытыми (keep-alive).
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from analyzer.PasswordAnalyzer import analyze_password, get_security_level
+from generator.PasswordGeneration import generate_packed
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Ограничения запросов
+MAX_HEADER_SIZE = 16 * 1024
+MAX_BODY_SIZE = 1024 * 1024
+MAX_GENERATE_COUNT = 10_000
+MAX_CHECK_COUNT = 10_000
+MIN_GENERATE_LENGTH = 8
+MAX_GENERATE_LENGTH = 1024
+# Наибольшее число символов (count * length) в одном запросе генерации
+MAX_GENERATE_CHARS = 1 << 20
+
+# Максимальное число заданий в очереди пакетировщика
+MAX_PENDING = 4096
+# Наибольший объем одного пакета: символов при генерации и паролей при
+# проверке. Задания сверх него переходят в следующий пакет
+MAX_BATCH_CHARS = 4 << 20
+MAX_BATCH_PASSWORDS = 100_000
+# Время накопления пакета после первого задания, с
+BATCH_WINDOW = 0.002
+
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 413: "Payload Too Large",
+    500: "Internal Server Error", 503: "Service Unavailable",
+}
+
+
+class HttpError(Exception):
+    """Ошибка обработки запроса с кодом ответа HTTP."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _run_generate(jobs: List[Tuple[Tuple[int, bool, bool], int]]) -> List[Any]:
+    """Выполняет пакет заданий генерации (группируя по настройкам)."""
+    totals: Dict[Tuple[int, bool, bool], int] = {}
+    for settings, count in jobs:
+        totals[settings] = totals.get(settings, 0) + count
+
+    blocks: Dict[Tuple[int, bool, bool], Tuple[str, int]] = {}
+    errors: Dict[Tuple[int, bool, bool], Exception] = {}
+    for settings, total in totals.items():
+        try:
+            blocks[settings] = (generate_packed(total, *settings).decode("ascii"), 0)
+        except ValueError as e:
+            errors[settings] = e
+
+    results: List[Any] = []
+    for settings, count in jobs:
+        if settings in errors:
+            results.append(errors[settings])
+            continue
+        text, offset = blocks[settings]
+        length = settings[0]
+        results.append([text[position:position + length]
+                        for position in range(offset, offset + count * length, length)])
+        blocks[settings] = (text, offset + count * length)
+    return results
+
+
+def _run_check(jobs: List[List[str]]) -> List[Any]:
+    """Выполняет пакет заданий проверки одним проходом."""
+    results = []
+    for passwords in jobs:
+        checked = []
+        for password in passwords:
+            checks = analyze_password(password)
+            record: Dict[str, Any] = {
+                "checks_level": get_security_level(checks.percent),
+                "percent": checks.percent,
+            }
+            record.update(checks.as_dict())
+            checked.append(record)
+        results.append(checked)
+    return results
+
+
+def _one(job: Any) -> int:
+    return 1
+
+
+class Batcher:
+    """
+    Объединяет одновременные задания одного вида в пакеты.
+
+    Суммарный вес заданий пакета (weigh) не превышает max_weight, кроме
+    пакета из одного задания.
+    """
+
+    def __init__(self, runner, executor: ThreadPoolExecutor,
+                 max_pending: int = MAX_PENDING,
+                 weigh: Callable[[Any], int] = _one,
+                 max_weight: int = MAX_PENDING) -> None:
+        self.runner = runner
+        self.executor = executor
+        self.weigh = weigh
+        self.max_weight = max_weight
+        self.queue: "asyncio.Queue[Tuple[Any, asyncio.Future]]" = asyncio.Queue(max_pending)
+        self.task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self.task = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(self, job: Any) -> Any:
+        """Ставит задание в очередь и ждет результат."""
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((job, future))
+        except asyncio.QueueFull:
+            raise HttpError(503, "Сервис перегружен, повторите запрос позже")
+        result = await future
+        if isinstance(result, HttpError):
+            raise result
+        if isinstance(result, Exception):
+            # Ошибки заданий (ValueError из runner) - ошибки запроса
+            raise HttpError(400, str(result))
+        return result
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        # Задание, не поместившееся в предыдущий пакет
+        carry = None
+        while True:
+            if carry is None:
+                batch = [await self.queue.get()]
+                await asyncio.sleep(BATCH_WINDOW)
+            else:
+                batch, carry = [carry], None
+            weight = self.weigh(batch[0][0])
+            while not self.queue.empty():
+                item = self.queue.get_nowait()
+                weight += self.weigh(item[0])
+                if weight > self.max_weight:
+                    carry = item
+                    break
+                batch.append(item)
+
+            jobs = [job for job, _ in batch]
+            try:
+                results = await loop.run_in_executor(self.executor, self.runner, jobs)
+            except Exception:
+                # Сбой самого runner - внутренняя ошибка, а не ошибка запроса
+                results = [HttpError(500, "Внутренняя ошибка сервиса")
+                           for _ in batch]
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+
+
+class PassGenService:
+    """HTTP-сервис генерации и проверки паролей."""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 max_pending: int = MAX_PENDING) -> None:
+        self.host = host
+        self.port = port
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(max_workers=1,
+                                           thread_name_prefix="passgen-http")
+        self.generate_batcher: Optional[Batcher] = None
+        self.check_batcher: Optional[Batcher] = None
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """Запускает пакетировщики и прослушивание порта."""
+        self.generate_batcher = Batcher(
+            _run_generate, self.executor, self.max_pending,
+            weigh=lambda job: job[0][0] * job[1], max_weight=MAX_BATCH_CHARS
+        )
+        self.check_batcher = Batcher(
+            _run_check, self.executor, self.max_pending,
+            weigh=len, max_weight=MAX_BATCH_PASSWORDS
+        )
+        self.generate_batcher.start()
+        self.check_batcher.start()
+        self.server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port, limit=MAX_HEADER_SIZE
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self, on_started: Optional[Callable[[], None]] = None) -> None:
+        """Обслуживает запросы; on_started вызывается после открытия порта."""
+        await self.start()
+        if on_started is not None:
+            on_started()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def stop(self) -> None:
+        """Останавливает сервис."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for batcher in (self.generate_batcher, self.check_batcher):
+            if batcher is not None:
+                batcher.stop()
+        self.executor.shutdown(wait=False)
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        """Обрабатывает запросы одного соединения (keep-alive)."""
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HttpError as e:
+                    await self._respond(writer, e.status, {"error": str(e)}, False)
+                    return
+                if request is None:
+                    return
+
+                method, path, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    payload = await self.dispatch(method, path, body)
+                    status = 200
+                except HttpError as e:
+                    status, payload = e.status, {"error": str(e)}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """Читает запрос; возвращает None, если клиент закрыл соединение."""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as e:
+            if not e.partial:
+                return None
+            raise HttpError(400, "Неполный запрос")
+        except asyncio.LimitOverrunError:
+            raise HttpError(413, "Слишком большие заголовки")
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, path, _ = lines[0].split(" ", 2)
+        except ValueError:
+            raise HttpError(400, "Некорректная строка запроса")
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HttpError(400, "Некорректный Content-Length")
+        if length > MAX_BODY_SIZE:
+            raise HttpError(413, "Слишком большое тело запроса")
+        body = await reader.readexactly(length) if length else b""
+        return method, path, headers, body
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int,
+                       payload: Dict[str, Any], keep_alive: bool) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        headers = [
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            "Connection: " + ("keep-alive" if keep_alive else "close"),
+        ]
+        if status == 503:
+            headers.append("Retry-After: 1")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+        # Запись ждет освобождения буфера сокета (обратное давление)
+        await writer.drain()
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> Dict[str, Any]:
+        """Выполняет запрос к конечной точке."""
+        if path == "/health":
+            pending = (self.generate_batcher.queue.qsize()
+                       + self.check_batcher.queue.qsize())
+            return {"status": "ok", "pending": pending}
+        if path not in ("/generate", "/check"):
+            raise HttpError(404, "Неизвестный путь")
+        if method != "POST":
+            raise HttpError(405, "Используйте POST")
+
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError:
+            raise HttpError(400, "Некорректный JSON")
+        if not isinstance(request, dict):
+            raise HttpError(400, "Ожидается JSON-объект")
+
+        if path == "/generate":
+            return {"passwords": await self._generate(request)}
+        return {"results": await self._check(request)}
+
+    async def _generate(self, request: Dict[str, Any]) -> List[str]:
+        count = request.get("count", 1)
+        length = request.get("length", 12)
+        # bool - подкласс int, но true/false не являются числами в JSON
+        if (not isinstance(count, int) or isinstance(count, bool)
+                or not 0 <= count <= MAX_GENERATE_COUNT):
+            raise HttpError(400, f"count должен быть от 0 до {MAX_GENERATE_COUNT}")
+        if (not isinstance(length, int) or isinstance(length, bool)
+                or not MIN_GENERATE_LENGTH <= length <= MAX_GENERATE_LENGTH):
+            raise HttpError(400, f"length должен быть от {MIN_GENERATE_LENGTH} "
+                                 f"до {MAX_GENERATE_LENGTH}")
+        if count * length > MAX_GENERATE_CHARS:
+            raise HttpError(400, f"count * length не должно превышать {MAX_GENERATE_CHARS}")
+        digits = request.get("digits", True)
+        special = request.get("special", True)
+        if not isinstance(digits, bool) or not isinstance(special, bool):
+            raise HttpError(400, "digits и special должны быть true или false")
+        settings = (length, digits, special)
+        return await self.generate_batcher.submit((settings, count))
+
+    async def _check(self, request: Dict[str, Any]) -> List[Dict[str, Any]]:
+        passwords = request.get("passwords")
+        if (not isinstance(passwords, list) or len(passwords) > MAX_CHECK_COUNT
+                or not all(isinstance(item, str) for item in passwords)):
+            raise HttpError(400, f"passwords - список до {MAX_CHECK_COUNT} строк")
+        return await self.check_batcher.submit(passwords)
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    """
+    Запускает сервис до прерывания (Ctrl+C).
+
+    Адрес печатается только после того, как порт открыт; ошибка открытия
+    (например, занятый порт) передается вызывающему как OSError.
+    """
+    service = PassGenService(host, port)
+    try:
+        asyncio.run(service.serve_forever(
+            lambda: print(f"Сервис слушает http://{service.host}:{service.port}",
+                          flush=True)
+        ))
+    except KeyboardInterrupt:
+        pass
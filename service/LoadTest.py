@@ -0,0 +1,95 @@
+"""
+Клиент нагрузочного тестирования локального HTTP-сервиса.
+
+Открывает заданное число постоянных (keep-alive) соединений, в каждом
+последовательно отправляет запросы и измеряет задержку каждого ответа.
+По итогам выводит пропускную способность, p50, p99 и число ошибок.
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, List, Tuple
+
+from service.HttpService import DEFAULT_HOST, DEFAULT_PORT
+
+
+async def _request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                   host: str, path: str, body: bytes) -> int:
+    """Отправляет запрос и возвращает код ответа."""
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+        .encode("latin-1") + body
+    )
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    length = 0
+    for line in lines[1:]:
+        if line.lower().startswith("content-length:"):
+            length = int(line.split(":", 1)[1])
+    await reader.readexactly(length)
+    return status
+
+
+async def _client(host: str, port: int, path: str, body: bytes, requests: int,
+                  latencies: List[float], statuses: Dict[int, int]) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(requests):
+            started = time.perf_counter()
+            status = await _request(reader, writer, host, path, body)
+            latencies.append(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run_load_test(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                        endpoint: str = "generate", connections: int = 32,
+                        requests: int = 200, count: int = 1) -> Dict[str, float]:
+    """
+    Выполняет нагрузочный тест и возвращает сводку.
+
+    endpoint - "generate" или "check"; count - число паролей в запросе.
+    """
+    if endpoint == "generate":
+        body = json.dumps({"count": count, "length": 12}).encode()
+    elif endpoint == "check":
+        body = json.dumps({"passwords": ["Qwerty123!x"] * count}).encode()
+    else:
+        raise ValueError(f"Неизвестная конечная точка: {endpoint}")
+
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, f"/{endpoint}", body, requests, latencies, statuses)
+        for _ in range(connections)
+    ))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "errors": sum(number for status, number in statuses.items() if status != 200),
+    }
+
+
+def format_summary(summary: Dict[str, float]) -> str:
+    """Форматирует сводку нагрузочного теста."""
+    return (f"Запросов: {summary['requests']:.0f} за {summary['seconds']:.2f} с "
+            f"({summary['rps']:,.0f} в секунду), p50 {summary['p50_ms']:.2f} мс, "
+            f"p99 {summary['p99_ms']:.2f} мс, ошибок: {summary['errors']:.0f}")
@@ -0,0 +1,82 @@
+"""
+НЕКРИПТОГРАФИЧЕСКИЙ генератор синтетических корпусов паролей.
+
+Предназначен только для нагрузочного тестирования систем аутентификации:
+пароли воспроизводимы по зерну и предсказуемы, поэтому их НЕЛЬЗЯ выдавать
+пользователям. Для настоящих паролей используйте пакет generator.
+
+Индексы символов тянутся матрицами через numpy.random.Generator (PCG64)
+и отображаются на тот же алфавит, что и в generate_password. Результат -
+массивы байт фиксированной ширины или файлы. numpy - необязательная
+зависимость и импортируется при первом вызове.
+"""
+
+from typing import BinaryIO
+
+from generator.PasswordGeneration import _validate
+
+# Количество строк, генерируемых за один шаг при записи в файл. Корпус
+# воспроизводим при одинаковых зерне, параметрах и этом размере шага.
+CHUNK_ROWS = 1 << 18
+
+
+def _numpy():
+    """Импортирует numpy с понятным сообщением об ошибке."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "Для синтетических корпусов требуется numpy (pip install numpy)"
+        ) from None
+    return numpy
+
+
+def insecure_corpus_array(count: int, length: int = 12, use_digits: bool = True,
+                          use_special_chars: bool = True, seed: int = 0):
+    """
+    Возвращает массив numpy uint8 формы (count, length) с кодами ASCII.
+
+    НЕ для реальных паролей: результат полностью определяется seed.
+    """
+    numpy = _numpy()
+    alphabet = _validate(length, use_digits, use_special_chars)
+    if count < 0:
+        raise ValueError("Количество паролей не может быть отрицательным")
+
+    table = numpy.frombuffer(alphabet.encode("ascii"), dtype=numpy.uint8)
+    rng = numpy.random.default_rng(seed)
+    indices = rng.integers(0, len(table), size=(count, length), dtype=numpy.uint8)
+    return table[indices]
+
+
+def write_insecure_corpus(sink: BinaryIO, count: int, length: int = 12,
+                          use_digits: bool = True, use_special_chars: bool = True,
+                          seed: int = 0, newline: bool = True) -> int:
+    """
+    Записывает count синтетических паролей в sink.
+
+    При newline=True каждый пароль завершается переводом строки, иначе
+    записи идут подряд по length байт. Возвращает число записанных байт.
+    НЕ для реальных паролей.
+    """
+    numpy = _numpy()
+    alphabet = _validate(length, use_digits, use_special_chars)
+    if count < 0:
+        raise ValueError("Количество паролей не может быть отрицательным")
+
+    table = numpy.frombuffer(alphabet.encode("ascii"), dtype=numpy.uint8)
+    rng = numpy.random.default_rng(seed)
+    width = length + 1 if newline else length
+    written = 0
+
+    for offset in range(0, count, CHUNK_ROWS):
+        rows = min(CHUNK_ROWS, count - offset)
+        block = numpy.empty((rows, width), dtype=numpy.uint8)
+        indices = rng.integers(0, len(table), size=(rows, length), dtype=numpy.uint8)
+        numpy.take(table, indices, out=block[:, :length])
+        if newline:
+            block[:, length] = ord("\n")
+        data = block.tobytes()
+        sink.write(data)
+        written += len(data)
+    return written
@@ -0,0 +1,12 @@
+"""
+Общие настройки тестов.
+
+Тесты запускаются из корня репозитория: python -m pytest -q
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
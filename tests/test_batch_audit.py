@@ -0,0 +1,29 @@
+import io
+import json
+
+from analyzer.BatchAudit import audit_chunk, audit_stream, csv_header
+
+
+def test_levels_are_labelled_by_source():
+    block, histogram = audit_chunk([b"qwerty123\n"], 1, "jsonl", False, True)
+    record = json.loads(block)
+    # Уровень по проверкам и уровень оценки стойкости - разные поля
+    assert record["checks_level"] == "Средний"
+    assert record["level"] == "Слабый" and record["score"] == 0
+    assert histogram == {"Средний": 1}
+
+
+def test_csv_columns_match_header():
+    header = csv_header(False, True).decode().strip().split(",")
+    block, _ = audit_chunk([b"x9$Kq!2mZr@7Lp#4\n"], 1, "csv", False, True)
+    row = block.decode().strip().split(",")
+    assert len(row) == len(header)
+    assert dict(zip(header, row))["level"] == "Отличный"
+
+
+def test_audit_stream_skips_empty_lines():
+    sink = io.BytesIO()
+    histogram = audit_stream(io.BytesIO(b"abc\n\nPassword123!\n"), sink,
+                             output_format="jsonl", workers=1)
+    assert sum(histogram.values()) == 2
+    assert [json.loads(line)["line"] for line in sink.getvalue().splitlines()] == [1, 3]
@@ -0,0 +1,71 @@
+import pytest
+
+from analyzer import Blocklist
+from bench.Benchmarks import BENCHMARKS, synthetic_corpus
+from utils import Clipboard
+from utils.HashIndex import hash_key, write_sorted_index
+
+# Быстрые бенчмарки: индексы на миллион записей в тестах не строятся
+FAST_BENCHMARKS = ["check.analyze", "check.sequences", "check.estimate",
+                   "check.estimate.worst-case",
+                   "check.common.sorted.1000", "check.common.bloom.1000",
+                   "clipboard.copy.tk", "generate.single.len8-digits-special"]
+
+
+class FakeBackend(Clipboard.ClipboardBackend):
+    def copy(self, text):
+        pass
+
+    def paste(self):
+        return ""
+
+
+@pytest.fixture
+def global_state(monkeypatch, tmp_path):
+    """Подключает свои индекс и бэкенд; monkeypatch вернет исходные после теста."""
+    path = str(tmp_path / "own.pgsh")
+    write_sorted_index(path, [hash_key("own-leak")])
+    monkeypatch.setattr(Blocklist, "_blocklist", None)
+    monkeypatch.setattr(Blocklist, "_blocklist_loaded", True)
+    Blocklist.set_blocklist(path)
+    backend = FakeBackend()
+    monkeypatch.setattr(Clipboard, "_backend", backend)
+    monkeypatch.setattr(Clipboard, "_last_digest", b"digest")
+    yield path, backend
+    Blocklist.set_blocklist(None)
+
+
+def test_synthetic_corpus_is_reproducible():
+    assert synthetic_corpus(50) == synthetic_corpus(50)
+    assert len(set(synthetic_corpus(400))) > 300
+
+
+@pytest.mark.parametrize("name", FAST_BENCHMARKS)
+def test_benchmark_restores_global_state(name, global_state):
+    path, backend = global_state
+    with BENCHMARKS[name]() as (run, operations):
+        assert operations > 0
+        run()
+    assert Blocklist.get_blocklist().path == path
+    assert Blocklist.get_blocklist().contains_hash(hash_key("own-leak"))
+    assert Clipboard._backend is backend and Clipboard._last_digest == b"digest"
+
+
+def test_state_restored_after_failure(global_state):
+    path, backend = global_state
+    with pytest.raises(RuntimeError):
+        with BENCHMARKS["clipboard.copy.tk"]():
+            raise RuntimeError
+    with pytest.raises(RuntimeError):
+        with BENCHMARKS["check.common.bloom.1000"]():
+            raise RuntimeError
+    assert Blocklist.get_blocklist().path == path
+    assert Clipboard._backend is backend
+
+
+def test_unloaded_blocklist_stays_unloaded(monkeypatch):
+    monkeypatch.setattr(Blocklist, "_blocklist", None)
+    monkeypatch.setattr(Blocklist, "_blocklist_loaded", False)
+    with BENCHMARKS["check.analyze"]():
+        assert Blocklist._blocklist_loaded
+    assert not Blocklist._blocklist_loaded
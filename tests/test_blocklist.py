@@ -0,0 +1,83 @@
+import hashlib
+
+import pytest
+
+from analyzer.Blocklist import compile_blocklist, is_blocklisted, iter_corpus_hashes
+from utils.HashIndex import open_index
+
+LEAKED = ["Password1", "dragon", "Tr0ub4dor&3", "пароль123"]
+
+
+def sha1_hex(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest().upper()
+
+
+@pytest.fixture
+def corpora(tmp_path):
+    plain = tmp_path / "plain.txt"
+    plain.write_text("\n".join(LEAKED) + "\n\n", encoding="utf-8")
+    # HIBP: SHA-1 в верхнем регистре и число утечек; хеши от исходного регистра
+    hibp = tmp_path / "hibp.txt"
+    hibp.write_text("".join(f"{sha1_hex(p)}:{n}\r\n" for n, p in enumerate(LEAKED, 1)),
+                    encoding="ascii")
+    return tmp_path, str(plain), str(hibp)
+
+
+@pytest.mark.parametrize("index_format", ["sorted", "bloom"])
+def test_plain_corpus_is_case_insensitive(corpora, index_format):
+    directory, plain, _ = corpora
+    target = str(directory / f"plain.{index_format}")
+    assert compile_blocklist(plain, target, "plain", index_format) == len(LEAKED)
+    index = open_index(target)
+    try:
+        for password in LEAKED:
+            assert is_blocklisted(index, password)
+            assert is_blocklisted(index, password.upper())
+        assert not is_blocklisted(index, "x9$Kq!2mZr@7")
+    finally:
+        index.close()
+
+
+@pytest.mark.parametrize("index_format", ["sorted", "bloom"])
+def test_sha1_corpus_matches_original_case(corpora, index_format):
+    directory, _, hibp = corpora
+    target = str(directory / f"hibp.{index_format}")
+    assert compile_blocklist(hibp, target, "sha1", index_format) == len(LEAKED)
+    index = open_index(target)
+    try:
+        # В корпусе хеш от "Password1": проверяется и исходный регистр,
+        # и нижний, но не другие варианты
+        assert is_blocklisted(index, "Password1")
+        assert not is_blocklisted(index, "password1")
+        assert not is_blocklisted(index, "PASSWORD1")
+        # Хеш от "dragon" находит пароль в любом регистре через нижний
+        assert is_blocklisted(index, "DRAGON")
+        assert is_blocklisted(index, "пароль123")
+    finally:
+        index.close()
+
+
+def test_corpus_hashes(corpora):
+    _, plain, hibp = corpora
+    expected = [hashlib.sha1(p.lower().encode("utf-8")).digest() for p in LEAKED]
+    assert list(iter_corpus_hashes(plain)) == expected
+    assert list(iter_corpus_hashes(hibp, "sha1")) == [
+        bytes.fromhex(sha1_hex(p)) for p in LEAKED
+    ]
+
+
+def test_malformed_sha1_line_rejected(tmp_path):
+    corpus = tmp_path / "bad.txt"
+    corpus.write_text(f"{sha1_hex('a')}:1\nnot-a-hash:2\n", encoding="ascii")
+    with pytest.raises(ValueError):
+        list(iter_corpus_hashes(str(corpus), "sha1"))
+    with pytest.raises(ValueError):
+        compile_blocklist(str(corpus), str(tmp_path / "bad.pgsh"), "sha1")
+
+
+def test_unknown_formats_rejected(corpora):
+    directory, plain, _ = corpora
+    with pytest.raises(ValueError):
+        list(iter_corpus_hashes(plain, "md5"))
+    with pytest.raises(ValueError):
+        compile_blocklist(plain, str(directory / "x"), index_format="csv")
@@ -0,0 +1,58 @@
+import pytest
+
+from utils import Clipboard
+
+
+class MemoryClipboard(Clipboard.ClipboardBackend):
+    def __init__(self):
+        self.value = ""
+
+    def copy(self, text):
+        self.value = text
+
+    def paste(self):
+        return self.value
+
+    def schedule(self, delay, callback):
+        self.scheduled = callback
+
+
+@pytest.fixture
+def memory_backend(monkeypatch):
+    backend = MemoryClipboard()
+    # monkeypatch возвращает прежний бэкенд после теста
+    monkeypatch.setattr(Clipboard, "_backend", backend)
+    monkeypatch.setattr(Clipboard, "_last_digest", None)
+    return backend
+
+
+def test_backend_is_abstract():
+    with pytest.raises(TypeError):
+        Clipboard.ClipboardBackend()
+
+    class CopyOnly(Clipboard.ClipboardBackend):
+        def copy(self, text):
+            pass
+
+    with pytest.raises(TypeError):
+        CopyOnly()
+
+
+def test_copy_and_clear_if_unchanged(memory_backend):
+    assert Clipboard.copy_to_clipboard("s3cret!", clear_after=1)
+    assert memory_backend.value == "s3cret!"
+    memory_backend.scheduled()
+    assert memory_backend.value == ""
+
+
+def test_clear_skipped_when_replaced(memory_backend):
+    assert Clipboard.copy_to_clipboard("s3cret!", clear_after=1)
+    memory_backend.value = "other"
+    memory_backend.scheduled()
+    assert memory_backend.value == "other"
+
+
+def test_rejects_bad_input(memory_backend):
+    assert not Clipboard.copy_to_clipboard("   ")
+    with pytest.raises(TypeError):
+        Clipboard.copy_to_clipboard([1])
@@ -0,0 +1,83 @@
+import pytest
+
+from utils.HashIndex import (
+    BloomFilter, SortedHashIndex, hash_key, merge_sorted_indexes, open_index,
+    write_bloom_filter, write_sorted_index, write_sorted_records
+)
+
+
+def keys(start, stop):
+    return [hash_key(f"leaked-{i}") for i in range(start, stop)]
+
+
+def test_sorted_index_with_external_sort(tmp_path):
+    path = str(tmp_path / "sorted.pgsh")
+    # Маленькие порции заставляют слить несколько временных файлов
+    count = write_sorted_index(path, keys(0, 1000) + keys(0, 100), run_size=128)
+    assert count == 1000
+    assert list(tmp_path.iterdir()) == [tmp_path / "sorted.pgsh"]
+    index = open_index(path)
+    try:
+        assert isinstance(index, SortedHashIndex) and len(index) == 1000
+        assert all(index.contains_hash(key) for key in keys(0, 1000))
+        assert not any(index.contains_hash(key) for key in keys(1000, 2000))
+        assert "leaked-5" in index
+        records = list(index.iter_records())
+        assert records == sorted(records) and len(records[0]) == 8
+    finally:
+        index.close()
+
+
+def test_empty_sorted_index(tmp_path):
+    path = str(tmp_path / "empty.pgsh")
+    assert write_sorted_index(path, []) == 0
+    index = SortedHashIndex(path)
+    assert not index.contains_hash(hash_key("x")) and list(index.iter_records()) == []
+    index.close()
+
+
+def test_merge_and_presorted_records(tmp_path):
+    first, second = str(tmp_path / "a.pgsh"), str(tmp_path / "b.pgsh")
+    write_sorted_index(first, keys(0, 300), width=16)
+    records = b"".join(sorted(key[:16] for key in keys(200, 500)))
+    assert write_sorted_records(second, records, 16) == 300
+    sources = [SortedHashIndex(first), SortedHashIndex(second)]
+    merged = str(tmp_path / "merged.pgsh")
+    assert merge_sorted_indexes(merged, sources) == 500
+    for source in sources:
+        source.close()
+    index = SortedHashIndex(merged)
+    assert all(index.contains_hash(key) for key in keys(0, 500))
+    index.close()
+    with pytest.raises(ValueError):
+        write_sorted_records(second, records[:-1], 16)
+
+
+def test_bloom_filter_has_no_false_negatives(tmp_path):
+    path = str(tmp_path / "bloom.pgbf")
+    write_bloom_filter(path, keys(0, 5000), 5000, error_rate=0.01)
+    bloom = open_index(path)
+    try:
+        assert isinstance(bloom, BloomFilter)
+        assert all(bloom.contains_hash(key) for key in keys(0, 5000))
+        false_positives = sum(bloom.contains_hash(key) for key in keys(5000, 25000))
+        assert false_positives < 20000 * 0.03
+    finally:
+        bloom.close()
+
+
+def test_bloom_add_reports_presence(tmp_path):
+    path = str(tmp_path / "bloom.pgbf")
+    write_bloom_filter(path, [], 100)
+    bloom = BloomFilter(path, writable=True)
+    key = hash_key("new")
+    assert not bloom.add_hash(key)
+    assert bloom.add_hash(key) and bloom.contains_hash(key)
+    bloom.close()
+
+
+def test_corrupt_header_rejected(tmp_path):
+    path = tmp_path / "broken.pgsh"
+    path.write_bytes(b"PGSH")
+    with pytest.raises(ValueError):
+        open_index(str(path))
@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+
+import pytest
+
+from pipeline.Hashing import (
+    HashScheme, csv_header, iter_file_records, iter_generated_records, iter_hashed,
+    verify_password
+)
+
+# Минимальная стоимость: проверяется конвейер, а не стойкость
+FAST = HashScheme("pbkdf2-sha256", iterations=10)
+
+
+def records(count):
+    return [(str(i), f"pass-{i}") for i in range(1, count + 1)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_csv_rows_keep_order_and_verify(workers):
+    blocks = iter_hashed(records(20), FAST, with_password=True, workers=workers,
+                         chunk_records=3)
+    text = (csv_header(True) + b"".join(blocks)).decode("utf-8")
+    rows = list(csv.DictReader(io.StringIO(text)))
+    assert [row["id"] for row in rows] == [str(i) for i in range(1, 21)]
+    assert len({row["salt"] for row in rows}) == 20
+    for row in rows:
+        assert row["scheme"] == "pbkdf2-sha256:i=10"
+        assert verify_password(row["password"], row["scheme"], row["salt"], row["hash"])
+        assert not verify_password("wrong", row["scheme"], row["salt"], row["hash"])
+
+
+def test_jsonl_with_scrypt():
+    scheme = HashScheme("scrypt", n=16, r=1, p=1)
+    lines = b"".join(iter_hashed(records(3), scheme, "jsonl", workers=1)).splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert [row["id"] for row in rows] == ["1", "2", "3"]
+    assert "password" not in rows[0]
+    assert verify_password("pass-2", rows[1]["scheme"], rows[1]["salt"], rows[1]["hash"])
+
+
+def test_scheme_round_trip_and_validation():
+    assert HashScheme.parse(FAST.describe()).iterations == 10
+    with pytest.raises(ValueError):
+        HashScheme.parse("pbkdf2-sha256:n=1")
+    with pytest.raises(ValueError):
+        HashScheme("scrypt", n=3)
+    with pytest.raises(ValueError):
+        HashScheme("md5")
+    with pytest.raises(ValueError):
+        list(iter_hashed(records(1), FAST, output_format="xml"))
+
+
+def test_record_sources():
+    assert list(iter_file_records([b"a\n", b"\n", b"b\r\n"])) == [("1", "a"), ("3", "b")]
+    assert list(iter_file_records([b"7\tx\n"], with_ids=True)) == [("7", "x")]
+    with pytest.raises(ValueError):
+        list(iter_file_records([b"no tab\n"], with_ids=True))
+    generated = list(iter_generated_records(5, 16, first_id=10))
+    assert [record_id for record_id, _ in generated] == ["10", "11", "12", "13", "14"]
+    assert all(len(password) == 16 for _, password in generated)
+
+
+def test_explicit_zero_iterations_rejected():
+    with pytest.raises(ValueError):
+        HashScheme("pbkdf2-sha256", iterations=0)
+    assert HashScheme("pbkdf2-sha512").iterations == 210_000
+
+
+@pytest.mark.parametrize("options", [
+    ["--count", "-1"], ["--count", "2", "--length", "3"], ["--count", "2", "--chunk", "0"],
+    ["--count", "2", "--iterations", "0"], ["--source", "missing.txt"],
+])
+def test_cli_errors_keep_existing_output(tmp_path, monkeypatch, options):
+    from Main import run_cli
+
+    monkeypatch.chdir(tmp_path)
+    out = tmp_path / "hashes.csv"
+    out.write_bytes(b"previous results\n")
+    assert run_cli(["hash", *options, "--out", str(out)]) != 0
+    assert out.read_bytes() == b"previous results\n"
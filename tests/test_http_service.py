@@ -0,0 +1,105 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from service.HttpService import (
+    MAX_GENERATE_LENGTH, Batcher, HttpError, PassGenService
+)
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def _dispatch(path, payload):
+    service = PassGenService(port=0)
+    await service.start()
+    try:
+        return await service.dispatch("POST", path, json.dumps(payload).encode())
+    finally:
+        await service.stop()
+
+
+@pytest.mark.parametrize("length", [3, 7, MAX_GENERATE_LENGTH + 1, "12"])
+def test_generate_rejects_length_out_of_range(length):
+    with pytest.raises(HttpError) as error:
+        _run(_dispatch("/generate", {"count": 1, "length": length}))
+    assert error.value.status == 400
+
+
+def test_generate_rejects_too_many_chars():
+    with pytest.raises(HttpError) as error:
+        _run(_dispatch("/generate", {"count": 10_000, "length": MAX_GENERATE_LENGTH}))
+    assert error.value.status == 400
+
+
+def test_generate_and_check():
+    passwords = _run(_dispatch("/generate", {"count": 3, "length": 16}))["passwords"]
+    assert [len(p) for p in passwords] == [16] * 3
+    results = _run(_dispatch("/check", {"passwords": ["qwerty123"]}))["results"]
+    assert results[0]["checks_level"] == "Средний"
+
+
+def test_batcher_respects_max_weight():
+    sizes = []
+
+    def runner(jobs):
+        sizes.append(sum(jobs))
+        return jobs
+
+    async def main():
+        executor = ThreadPoolExecutor(max_workers=1)
+        batcher = Batcher(runner, executor, weigh=lambda job: job, max_weight=10)
+        batcher.start()
+        try:
+            results = await asyncio.gather(*(batcher.submit(4) for _ in range(6)))
+        finally:
+            batcher.stop()
+            executor.shutdown()
+        return results
+
+    assert _run(main()) == [4] * 6
+    assert sum(sizes) == 24 and max(sizes) <= 10
+
+
+@pytest.mark.parametrize("payload", [
+    {"count": True}, {"count": False}, {"length": True},
+    {"digits": "false"}, {"special": 0}, {"digits": None},
+])
+def test_generate_requires_json_types(payload):
+    with pytest.raises(HttpError) as error:
+        _run(_dispatch("/generate", payload))
+    assert error.value.status == 400
+
+
+def test_generate_honours_boolean_flags():
+    passwords = _run(_dispatch("/generate", {"count": 20, "length": 12,
+                                             "digits": False}))["passwords"]
+    assert not any(c.isdigit() for p in passwords for c in p)
+
+
+def test_runner_failure_is_internal_error():
+    def runner(jobs):
+        if jobs == ["bad"]:
+            return [ValueError("bad job")]
+        raise RuntimeError("bug")
+
+    async def main():
+        executor = ThreadPoolExecutor(max_workers=1)
+        batcher = Batcher(runner, executor)
+        batcher.start()
+        statuses = []
+        try:
+            for job in ("bad", "crash"):
+                try:
+                    await batcher.submit(job)
+                except HttpError as e:
+                    statuses.append(e.status)
+        finally:
+            batcher.stop()
+            executor.shutdown()
+        return statuses
+
+    assert _run(main()) == [400, 500]
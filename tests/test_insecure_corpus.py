@@ -0,0 +1,56 @@
+import io
+
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from generator.PasswordGeneration import get_alphabet  # noqa: E402
+from synthetic import InsecureCorpus  # noqa: E402
+from synthetic.InsecureCorpus import (  # noqa: E402
+    insecure_corpus_array, write_insecure_corpus
+)
+
+
+def corpus_bytes(seed, count=1000, **options):
+    sink = io.BytesIO()
+    written = write_insecure_corpus(sink, count, seed=seed, **options)
+    assert written == len(sink.getvalue())
+    return sink.getvalue()
+
+
+def test_same_seed_gives_identical_output(monkeypatch):
+    # Несколько шагов записи, последний неполный
+    monkeypatch.setattr(InsecureCorpus, "CHUNK_ROWS", 64)
+    first = corpus_bytes(7)
+    assert first == corpus_bytes(7)
+    assert first != corpus_bytes(8)
+
+
+def test_output_shape_and_alphabet():
+    data = corpus_bytes(1, count=500, length=10)
+    lines = data.split(b"\n")
+    assert lines[-1] == b"" and len(lines) == 501
+    assert {len(line) for line in lines[:-1]} == {10}
+    packed = corpus_bytes(1, count=500, length=10, newline=False)
+    assert packed == b"".join(lines)
+
+
+@pytest.mark.parametrize("digits, special", [(True, True), (True, False), (False, True)])
+def test_array_shape_and_alphabet(digits, special):
+    array = insecure_corpus_array(2000, 16, digits, special, seed=3)
+    assert array.shape == (2000, 16) and array.dtype == numpy.uint8
+    alphabet = set(get_alphabet(digits, special).encode("ascii"))
+    assert set(numpy.unique(array).tolist()) <= alphabet
+    assert numpy.array_equal(array, insecure_corpus_array(2000, 16, digits, special,
+                                                          seed=3))
+
+
+@pytest.mark.parametrize("arguments", [
+    {"count": -1}, {"count": 10, "length": 7},
+    {"count": 10, "use_digits": False, "use_special_chars": False},
+])
+def test_validation_errors_propagate(arguments):
+    with pytest.raises(ValueError):
+        insecure_corpus_array(**arguments)
+    with pytest.raises(ValueError):
+        write_insecure_corpus(io.BytesIO(), **arguments)
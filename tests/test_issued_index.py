@@ -0,0 +1,91 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from utils.IssuedIndex import DIGEST_SIZE, JOURNAL_FILE, IssuedIndex, _Memtable
+
+
+def values(count, start=0):
+    return [f"password-{i}".encode() for i in range(start, start + count)]
+
+
+def test_memtable_is_compact_and_sorted():
+    memtable = _Memtable()
+    digests = [os.urandom(DIGEST_SIZE) for _ in range(5000)]
+    for digest in digests:
+        memtable.add(digest)
+    assert len(memtable) == 5000
+    assert all(digest in memtable for digest in digests[::50])
+    assert os.urandom(DIGEST_SIZE) not in memtable
+    records = memtable.sorted_records()
+    assert records == b"".join(sorted(digests))
+
+
+def test_memtable_ignores_unaligned_matches():
+    memtable = _Memtable()
+    prefix = b"\xab\xcd"
+    first = prefix + b"\0" * 6 + prefix + b"\1" * 6
+    second = prefix + b"\2" * 14
+    memtable.add(first)
+    memtable.add(second)
+    # Хеш из той же корзины, совпадающий с хвостом одной записи и началом другой
+    assert first[8:] + second[:8] not in memtable
+    assert first in memtable and second in memtable
+
+
+def test_add_new_drops_issued_values(tmp_path):
+    with IssuedIndex(str(tmp_path), capacity=10_000, memtable_size=64) as index:
+        assert index.add_new(values(100)) == values(100)
+        assert index.add_new(values(150)) == values(50, 100)
+        assert index.add_new([b"x", b"x"]) == [b"x"]
+        assert b"password-7" in index and b"password-999" not in index
+
+
+def test_journal_is_replayed_after_crash(tmp_path):
+    index = IssuedIndex(str(tmp_path), capacity=10_000)
+    index.add_new(values(100))
+    # Обрыв процесса: индекс не закрыт, последняя запись журнала неполная
+    index.journal.write(b"\0" * 5)
+    index.journal.close()
+    os.close(index._lock_handle)
+
+    with IssuedIndex(str(tmp_path), capacity=10_000) as index:
+        assert len(index.memtable) == 100
+        assert index.add_new(values(110)) == values(10, 100)
+    assert os.path.getsize(os.path.join(str(tmp_path), JOURNAL_FILE)) == 0
+
+
+def test_flush_and_compact_keep_values(tmp_path):
+    with IssuedIndex(str(tmp_path), capacity=10_000, memtable_size=50,
+                     max_segments=2) as index:
+        for start in range(0, 500, 25):
+            index.add_new(values(25, start))
+        assert len(index.segments) <= 3
+    with IssuedIndex(str(tmp_path), capacity=10_000) as index:
+        assert len(index) == 500
+        assert index.add_new(values(510)) == values(10, 500)
+
+
+def test_second_open_is_refused(tmp_path):
+    with IssuedIndex(str(tmp_path), capacity=1000):
+        with pytest.raises(ValueError):
+            IssuedIndex(str(tmp_path), capacity=1000)
+
+
+def test_lock_is_released_when_holder_is_killed(tmp_path):
+    script = (
+        "import os, sys\n"
+        "from utils.IssuedIndex import IssuedIndex\n"
+        "index = IssuedIndex(sys.argv[1], capacity=1000)\n"
+        "index.add_new([b'issued-before-crash'])\n"
+        "os._exit(1)\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    completed = subprocess.run([sys.executable, "-c", script, str(tmp_path)], cwd=root)
+    assert completed.returncode == 1
+    with IssuedIndex(str(tmp_path), capacity=1000) as index:
+        assert b"issued-before-crash" in index
+    # Индекс закрыт - его снова можно открыть
+    IssuedIndex(str(tmp_path), capacity=1000).close()
@@ -0,0 +1,80 @@
+import pytest
+
+from utils import Metrics
+from utils.Metrics import BUCKET_BOUNDS_NS, Histogram
+
+
+@pytest.fixture(autouse=True)
+def isolated_metrics(monkeypatch):
+    monkeypatch.setattr(Metrics, "_enabled", False)
+    monkeypatch.setattr(Metrics, "_profile_every", 0)
+    monkeypatch.setattr(Metrics, "_histograms", {})
+
+
+def bucket_of(elapsed_ns):
+    histogram = Histogram()
+    histogram.record(elapsed_ns)
+    return histogram.buckets.index(1)
+
+
+@pytest.mark.parametrize("elapsed_ns, index", [
+    (0, 0), (1, 0), (255, 0), (256, 0), (257, 1), (512, 1), (513, 2),
+    (1 << 20, 12), ((1 << 20) + 1, 13),
+])
+def test_bucket_bounds_are_inclusive(elapsed_ns, index):
+    assert bucket_of(elapsed_ns) == index
+    assert elapsed_ns <= BUCKET_BOUNDS_NS[index]
+
+
+def test_overflow_bucket():
+    last = BUCKET_BOUNDS_NS[-1]
+    assert bucket_of(last) == len(BUCKET_BOUNDS_NS) - 1
+    assert bucket_of(last + 1) == len(BUCKET_BOUNDS_NS)
+    histogram = Histogram()
+    histogram.record(last * 4)
+    assert histogram.quantile(0.5) == last * 4
+
+
+def operation(fail=False):
+    if fail:
+        raise KeyError("boom")
+    return 42
+
+
+def test_timed_records_nothing_when_disabled():
+    wrapped = Metrics.timed("op")(operation)
+    assert wrapped() == 42
+    assert Metrics.get_stats() == {}
+
+
+def test_timed_counts_calls_and_errors():
+    Metrics.enable()
+    wrapped = Metrics.timed("op")(operation)
+    assert wrapped() == 42 and wrapped() == 42
+    with pytest.raises(KeyError):
+        wrapped(fail=True)
+    stats = Metrics.get_stats()["op"]
+    assert stats["count"] == 3 and stats["errors"] == 1
+    assert wrapped.__name__ == "operation"
+
+
+def test_prometheus_buckets_are_cumulative():
+    Metrics.record("op", 100)
+    Metrics.record("op", 300)
+    Metrics.record("op", 300, failed=True)
+    Metrics.record("op", BUCKET_BOUNDS_NS[-1] + 1)
+    lines = Metrics.format_prometheus().splitlines()
+    assert 'passgen_calls_total{op="op"} 4' in lines
+    assert 'passgen_errors_total{op="op"} 1' in lines
+    buckets = [int(line.rsplit(" ", 1)[1]) for line in lines
+               if line.startswith("passgen_latency_seconds_bucket")]
+    assert buckets[:3] == [1, 3, 3]
+    assert buckets == sorted(buckets) and buckets[-2] == 3
+    assert lines[-3] == 'passgen_latency_seconds_bucket{op="op",le="+Inf"} 4'
+    assert lines[-1] == 'passgen_latency_seconds_count{op="op"} 4'
+
+
+def test_negative_profiling_period_rejected():
+    with pytest.raises(ValueError):
+        Metrics.enable_profiling(-1)
+    assert Metrics._profile_every == 0
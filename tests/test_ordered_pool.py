@@ -0,0 +1,44 @@
+import threading
+
+import pytest
+
+from gui.BulkStore import BulkResults, PackedPasswords
+from utils.OrderedPool import imap_ordered, thread_safe_start_method
+
+
+def _square(value):
+    return value * value
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_results_keep_order(workers):
+    results = imap_ordered(_square, ((value,) for value in range(50)), workers)
+    assert list(results) == [value * value for value in range(50)]
+
+
+def test_thread_safe_start_method_runs_with_live_threads():
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait, daemon=True)
+    thread.start()
+    try:
+        method = thread_safe_start_method()
+        assert method in ("forkserver", "spawn")
+        results = imap_ordered(_square, ((value,) for value in range(10)), 2,
+                               start_method=method)
+        assert list(results) == [value * value for value in range(10)]
+    finally:
+        stop.set()
+
+
+def test_closing_iterator_cancels_pending():
+    results = imap_ordered(_square, ((value,) for value in range(1000)), 2)
+    assert next(results) == 0
+    results.close()
+
+
+def test_bulk_analyze_in_process_pool():
+    packed = b"qwerty12" + b"x9$Kq!2m"
+    results = BulkResults(PackedPasswords(packed, 8))
+    results.analyze(workers=2)
+    assert results.analyzed
+    assert [results.row(index)[3] for index in range(2)] == ["50%", "87%"]
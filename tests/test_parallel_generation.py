@@ -0,0 +1,60 @@
+import io
+
+import pytest
+
+from generator import ParallelGeneration
+from generator.ParallelGeneration import (
+    iter_parallel_lines, iter_policy_lines, write_parallel
+)
+from generator.PasswordGeneration import get_alphabet
+from generator.PasswordPolicy import get_policy
+
+
+def lines(blocks):
+    return [block.split(b"\n")[:-1] for block in blocks]
+
+
+def test_shards_keep_order_and_exact_count():
+    shards = lines(iter_parallel_lines(1000, 12, workers=2, shard_size=300))
+    assert [len(shard) for shard in shards] == [300, 300, 300, 100]
+    passwords = [p for shard in shards for p in shard]
+    assert len(set(passwords)) == 1000
+    alphabet = set(get_alphabet().encode("ascii"))
+    assert all(len(p) == 12 and set(p) <= alphabet for p in passwords)
+
+
+def test_slow_first_shards_do_not_reorder(monkeypatch):
+    # Шарды с разной длиной паролей: по ней видно, чей блок пришел
+    def shards(count, length, use_digits, use_special_chars, shard_size):
+        for number, offset in enumerate(range(0, count, shard_size)):
+            yield (min(shard_size, count - offset), 200 - 10 * number,
+                   use_digits, use_special_chars)
+
+    monkeypatch.setattr(ParallelGeneration, "_iter_shards", shards)
+    blocks = lines(iter_parallel_lines(2500, workers=2, shard_size=500))
+    assert [len(block[0]) for block in blocks] == [200, 190, 180, 170, 160]
+
+
+def test_policy_shards_and_write_parallel():
+    policy = get_policy(16, min_digits=3)
+    shards = lines(iter_policy_lines(policy, 250, workers=2, shard_size=64))
+    assert [len(shard) for shard in shards] == [64, 64, 64, 58]
+    assert all(sum(c in b"0123456789" for c in p) >= 3
+               for shard in shards for p in shard)
+
+    sink = io.BytesIO()
+    assert write_parallel(sink, 77, 9, workers=2, shard_size=10) == 77
+    assert [len(p) for p in sink.getvalue().split(b"\n")[:-1]] == [9] * 77
+
+
+@pytest.mark.parametrize("function, arguments", [
+    (iter_parallel_lines, (-1,)),
+    (iter_parallel_lines, (10, 7)),
+    (iter_parallel_lines, (10, 12, False, False)),
+    (iter_parallel_lines, (10, 12, True, True, 2, 0)),
+    (iter_policy_lines, (get_policy(12), -1)),
+    (iter_policy_lines, (get_policy(12), 10, 2, 0)),
+])
+def test_arguments_validated_before_work(function, arguments):
+    with pytest.raises(ValueError):
+        function(*arguments)
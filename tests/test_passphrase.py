@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+from generator.Passphrase import (
+    HEADER, Wordlist, cache_dir, compile_wordlist, generate_passphrases,
+    open_wordlist, passphrase_entropy_bits
+)
+
+WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "фокстрот"]
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("PASSGEN_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "words.txt"
+    # Формат EFF, повтор пропускается
+    path.write_text("".join(f"1111{i}\t{word}\n" for i, word in enumerate(WORDS, 1))
+                    + "66666\talpha\n", encoding="utf-8")
+    return path
+
+
+def test_compile_round_trip(source, tmp_path):
+    target = tmp_path / "words.pgwl"
+    assert compile_wordlist(str(source), str(target)) == len(WORDS)
+    wordlist = Wordlist(str(target))
+    assert [wordlist[i] for i in range(len(wordlist))] == WORDS
+    with pytest.raises(IndexError):
+        wordlist[len(WORDS)]
+    wordlist.close()
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+
+@pytest.mark.parametrize("text, expected", [
+    # Без номера записью считается вся строка, а не последнее поле
+    ("the 23135851162\nof 13151942776\n", ["the 23135851162", "of 13151942776"]),
+    ("  new york \nlos angeles\n\n", ["new york", "los angeles"]),
+    ("11111 ice cream\n12345\tabc\n", ["ice cream", "abc"]),
+    ("17 apples\n2024 year\n", ["17 apples", "2024 year"]),
+])
+def test_source_formats(tmp_path, text, expected):
+    path = tmp_path / "list.txt"
+    path.write_text(text, encoding="utf-8")
+    target = tmp_path / "list.pgwl"
+    assert compile_wordlist(str(path), str(target)) == len(expected)
+    wordlist = Wordlist(str(target))
+    assert [wordlist[i] for i in range(len(wordlist))] == expected
+    wordlist.close()
+
+
+def test_open_compiles_into_cache_not_next_to_source(source, tmp_path):
+    wordlist = open_wordlist(str(source))
+    assert os.path.dirname(wordlist.path) == cache_dir()
+    assert sorted(os.listdir(tmp_path)) == ["cache", "words.txt"]
+    phrases = generate_passphrases(wordlist, 50, words=4, separator=" ")
+    assert all(len(phrase.split(" ")) == 4 and set(phrase.split(" ")) <= set(WORDS)
+               for phrase in phrases)
+    assert passphrase_entropy_bits(wordlist, 4) == pytest.approx(4 * 2.585, abs=0.01)
+
+
+def test_source_change_is_picked_up(source):
+    assert len(open_wordlist(str(source))) == len(WORDS)
+    source.write_text("one\ntwo\nthree\n", encoding="utf-8")
+    os.utime(source, ns=(1, 1))
+    assert [open_wordlist(str(source))[i] for i in range(3)] == ["one", "two", "three"]
+
+
+def test_read_only_source_directory(source, tmp_path):
+    os.chmod(tmp_path, 0o555)
+    try:
+        assert len(open_wordlist(str(source))) == len(WORDS)
+    finally:
+        os.chmod(tmp_path, 0o755)
+
+
+@pytest.mark.parametrize("content", [
+    b"PGWL",
+    b"PGWL\x01\x00\x00\x00",
+    HEADER.pack(b"PGWL", 1, 0, 0, 1000) + b"\x00" * 16,
+])
+def test_corrupt_file_raises_value_error(tmp_path, content):
+    path = tmp_path / "broken.pgwl"
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        Wordlist(str(path))
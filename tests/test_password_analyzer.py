@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from analyzer import Blocklist
+from analyzer.PasswordAnalyzer import IncrementalAnalyzer, analyze_password
+from bench.Benchmarks import synthetic_corpus
+
+
+@pytest.fixture(autouse=True)
+def no_blocklist(monkeypatch):
+    # Проверки не должны зависеть от PASSGEN_BLOCKLIST окружения
+    monkeypatch.setattr(Blocklist, "_blocklist", None)
+    monkeypatch.setattr(Blocklist, "_blocklist_loaded", True)
+
+
+def assert_same(analyzer, password):
+    expected = analyze_password(password).as_dict()
+    assert analyzer.update(password).as_dict() == expected, password
+
+
+def edits(password, rng):
+    """Последовательность вариантов пароля при наборе с правками."""
+    text = ""
+    for char in password:
+        text += char
+        yield text
+        if rng.random() < 0.2:
+            cut = rng.randint(0, len(text))
+            text = text[:cut]
+            yield text
+        elif rng.random() < 0.1 and text:
+            position = rng.randrange(len(text))
+            text = text[:position] + rng.choice("aA1!") + text[position + 1:]
+            yield text
+
+
+def test_incremental_matches_full_analysis():
+    rng = random.Random(3)
+    analyzer = IncrementalAnalyzer()
+    for password in synthetic_corpus(300):
+        for variant in edits(password, rng):
+            assert_same(analyzer, variant)
+
+
+def test_incremental_after_reset_and_unaligned_lower():
+    analyzer = IncrementalAnalyzer()
+    # "İ".lower() длиннее исходного символа: полная проверка
+    for variant in ("İabc", "İabcQ", "abcQ", "aaa", ""):
+        assert_same(analyzer, variant)
+    analyzer.reset()
+    assert_same(analyzer, "x9$Kq!2m")
+
+
+def test_analysis_flags():
+    result = analyze_password("Qwerty111!")
+    assert not result.sequences and not result.repeats
+    assert result.uppercase and result.digits and result.special
+    assert analyze_password("x9$Kq!2mZr@7").percent == 100
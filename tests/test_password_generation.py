@@ -0,0 +1,72 @@
+import string
+from collections import Counter
+
+import pytest
+
+from generator.PasswordGeneration import (
+    generate_lines, generate_packed, generate_password, generate_passwords,
+    get_alphabet, iter_passwords, random_below
+)
+
+
+def test_generate_password_uses_alphabet():
+    alphabet = set(get_alphabet(True, False))
+    password = generate_password(20, use_digits=True, use_special_chars=False)
+    assert len(password) == 20
+    assert set(password) <= alphabet
+
+
+def test_generate_packed_length_and_alphabet():
+    packed = generate_packed(1000, 16)
+    assert len(packed) == 16000
+    assert set(packed.decode("ascii")) <= set(get_alphabet())
+
+
+def test_generate_packed_is_roughly_uniform():
+    alphabet = get_alphabet()
+    counts = Counter(generate_packed(20000, 12).decode("ascii"))
+    expected = 20000 * 12 / len(alphabet)
+    # Отклонение больше 15% на 2600 ожидаемых попаданий практически невозможно
+    assert set(counts) == set(alphabet)
+    assert all(abs(count - expected) < expected * 0.15 for count in counts.values())
+
+
+def test_generate_lines_and_batches_agree_in_shape():
+    lines = generate_lines(5, 10).split(b"\n")
+    assert lines[-1] == b"" and len(lines) == 6
+    assert all(len(line) == 10 for line in lines[:-1])
+    assert len(generate_passwords(7, 9)) == 7
+    assert [len(p) for p in iter_passwords(5, 11, batch_size=2)] == [11] * 5
+
+
+@pytest.mark.parametrize("function", [iter_passwords, generate_passwords])
+def test_negative_count_rejected_up_front(function):
+    with pytest.raises(ValueError):
+        function(-1)
+
+
+@pytest.mark.parametrize("function", [iter_passwords, generate_passwords])
+def test_length_validated_even_for_zero_count(function):
+    with pytest.raises(ValueError):
+        function(0, 3)
+
+
+def test_letters_only_rejected():
+    with pytest.raises(ValueError):
+        generate_password(12, use_digits=False, use_special_chars=False)
+
+
+def test_random_below_range():
+    values = random_below(5000, 10)
+    assert len(values) == 5000
+    assert set(values) == set(range(10))
+    assert random_below(3, 1) == [0, 0, 0]
+    with pytest.raises(ValueError):
+        random_below(1, 0)
+
+
+def test_cli_generate_validates_length_for_zero_count(capsys):
+    from Main import run_cli
+
+    assert run_cli(["generate", "--count", "0", "--length", "3"]) == 2
+    assert run_cli(["generate", "--count", "3", "--length", "3"]) == 2
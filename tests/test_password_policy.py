@@ -0,0 +1,71 @@
+import os
+import pickle
+import string
+
+import pytest
+
+import Main
+from analyzer.SequenceMatcher import find_sequences
+from generator.PasswordPolicy import PasswordPolicy, get_policy
+
+
+def test_minimums_are_met():
+    policy = get_policy(12, min_lowercase=2, min_uppercase=3, min_digits=4, min_special=1)
+    for password in policy.generate_many(500):
+        assert len(password) == 12
+        assert sum(c in string.ascii_lowercase for c in password) >= 2
+        assert sum(c in string.ascii_uppercase for c in password) >= 3
+        assert sum(c in string.digits for c in password) >= 4
+        assert sum(c in string.punctuation for c in password) >= 1
+
+
+def test_constraints_are_met():
+    policy = get_policy(24, max_repeat=1, no_sequences=True, exclude_ambiguous=True)
+    for password in policy.generate_many(300):
+        assert all(a != b for a, b in zip(password, password[1:]))
+        assert not find_sequences(password)
+        assert not set(password) & set("Il1|O0o")
+
+
+@pytest.mark.parametrize("classes, max_repeat", [
+    ((("abc", 5), ("0123", 4)), None),
+    ((("a", 2), ("0123456789", 1)), 1),
+    ((("", 1), ("0123456789", 1)), None),
+])
+def test_infeasible_policy_rejected_up_front(classes, max_repeat):
+    with pytest.raises(ValueError):
+        PasswordPolicy(8, classes, max_repeat)
+
+
+def test_pickled_policy_gets_own_entropy():
+    policy = get_policy(16)
+    copy = pickle.loads(pickle.dumps(policy))
+    assert copy._entropy is not policy._entropy
+    assert len(copy.generate()) == 16
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="нужен fork")
+def test_fork_does_not_repeat_entropy():
+    policy = get_policy(16)
+    policy.generate()
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.write(write_end, policy.generate().encode())
+        os._exit(0)
+    os.close(write_end)
+    os.waitpid(pid, 0)
+    child = os.read(read_end, 64).decode()
+    os.close(read_end)
+    assert child != policy.generate()
+
+
+@pytest.mark.parametrize("argv", [
+    ["generate", "--no-digits", "--min-digits", "2"],
+    ["generate", "--no-special", "--min-special", "1"],
+])
+def test_cli_rejects_minimum_for_excluded_class(argv, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        Main.run_cli(argv)
+    assert exit_info.value.code == 2
+    assert "not allowed with" in capsys.readouterr().err
@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from generator.PasswordGeneration import get_alphabet
+from generator.PasswordPool import PasswordPool
+
+
+def test_passwords_are_issued_once():
+    with PasswordPool(capacity=32) as pool:
+        passwords = [pool.get(16) for _ in range(500)]
+    assert len(set(passwords)) == len(passwords)
+    assert all(len(p) == 16 and set(p) <= set(get_alphabet()) for p in passwords)
+
+
+def test_refill_goes_through_schedule():
+    jobs = []
+    pool = PasswordPool(capacity=8, schedule=jobs.append)
+    pool.get(12)
+    # Пул не пополняется сам: задача ждет исполнителя
+    assert len(jobs) == 1 and pool.stats() == {(12, True, True): 0}
+    pool.get(12)
+    assert len(jobs) == 1
+    jobs.pop()()
+    assert pool.stats() == {(12, True, True): 8}
+    pool.close()
+
+
+def test_refill_in_worker_thread():
+    threads = []
+
+    def schedule(job):
+        thread = threading.Thread(target=job)
+        threads.append(thread)
+        thread.start()
+
+    pool = PasswordPool(capacity=16, schedule=schedule)
+    pool.get(10, use_special_chars=False)
+    for thread in threads:
+        thread.join()
+    assert pool.stats() == {(10, True, False): 16}
+    assert all(len(pool.get(10, use_special_chars=False)) == 10 for _ in range(20))
+    pool.close()
+
+
+def test_lru_eviction_and_validation():
+    pool = PasswordPool(capacity=4, max_pools=2)
+    for length in (8, 9, 10):
+        pool.get(length)
+    assert sorted(key[0] for key in pool.stats()) == [9, 10]
+    with pytest.raises(ValueError):
+        pool.get(4)
+    pool.close()
+    with pytest.raises(RuntimeError):
+        pool.get(12)
+
+
+def test_issued_and_dropped_slots_are_wiped():
+    jobs = []
+    pool = PasswordPool(capacity=8, max_pools=1, schedule=jobs.append)
+    pool.get(12)
+    jobs.pop()()
+    ring = pool.pools[(12, True, True)]
+    password = pool.get(12)
+    # Слот выданного пароля затерт, остальные 7 паролей на месте
+    assert password.encode("ascii") not in ring.buffer
+    assert ring.buffer.count(bytes(12)) >= 1 and ring.size == 7
+    pool.get(14)
+    assert ring.buffer == bytes(len(ring.buffer))
+    evicted = pool.pools[(14, True, True)]
+    jobs.pop()()
+    pool.close()
+    assert evicted.buffer == bytes(len(evicted.buffer))
+
+
+def test_default_refill_runs_in_pool_thread(monkeypatch):
+    from generator import PasswordPool as module
+
+    threads = []
+    generate = module.generate_packed
+
+    def recording(*args):
+        threads.append(threading.get_ident())
+        return generate(*args)
+
+    monkeypatch.setattr(module, "generate_packed", recording)
+    pool = PasswordPool(capacity=64)
+    pool.get(12)
+    # Рабочий поток один: пустая задача завершится после пополнения
+    pool._executor.submit(lambda: None).result()
+    assert threading.get_ident() in threads
+    assert len(set(threads)) == 2
+    assert pool.stats() == {(12, True, True): 64}
+    pool.close()
+    with pytest.raises(RuntimeError):
+        pool._executor.submit(lambda: None)
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from analyzer import PasswordAnalyzer
+from analyzer.SequenceMatcher import (
+    DEFAULT_DICTIONARIES, DICTIONARIES, MAX_EXTRA_CHARS, MIN_SEQUENCE_LENGTH,
+    SequenceMatcher, build_matcher, expand_walks, walk_suffixes
+)
+from bench.Benchmarks import synthetic_corpus
+from generator.PasswordPolicy import _forbidden_chars
+
+PATTERNS = {name: expand_walks(DICTIONARIES[name]) for name in DEFAULT_DICTIONARIES}
+ALPHABET = "".join(sorted({char for patterns in PATTERNS.values()
+                           for pattern in patterns for char in pattern}))
+
+
+def naive_find_all(text):
+    """Эталон: поиск каждого шаблона подстрокой."""
+    matches = set()
+    for name, patterns in PATTERNS.items():
+        for pattern in set(patterns):
+            start = text.find(pattern)
+            while start >= 0:
+                matches.add((start, len(pattern), name))
+                start = text.find(pattern, start + 1)
+    return sorted(matches)
+
+
+def random_texts(count=300, seed=7):
+    rng = random.Random(seed)
+    # Небольшой алфавит, чтобы последовательности встречались часто
+    alphabet = ALPHABET[:20] + "abcdefqwerty123йцу"
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+            for _ in range(count)]
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return build_matcher()
+
+
+def test_find_all_matches_naive_search(matcher):
+    for text in random_texts() + [p.lower() for p in synthetic_corpus(400)]:
+        found = sorted(set(tuple(match) for match in matcher.find_all(text)))
+        assert found == naive_find_all(text), text
+
+
+def test_contains_matches_naive_search(matcher):
+    for text in random_texts(seed=11):
+        assert matcher.contains(text) == bool(naive_find_all(text)), text
+
+
+def test_reversed_and_cyrillic_walks(matcher):
+    assert matcher.contains("zyx")
+    assert matcher.contains("пароль-фыва")
+    assert not matcher.contains("x9$kq!2m")
+
+
+def test_extra_walks_are_lowercased():
+    matcher = build_matcher(names=(), extra={"custom": ["ZQXJ"]})
+    assert [tuple(m) for m in matcher.find_all("..zqx..")] == [(2, 3, "custom")]
+    assert not matcher.contains("abc")
+
+
+def random_walks(count, seed=5):
+    rng = random.Random(seed)
+    return ["".join(rng.choice("abcdefghij") for _ in range(8)) for _ in range(count)]
+
+
+def test_sparse_rows_match_dense_table():
+    dictionaries = {"walks": walk_suffixes(random_walks(200))}
+    dense = SequenceMatcher(dictionaries, dense=True, min_prefix=MIN_SEQUENCE_LENGTH)
+    sparse = SequenceMatcher(dictionaries, dense=False, min_prefix=MIN_SEQUENCE_LENGTH)
+    assert sparse.outputs == dense.outputs
+    assert all(sparse.full_row(state) == dense.transitions[state]
+               for state in range(len(dense.transitions)))
+    rng = random.Random(9)
+    for _ in range(300):
+        text = "".join(rng.choice("abcdefghijk") for _ in range(rng.randint(0, 30)))
+        assert sparse.find_all(text) == dense.find_all(text)
+        assert sparse.contains(text) == dense.contains(text)
+    assert _forbidden_chars(sparse) == _forbidden_chars(dense)
+
+
+def test_large_extra_uses_sparse_rows(monkeypatch):
+    matcher = build_matcher(extra={"walks": random_walks(1000)})
+    assert sum(len(row) for row in matcher.transitions) < 2 * len(matcher.transitions)
+    # Проверки, обходящие автомат напрямую, работают и с разреженными строками
+    monkeypatch.setattr(PasswordAnalyzer, "get_default_matcher", lambda: matcher)
+    analyzer = PasswordAnalyzer.IncrementalAnalyzer()
+    for password in ["Xabcdefgh1!", "Q" + random_walks(1)[0][:4] + "9!", "Zz1!zZ1!"]:
+        expected = not matcher.contains(password.lower())
+        assert PasswordAnalyzer.analyze_password(password).sequences == expected
+        assert analyzer.update(password).sequences == expected
+
+
+def test_extra_size_is_capped():
+    with pytest.raises(ValueError):
+        build_matcher(extra={"walks": ["abcdefghij"] * (MAX_EXTRA_CHARS // 10 + 1)})
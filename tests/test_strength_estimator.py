@@ -0,0 +1,85 @@
+import pytest
+
+from analyzer.StrengthEstimator import (
+    MAX_ANALYZED_LENGTH, MAX_COVER_SEGMENTS, _dictionary_matches, _lowest_ends,
+    _repeat_matches, _sequence_matches, estimate_strength, get_estimate_level
+)
+from bench.Benchmarks import ESTIMATE_WORST_CASE
+
+REPETITIVE = ["password" * 10, "qwerty" * 20, "1234567890" * 10, "a" * 64, "a" * 1000]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    estimate_strength.cache_clear()
+    yield
+    estimate_strength.cache_clear()
+
+
+@pytest.mark.parametrize("password", REPETITIVE)
+def test_repetitive_input_is_weak(password):
+    estimate = estimate_strength(password)
+    assert estimate.score <= 1
+    assert estimate.entropy_bits < 30
+
+
+def test_random_password_is_strong():
+    assert estimate_strength("x9$Kq!2mZr@7Lp#4").score == 4
+
+
+def test_common_passwords_are_weak():
+    assert estimate_strength("qwerty123").score == 0
+    assert estimate_strength("passwordpassword1").score == 0
+
+
+def test_whole_block_repeat_is_found():
+    segments = estimate_strength("aabaab").segments
+    assert [(s.kind, s.start, s.end) for s in segments] == [("repeat", 0, 6)]
+
+
+def test_tail_adds_only_length_variants():
+    head = "x9$Kq!2mZr@7Lp#4" * (MAX_ANALYZED_LENGTH // 16)
+    short = estimate_strength(head)
+    long = estimate_strength(head + "Zq7!" * 100)
+    assert long.segments[-1].kind == "tail"
+    assert long.guesses_log10 - short.guesses_log10 < 3
+
+
+def test_segments_cover_password():
+    password = "Tr0ub4dor&3correcthorse"
+    segments = estimate_strength(password).segments
+    assert segments[0].start == 0 and segments[-1].end == len(password)
+    assert all(a.end == b.start for a, b in zip(segments, segments[1:]))
+
+
+def test_level_matches_score():
+    assert get_estimate_level(estimate_strength("a" * 64)) == "Слабый"
+
+
+def candidate_matches(password):
+    head = password[:MAX_ANALYZED_LENGTH]
+    repeats = _repeat_matches(head)
+    lowest_ends = _lowest_ends(len(head), repeats)
+    return (_dictionary_matches(head, lowest_ends)
+            + _sequence_matches(head, lowest_ends) + repeats)
+
+
+# Задержка проверяется в bench (см. ESTIMATE_WORST_CASE и бюджеты в
+# bench/Benchmarks.py); здесь - структурные границы работы оценки
+@pytest.mark.parametrize("password", REPETITIVE + ["x9$Kq!2mZr@7Lp#4" * 16])
+def test_repeats_leave_no_inner_matches(password):
+    assert len(candidate_matches(password)) == 1
+
+
+@pytest.mark.parametrize("password", ESTIMATE_WORST_CASE)
+def test_work_is_bounded(password):
+    head_length = min(len(password), MAX_ANALYZED_LENGTH)
+    assert len(candidate_matches(password)) <= 2 * head_length
+    assert len(estimate_strength(password).segments) <= MAX_COVER_SEGMENTS + 1
+
+
+def test_repeat_continues_into_tail():
+    estimate = estimate_strength("abc" * 90 + "xyz!")
+    assert [s.kind for s in estimate.segments] == ["repeat", "tail"]
+    assert estimate.segments[0].end == 270
+    assert estimate.score <= 1
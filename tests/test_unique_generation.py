@@ -0,0 +1,63 @@
+import itertools
+
+import pytest
+
+from generator import UniqueGeneration
+from generator.PasswordGeneration import get_alphabet
+from generator.PasswordPolicy import PasswordPolicy
+from generator.UniqueGeneration import iter_unique_lines
+from utils.IssuedIndex import IssuedIndex
+
+# Пространство из 2^8 = 256 паролей
+TINY_POLICY = PasswordPolicy(8, (("ab", 0),))
+
+
+def unique(index, count, **options):
+    return b"".join(iter_unique_lines(index, count, **options)).split(b"\n")[:-1]
+
+
+def test_two_runs_never_overlap(tmp_path):
+    with IssuedIndex(str(tmp_path), capacity=10_000) as index:
+        first = unique(index, 300, length=10, workers=2)
+    with IssuedIndex(str(tmp_path), capacity=10_000) as index:
+        second = unique(index, 300, length=10, workers=2)
+        assert len(index) == 600
+    assert len(first) == len(second) == 300
+    assert len(set(first) | set(second)) == 600
+    alphabet = set(get_alphabet().encode("ascii"))
+    assert all(len(p) == 10 and set(p) <= alphabet for p in first + second)
+
+
+def test_policy_is_honoured_until_space_is_exhausted(tmp_path):
+    with IssuedIndex(str(tmp_path), capacity=10_000) as index:
+        first = unique(index, 100, policy=TINY_POLICY)
+        # Отбракованные повторы догенерируются: выдается ровно count
+        second = unique(index, 100, policy=TINY_POLICY)
+    assert len(set(first) | set(second)) == 200
+    assert all(len(p) == 8 and set(p) <= set(b"ab") for p in first + second)
+
+
+def test_exhausted_space_stops_after_stalled_rounds(tmp_path, monkeypatch):
+    rounds = []
+    original = PasswordPolicy.generate_many
+
+    def counting(self, count):
+        rounds.append(count)
+        return original(self, count)
+
+    monkeypatch.setattr(PasswordPolicy, "generate_many", counting)
+    with IssuedIndex(str(tmp_path), capacity=10_000) as index:
+        space = ["".join(p).encode() for p in itertools.product("ab", repeat=8)]
+        assert len(index.add_new(space)) == 256
+        with pytest.raises(ValueError):
+            unique(index, 1, policy=TINY_POLICY)
+    assert len(rounds) == UniqueGeneration.MAX_STALLED_ROUNDS
+
+
+def test_arguments_validated(tmp_path):
+    with IssuedIndex(str(tmp_path), capacity=1000) as index:
+        with pytest.raises(ValueError):
+            unique(index, -1)
+        with pytest.raises(ValueError):
+            unique(index, 5, length=7)
+        assert unique(index, 0) == []
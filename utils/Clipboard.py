@@ -3,19 +3,221 @@
 
 Предоставляет безопасные функции копирования текста в системный буфер обмена
 с обработкой ошибок и проверкой поддерживаемых типов данных.
+
+Бэкенды выбираются в порядке убывания скорости:
+
+1. буфер обмена Tk внутри процесса (если приложению передан корень Tk
+   через use_tk_root) - без запуска внешних процессов;
+2. постоянный вспомогательный процесс utils/ClipboardHelper.py, который
+   запускается один раз и обслуживает все последующие копирования;
+3. pyperclip (импортируется только при необходимости).
+
+Скопированное значение можно автоматически стереть через заданное время;
+буфер очищается, только если в нем все еще находится наше значение.
 """
 
-import pyperclip
-from typing import Union
+import hashlib
+import os
+import subprocess
+import sys
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, Union
+
+from utils.Metrics import timed
 
+# Время автоматической очистки буфера по умолчанию, секунд (None - не очищать)
+DEFAULT_CLEAR_AFTER: Optional[float] = 30.0
 
-def copy_to_clipboard(text: Union[str, int, float]) -> bool:
+
+class ClipboardBackend(ABC):
+    """
+    Базовый класс бэкенда буфера обмена.
+
+    Наследники обязаны реализовать copy и paste; clear и schedule
+    имеют реализации по умолчанию.
+    """
+
+    @abstractmethod
+    def copy(self, text: str) -> None:
+        """Помещает text в буфер обмена."""
+
+    @abstractmethod
+    def paste(self) -> str:
+        """Возвращает текущее содержимое буфера обмена."""
+
+    def clear(self) -> None:
+        self.copy("")
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> None:
+        """Вызывает callback через delay секунд."""
+        timer = threading.Timer(delay, callback)
+        timer.daemon = True
+        timer.start()
+
+
+class TkClipboard(ClipboardBackend):
+    """Буфер обмена через существующий корень Tk (в текущем процессе)."""
+
+    def __init__(self, root) -> None:
+        self.root = root
+
+    def copy(self, text: str) -> None:
+        self.root.clipboard_clear()
+        self.root.clipboard_append(text)
+
+    def paste(self) -> str:
+        return self.root.clipboard_get()
+
+    def clear(self) -> None:
+        self.root.clipboard_clear()
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> None:
+        # Очистка выполняется в потоке Tk
+        self.root.after(int(delay * 1000), callback)
+
+
+class HelperProcessClipboard(ClipboardBackend):
+    """Буфер обмена через постоянный вспомогательный процесс."""
+
+    def __init__(self) -> None:
+        helper = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              "ClipboardHelper.py")
+        self.lock = threading.Lock()
+        self.process = subprocess.Popen(
+            [sys.executable, helper],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        if self._read_response() != "READY":
+            self.close()
+            raise RuntimeError("Вспомогательный процесс буфера обмена не запущен")
+
+    def _read_response(self) -> str:
+        header = self.process.stdout.readline()
+        if not header.startswith(b"OK "):
+            raise RuntimeError("Ошибка вспомогательного процесса буфера обмена")
+        size = int(header[3:])
+        return self.process.stdout.read(size).decode("utf-8")
+
+    def _command(self, kind: bytes, payload: str = "") -> str:
+        encoded = payload.encode("utf-8")
+        with self.lock:
+            self.process.stdin.write(kind + str(len(encoded)).encode() + b"\n" + encoded)
+            self.process.stdin.flush()
+            return self._read_response()
+
+    def copy(self, text: str) -> None:
+        self._command(b"C", text)
+
+    def paste(self) -> str:
+        return self._command(b"G")
+
+    def clear(self) -> None:
+        self._command(b"X")
+
+    def close(self) -> None:
+        """Завершает вспомогательный процесс."""
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+
+
+class PyperclipClipboard(ClipboardBackend):
+    """Буфер обмена через pyperclip."""
+
+    def __init__(self) -> None:
+        import pyperclip
+        self.pyperclip = pyperclip
+
+    def copy(self, text: str) -> None:
+        self.pyperclip.copy(text)
+
+    def paste(self) -> str:
+        return self.pyperclip.paste()
+
+
+_backend: Optional[ClipboardBackend] = None
+_backend_lock = threading.Lock()
+# SHA-256 последнего скопированного значения (само значение не хранится)
+_last_digest: Optional[bytes] = None
+
+
+def _has_display() -> bool:
+    """Есть ли графическое окружение для вспомогательного процесса."""
+    if sys.platform in ("win32", "darwin"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def use_tk_root(root) -> None:
+    """Переключает модуль на буфер обмена Tk указанного корневого окна."""
+    global _backend
+    with _backend_lock:
+        if isinstance(_backend, HelperProcessClipboard):
+            _backend.close()
+        _backend = TkClipboard(root)
+
+
+def get_tk_root():
+    """Возвращает корень Tk, буфер обмена которого используется (или None)."""
+    backend = _backend
+    return backend.root if isinstance(backend, TkClipboard) else None
+
+
+def get_backend() -> ClipboardBackend:
+    """Возвращает текущий бэкенд, создавая его при первом обращении."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            if _has_display():
+                try:
+                    _backend = HelperProcessClipboard()
+                except (OSError, RuntimeError):
+                    _backend = None
+            if _backend is None:
+                _backend = PyperclipClipboard()
+        return _backend
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def clear_if_unchanged(digest: bytes) -> bool:
+    """
+    Очищает буфер, если в нем все еще значение с хешем digest.
+
+    Возвращает True, если буфер был очищен.
+    """
+    global _last_digest
+    if _last_digest != digest:
+        return False
+    try:
+        backend = get_backend()
+        if _digest(backend.paste()) != digest:
+            return False
+        backend.clear()
+        _last_digest = None
+        return True
+    except Exception:
+        return False
+
+
+@timed("copy_to_clipboard")
+def copy_to_clipboard(text: Union[str, int, float],
+                      clear_after: Optional[float] = DEFAULT_CLEAR_AFTER) -> bool:
     """
     Копирует текст в системный буфер обмена безопасным способом.
 
     Параметры:
         text (str|int|float): Текст для копирования. Числа автоматически
                             преобразуются в строку.
+        clear_after (float|None): Через сколько секунд очистить буфер, если
+                            в нем останется это значение (None - не очищать).
 
     Возвращает:
         bool: True если копирование успешно, False при ошибке.
@@ -23,6 +225,8 @@ def copy_to_clipboard(text: Union[str, int, float]) -> bool:
     Исключения:
         TypeError: Если передан неподдерживаемый тип данных
     """
+    global _last_digest
+
     # Проверка и преобразование входных данных
     if text is None:
         return False
@@ -38,10 +242,14 @@ def copy_to_clipboard(text: Union[str, int, float]) -> bool:
         return False
 
     try:
-        pyperclip.copy(text_str)
-        return True
-    except pyperclip.PyperclipException:
-        return False
+        backend = get_backend()
+        backend.copy(text_str)
     except Exception as e:
-        # Перехват всех остальных исключений
+        # Перехват всех исключений бэкенда (в том числе PyperclipException)
         return False
+
+    digest = _digest(text_str)
+    _last_digest = digest
+    if clear_after is not None:
+        backend.schedule(clear_after, lambda: clear_if_unchanged(digest))
+    return True
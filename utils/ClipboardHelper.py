@@ -0,0 +1,94 @@
+"""
+Вспомогательный процесс для работы с буфером обмена без окна приложения.
+
+Запускается модулем utils.Clipboard один раз и живет, пока открыт его
+stdin. Держит скрытое корневое окно Tk (владельца буфера обмена) и
+выполняет команды, поступающие через stdin:
+
+    C<длина>\\n<текст>  - скопировать текст
+    G\\n               - вернуть содержимое буфера
+    X\\n               - очистить буфер
+
+На каждую команду отвечает строкой "OK <длина>\\n<данные>" или "ERR\\n".
+Модуль не импортирует другие модули пакета.
+"""
+
+import queue
+import sys
+import threading
+
+
+def read_commands(stream, commands: "queue.Queue") -> None:
+    """Читает команды из stdin в отдельном потоке."""
+    while True:
+        header = stream.readline()
+        if not header:
+            commands.put(None)
+            return
+        kind, size = header[:1], header[1:].strip()
+        payload = stream.read(int(size)).decode("utf-8") if size else ""
+        commands.put((kind, payload))
+
+
+def respond(data: str = "", ok: bool = True) -> None:
+    """Отправляет ответ родительскому процессу."""
+    out = sys.stdout.buffer
+    if ok:
+        encoded = data.encode("utf-8")
+        out.write(b"OK %d\n" % len(encoded) + encoded)
+    else:
+        out.write(b"ERR\n")
+    out.flush()
+
+
+def main() -> None:
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+        root.withdraw()
+    except Exception:
+        respond(ok=False)
+        return
+
+    commands: "queue.Queue" = queue.Queue()
+    threading.Thread(
+        target=read_commands,
+        args=(sys.stdin.buffer, commands),
+        daemon=True
+    ).start()
+
+    def process() -> None:
+        while True:
+            try:
+                command = commands.get_nowait()
+            except queue.Empty:
+                break
+            if command is None:
+                root.destroy()
+                return
+            kind, payload = command
+            try:
+                if kind == b"C":
+                    root.clipboard_clear()
+                    root.clipboard_append(payload)
+                    root.update()
+                    respond()
+                elif kind == b"G":
+                    respond(root.clipboard_get())
+                elif kind == b"X":
+                    root.clipboard_clear()
+                    root.update()
+                    respond()
+                else:
+                    respond(ok=False)
+            except tk.TclError:
+                respond(ok=False)
+        root.after(5, process)
+
+    respond("READY")
+    root.after(5, process)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
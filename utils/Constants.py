@@ -0,0 +1,25 @@
+"""
+Общие константы форматов и параметров по умолчанию.
+
+Модуль ничего не импортирует: команды CLI берут из него варианты и
+значения по умолчанию для аргументов, не загружая модули реализации
+(см. бюджеты импорта в bench/ImportBudget.py).
+"""
+
+# Форматы результатов аудита и хеширования
+OUTPUT_FORMATS = ("csv", "jsonl")
+
+# Форматы корпуса утекших паролей: пароли или SHA-1 (в том числе "HEX:N")
+CORPUS_FORMATS = ("plain", "sha1")
+
+# Форматы индекса хешей (utils.HashIndex)
+INDEX_FORMATS = ("sorted", "bloom")
+
+# Ширина записи отсортированного индекса по умолчанию, байт
+DEFAULT_WIDTH = 8
+
+# Доля ложных срабатываний фильтра Блума по умолчанию
+DEFAULT_ERROR_RATE = 0.001
+
+# Алгоритмы медленного хеширования (pipeline.Hashing)
+HASH_ALGORITHMS = ("pbkdf2-sha256", "pbkdf2-sha512", "scrypt")
@@ -0,0 +1,326 @@
+"""
+Модуль компактных индексов хешей на диске.
+
+Поддерживает два формата файлов, которые читаются через mmap без загрузки
+в оперативную память:
+
+* отсортированный файл хешей фиксированной ширины (точный поиск
+  двоичным поиском);
+* фильтр Блума (вероятностный поиск проверкой битов).
+
+Оба формата начинаются с 16-байтного заголовка: сигнатура, версия,
+параметр формата и 64-битное число (количество записей или битов).
+"""
+
+import hashlib
+import heapq
+import math
+import mmap
+import os
+import struct
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Union
+
+from utils.Constants import DEFAULT_ERROR_RATE, DEFAULT_WIDTH
+
+HEADER = struct.Struct("<4sBBHQ")
+SORTED_MAGIC = b"PGSH"
+BLOOM_MAGIC = b"PGBF"
+FORMAT_VERSION = 1
+
+# Количество записей, сортируемых в памяти при внешней сортировке
+SORT_RUN_SIZE = 4_000_000
+
+
+def hash_key(value: Union[str, bytes]) -> bytes:
+    """Возвращает SHA-1 значения (строки кодируются в UTF-8)."""
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    return hashlib.sha1(value).digest()
+
+
+def read_header(path: str) -> tuple:
+    """Читает заголовок файла индекса."""
+    with open(path, "rb") as stream:
+        raw = stream.read(HEADER.size)
+    if len(raw) < HEADER.size:
+        raise ValueError(f"Файл индекса поврежден: {path}")
+    magic, version, param, _, value = HEADER.unpack(raw)
+    if magic not in (SORTED_MAGIC, BLOOM_MAGIC) or version != FORMAT_VERSION:
+        raise ValueError(f"Неизвестный формат индекса: {path}")
+    return magic, param, value
+
+
+class SortedHashIndex:
+    """Отсортированный файл хешей фиксированной ширины, открытый через mmap."""
+
+    __slots__ = ("path", "width", "count", "_file", "_map")
+
+    def __init__(self, path: str) -> None:
+        magic, width, count = read_header(path)
+        if magic != SORTED_MAGIC:
+            raise ValueError(f"Файл не является отсортированным индексом: {path}")
+        self.path = path
+        self.width = width
+        self.count = count
+        self._file = open(path, "rb")
+        self._map = (mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                     if count else None)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def contains_hash(self, digest: bytes) -> bool:
+        """Проверяет наличие хеша (используются первые width байт)."""
+        if not self.count:
+            return False
+        key = digest[:self.width]
+        width = self.width
+        data = self._map
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            offset = HEADER.size + middle * width
+            record = data[offset:offset + width]
+            if record < key:
+                low = middle + 1
+            elif record > key:
+                high = middle
+            else:
+                return True
+        return False
+
+    def __contains__(self, value: Union[str, bytes]) -> bool:
+        return self.contains_hash(hash_key(value))
+
+    def iter_records(self) -> Iterator[bytes]:
+        """Перебирает записи индекса по возрастанию."""
+        width = self.width
+        data = self._map
+        for offset in range(HEADER.size, HEADER.size + self.count * width, width):
+            yield data[offset:offset + width]
+
+    def close(self) -> None:
+        """Закрывает отображение и файл."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+class BloomFilter:
+    """Фильтр Блума в файле, открытый через mmap."""
+
+    __slots__ = ("path", "hashes", "bits", "_file", "_map")
+
+    def __init__(self, path: str, writable: bool = False) -> None:
+        magic, hashes, bits = read_header(path)
+        if magic != BLOOM_MAGIC:
+            raise ValueError(f"Файл не является фильтром Блума: {path}")
+        self.path = path
+        self.hashes = hashes
+        self.bits = bits
+        self._file = open(path, "r+b" if writable else "rb")
+        self._map = mmap.mmap(
+            self._file.fileno(), 0,
+            access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+        )
+
+    def _positions(self, digest: bytes) -> Iterator[int]:
+        """Позиции битов для хеша (двойное хеширование)."""
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:16], "little") | 1
+        bits = self.bits
+        for i in range(self.hashes):
+            yield (first + i * second) % bits
+
+    def contains_hash(self, digest: bytes) -> bool:
+        """Проверяет (вероятностно) наличие хеша."""
+        data = self._map
+        for position in self._positions(digest):
+            if not data[HEADER.size + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def add_hash(self, digest: bytes) -> bool:
+        """
+        Добавляет хеш в фильтр (файл должен быть открыт на запись).
+
+        Возвращает True, если хеш, вероятно, уже присутствовал.
+        """
+        data = self._map
+        present = True
+        for position in self._positions(digest):
+            index = HEADER.size + (position >> 3)
+            mask = 1 << (position & 7)
+            if not data[index] & mask:
+                present = False
+                data[index] |= mask
+        return present
+
+    def __contains__(self, value: Union[str, bytes]) -> bool:
+        return self.contains_hash(hash_key(value))
+
+    def flush(self) -> None:
+        """Сбрасывает изменения на диск."""
+        self._map.flush()
+
+    def close(self) -> None:
+        """Закрывает отображение и файл."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+def open_index(path: str, writable: bool = False) -> Union[SortedHashIndex, BloomFilter]:
+    """Открывает индекс, определяя формат по заголовку."""
+    magic, _, _ = read_header(path)
+    if magic == SORTED_MAGIC:
+        return SortedHashIndex(path)
+    return BloomFilter(path, writable=writable)
+
+
+def bloom_parameters(expected: int, error_rate: float) -> tuple:
+    """Возвращает (число битов, число хеш-функций) для фильтра Блума."""
+    if not 0 < error_rate < 1:
+        raise ValueError("Доля ложных срабатываний должна быть в интервале (0, 1)")
+    expected = max(expected, 1)
+    bits = math.ceil(-expected * math.log(error_rate) / (math.log(2) ** 2))
+    bits = max(64, (bits + 7) // 8 * 8)
+    hashes = max(1, min(255, round(bits / expected * math.log(2))))
+    return bits, hashes
+
+
+def create_bloom_filter(path: str, expected: int,
+                        error_rate: float = DEFAULT_ERROR_RATE) -> None:
+    """Создает пустой файл фильтра Блума, рассчитанный на expected записей."""
+    bits, hashes = bloom_parameters(expected, error_rate)
+    with open(path, "wb") as stream:
+        stream.write(HEADER.pack(BLOOM_MAGIC, FORMAT_VERSION, hashes, 0, bits))
+        stream.truncate(HEADER.size + bits // 8)
+
+
+def write_bloom_filter(path: str, digests: Iterable[bytes], expected: int,
+                       error_rate: float = DEFAULT_ERROR_RATE) -> int:
+    """
+    Создает фильтр Блума из хешей.
+
+    Возвращает количество добавленных хешей.
+    """
+    create_bloom_filter(path, expected, error_rate)
+    bloom = BloomFilter(path, writable=True)
+    added = 0
+    try:
+        for digest in digests:
+            bloom.add_hash(digest)
+            added += 1
+        bloom.flush()
+    finally:
+        bloom.close()
+    return added
+
+
+def _write_run(records: List[bytes], directory: str) -> str:
+    """Сортирует порцию записей и сохраняет ее во временный файл."""
+    import tempfile  # нужен только при сборке больших индексов
+
+    records.sort()
+    handle, path = tempfile.mkstemp(prefix="passgen-run-", dir=directory)
+    with os.fdopen(handle, "wb") as stream:
+        stream.write(b"".join(records))
+    return path
+
+
+def _read_run(path: str, width: int) -> Iterator[bytes]:
+    """Читает записи из временного файла сортировки."""
+    with open(path, "rb", buffering=1024 * 1024) as stream:
+        while True:
+            record = stream.read(width)
+            if len(record) < width:
+                return
+            yield record
+
+
+def _write_sorted(stream: BinaryIO, records: Iterable[bytes], width: int) -> int:
+    """Записывает отсортированные записи без дубликатов, возвращает их число."""
+    stream.write(HEADER.pack(SORTED_MAGIC, FORMAT_VERSION, width, 0, 0))
+    count = 0
+    previous: Optional[bytes] = None
+    for record in records:
+        if record != previous:
+            stream.write(record)
+            count += 1
+            previous = record
+    stream.seek(0)
+    stream.write(HEADER.pack(SORTED_MAGIC, FORMAT_VERSION, width, 0, count))
+    return count
+
+
+def write_sorted_index(path: str, digests: Iterable[bytes],
+                       width: int = DEFAULT_WIDTH,
+                       run_size: int = SORT_RUN_SIZE) -> int:
+    """
+    Создает отсортированный индекс из хешей внешней сортировкой.
+
+    В памяти одновременно находится не более run_size записей. Возвращает
+    количество уникальных записей в индексе.
+    """
+    if not 1 <= width <= 20:
+        raise ValueError("Ширина записи должна быть от 1 до 20 байт")
+
+    directory = os.path.dirname(os.path.abspath(path))
+    runs: List[str] = []
+    records: List[bytes] = []
+    try:
+        for digest in digests:
+            records.append(digest[:width])
+            if len(records) >= run_size:
+                runs.append(_write_run(records, directory))
+                records = []
+
+        with open(path, "wb", buffering=1024 * 1024) as stream:
+            if not runs:
+                records.sort()
+                return _write_sorted(stream, records, width)
+            if records:
+                runs.append(_write_run(records, directory))
+                records = []
+            merged = heapq.merge(*(_read_run(run, width) for run in runs))
+            return _write_sorted(stream, merged, width)
+    finally:
+        for run in runs:
+            os.remove(run)
+
+
+def write_sorted_records(path: str, records: bytes, width: int) -> int:
+    """
+    Создает отсортированный индекс из готового блока записей.
+
+    records - уже отсортированные записи ширины width без повторов,
+    записанные подряд. Возвращает количество записей.
+    """
+    if not 1 <= width <= 20:
+        raise ValueError("Ширина записи должна быть от 1 до 20 байт")
+    if len(records) % width:
+        raise ValueError("Размер блока записей не кратен их ширине")
+    count = len(records) // width
+    with open(path, "wb") as stream:
+        stream.write(HEADER.pack(SORTED_MAGIC, FORMAT_VERSION, width, 0, count))
+        stream.write(records)
+    return count
+
+
+def merge_sorted_indexes(path: str, sources: List[SortedHashIndex]) -> int:
+    """
+    Сливает отсортированные индексы одной ширины в новый файл path.
+
+    Записи читаются потоком, без загрузки в память. Возвращает количество
+    уникальных записей в результате.
+    """
+    widths = {source.width for source in sources}
+    if len(widths) > 1:
+        raise ValueError("Ширина записей сливаемых индексов должна совпадать")
+    width = widths.pop() if widths else DEFAULT_WIDTH
+    merged = heapq.merge(*(source.iter_records() for source in sources))
+    with open(path, "wb", buffering=1024 * 1024) as stream:
+        return _write_sorted(stream, merged, width)
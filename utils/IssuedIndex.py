@@ -0,0 +1,351 @@
+"""
+Модуль индекса выданных паролей.
+
+Индекс хранится в каталоге и пополняется только добавлением (по схеме
+LSM-дерева):
+
+* key - случайный ключ; вместо паролей хранятся их ключевые хеши
+  BLAKE2b, поэтому по файлам индекса нельзя перебирать пароли
+  по готовым таблицам;
+* journal.bin - журнал хешей, выданных после последнего сброса:
+  записывается до выдачи паролей, при открытии индекса воспроизводится;
+* segment-NNNNNN.pgsh - отсортированные сегменты (формат
+  utils.HashIndex), создаются при сбросе журнала и не изменяются;
+* bloom.pgbf - фильтр Блума по всем хешам: большинство новых паролей
+  отсеивается без обращения к сегментам.
+* lock - файл рекомендательной блокировки (flock, в Windows
+  msvcrt.locking): индекс открыт не более чем одним процессом, а после
+  аварийного завершения блокировка снимается сама.
+
+В памяти держатся только хеши из журнала (не более memtable_size),
+компактными блоками по DIGEST_SIZE байт на хеш; при переполнении они
+сбрасываются в новый сегмент. Когда сегментов становится больше
+max_segments, они сливаются в один. Ложные срабатывания
+фильтра Блума и совпадения укороченных хешей приводят лишь к отбраковке
+нового пароля, поэтому выданный пароль никогда не повторяется.
+"""
+
+import glob
+import hashlib
+import math
+import os
+import sys
+from typing import Iterable, Iterator, List, Set, Union
+
+from utils.Constants import DEFAULT_ERROR_RATE
+from utils.HashIndex import (
+    BloomFilter, SortedHashIndex, create_bloom_filter, merge_sorted_indexes,
+    write_sorted_records
+)
+
+# Ширина хеша в индексе, байт (фильтру Блума нужно не менее 16)
+DIGEST_SIZE = 16
+
+# Количество хешей журнала, после которого создается новый сегмент
+MEMTABLE_SIZE = 1 << 20
+
+# Число бит хеша, по которым журнал в памяти делится на корзины
+BUCKET_BITS = 12
+
+# Количество сегментов, после которого они сливаются в один
+MAX_SEGMENTS = 8
+
+# Расчетное число записей фильтра Блума нового индекса
+DEFAULT_CAPACITY = 10_000_000
+
+KEY_FILE = "key"
+JOURNAL_FILE = "journal.bin"
+BLOOM_FILE = "bloom.pgbf"
+LOCK_FILE = "lock"
+SEGMENT_PATTERN = "segment-*.pgsh"
+
+
+def _lock_file(handle: int) -> bool:
+    """
+    Берет рекомендательную блокировку открытого файла без ожидания.
+
+    Блокировку снимает система при закрытии файла, в том числе при
+    аварийном завершении процесса. Возвращает False, если файл уже
+    заблокирован.
+    """
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+            msvcrt.locking(handle, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock_file(handle: int) -> None:
+    if sys.platform == "win32":
+        import msvcrt
+        os.lseek(handle, 0, os.SEEK_SET)
+        msvcrt.locking(handle, msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class _Memtable:
+    """
+    Хеши журнала в памяти.
+
+    Хеши раскладываются по 1 << BUCKET_BITS корзинам по первым битам и
+    хранятся в них подряд в bytearray: DIGEST_SIZE байт на хеш без
+    накладных расходов на объекты Python. Корзина невелика, поэтому
+    поиск в ней - это bytearray.find, а сортировка нужна только при сбросе.
+    """
+
+    __slots__ = ("buckets", "count")
+
+    def __init__(self) -> None:
+        self.buckets = [bytearray() for _ in range(1 << BUCKET_BITS)]
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _bucket(self, digest: bytes) -> bytearray:
+        return self.buckets[int.from_bytes(digest[:4], "big") >> (32 - BUCKET_BITS)]
+
+    def __contains__(self, digest: bytes) -> bool:
+        bucket = self._bucket(digest)
+        position = bucket.find(digest)
+        # Совпадение может начинаться внутри записи: такие пропускаются
+        while position >= 0:
+            if position % DIGEST_SIZE == 0:
+                return True
+            position = bucket.find(digest, position + 1)
+        return False
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Перебирает хеши (без упорядочивания)."""
+        for bucket in self.buckets:
+            for offset in range(0, len(bucket), DIGEST_SIZE):
+                yield bytes(bucket[offset:offset + DIGEST_SIZE])
+
+    def add(self, digest: bytes) -> None:
+        """Добавляет хеш (вызывающий проверяет, что его еще нет)."""
+        self._bucket(digest).extend(digest)
+        self.count += 1
+
+    def sorted_records(self) -> bytes:
+        """Возвращает все хеши отсортированным блоком."""
+        for bucket in self.buckets:
+            records = [bucket[offset:offset + DIGEST_SIZE]
+                       for offset in range(0, len(bucket), DIGEST_SIZE)]
+            records.sort()
+            bucket[:] = b"".join(records)
+        return b"".join(self.buckets)
+
+
+class IssuedIndex:
+    """Индекс выданных паролей в каталоге directory."""
+
+    def __init__(self, directory: str, capacity: int = DEFAULT_CAPACITY,
+                 error_rate: float = DEFAULT_ERROR_RATE, memtable_size: int = MEMTABLE_SIZE,
+                 max_segments: int = MAX_SEGMENTS) -> None:
+        if memtable_size < 1:
+            raise ValueError("Размер журнала должен быть положительным")
+        if max_segments < 1:
+            raise ValueError("Число сегментов должно быть положительным")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.error_rate = error_rate
+        self.memtable_size = memtable_size
+        self.max_segments = max_segments
+        # Два одновременных запуска могли бы выдать одинаковые пароли.
+        # Файл блокировки не удаляется: после сбоя блокировку снимает система
+        self._lock_handle = os.open(self._path(LOCK_FILE), os.O_CREAT | os.O_RDWR, 0o600)
+        if not _lock_file(self._lock_handle):
+            os.close(self._lock_handle)
+            raise ValueError(f"Индекс уже используется другим процессом: {directory}")
+
+        try:
+            self.key = self._load_key()
+            bloom_path = self._path(BLOOM_FILE)
+            if not os.path.exists(bloom_path):
+                create_bloom_filter(bloom_path, capacity, error_rate)
+            self.bloom = BloomFilter(bloom_path, writable=True)
+            self.segments = [SortedHashIndex(path) for path in self._segment_paths()]
+            self.memtable = _Memtable()
+            self._replay_journal()
+            self.journal = open(self._path(JOURNAL_FILE), "ab")
+        except BaseException:
+            self._release_lock()
+            raise
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _segment_paths(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(glob.escape(self.directory),
+                                             SEGMENT_PATTERN)))
+
+    def _load_key(self) -> bytes:
+        """Читает ключ хеширования, при первом запуске создает его."""
+        path = self._path(KEY_FILE)
+        if not os.path.exists(path):
+            handle = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            with os.fdopen(handle, "wb") as stream:
+                stream.write(os.urandom(32))
+        with open(path, "rb") as stream:
+            key = stream.read()
+        if len(key) != 32:
+            raise ValueError(f"Файл ключа индекса поврежден: {path}")
+        return key
+
+    def _replay_journal(self) -> None:
+        """Восстанавливает хеши, выданные после последнего сброса."""
+        path = self._path(JOURNAL_FILE)
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as stream:
+            data = stream.read()
+        # Неполная последняя запись (обрыв записи) отбрасывается
+        for offset in range(0, len(data) - len(data) % DIGEST_SIZE, DIGEST_SIZE):
+            digest = data[offset:offset + DIGEST_SIZE]
+            self.memtable.add(digest)
+            self.bloom.add_hash(digest)
+
+    def __len__(self) -> int:
+        """Количество записей (с учетом возможных повторов между сегментами)."""
+        return len(self.memtable) + sum(len(segment) for segment in self.segments)
+
+    def digest(self, value: Union[str, bytes]) -> bytes:
+        """Возвращает ключевой хеш значения."""
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        return hashlib.blake2b(value, digest_size=DIGEST_SIZE, key=self.key).digest()
+
+    def contains_hash(self, digest: bytes) -> bool:
+        """Проверяет, выдавалось ли значение с таким хешем."""
+        # Все хеши журнала тоже есть в фильтре: большинство проверок
+        # заканчивается на нем
+        if not self.bloom.contains_hash(digest):
+            return False
+        return digest in self.memtable or any(segment.contains_hash(digest)
+                                              for segment in self.segments)
+
+    def __contains__(self, value: Union[str, bytes]) -> bool:
+        return self.contains_hash(self.digest(value))
+
+    def add_new(self, values: Iterable[bytes]) -> List[bytes]:
+        """
+        Регистрирует значения, которые еще не выдавались.
+
+        Возвращает новые значения в исходном порядке (повторы внутри
+        values также отбрасываются). Их хеши записываются в журнал
+        до возврата, поэтому возвращенные значения уже считаются выданными.
+        """
+        key = self.key
+        blake2b = hashlib.blake2b
+        memtable = self.memtable
+        bloom = self.bloom
+        segments = self.segments
+        fresh: List[bytes] = []
+        digests: List[bytes] = []
+
+        for value in values:
+            digest = blake2b(value, digest_size=DIGEST_SIZE, key=key).digest()
+            # Хеш журнала уже есть в фильтре, поэтому журнал и сегменты
+            # просматриваются только при срабатывании фильтра
+            if bloom.add_hash(digest) and (digest in memtable or any(
+                    segment.contains_hash(digest) for segment in segments)):
+                continue
+            memtable.add(digest)
+            digests.append(digest)
+            fresh.append(value)
+
+        if digests:
+            self.journal.write(b"".join(digests))
+            self.journal.flush()
+            os.fsync(self.journal.fileno())
+        if len(memtable) >= self.memtable_size:
+            self.flush()
+        return fresh
+
+    def flush(self) -> None:
+        """Сбрасывает журнал в новый сегмент."""
+        self.bloom.flush()
+        if not self.memtable:
+            return
+        paths = self._segment_paths()
+        number = int(os.path.basename(paths[-1])[8:14]) + 1 if paths else 1
+        path = self._path(f"segment-{number:06d}.pgsh")
+        write_sorted_records(path + ".tmp", self.memtable.sorted_records(),
+                             DIGEST_SIZE)
+        os.replace(path + ".tmp", path)
+        self.segments.append(SortedHashIndex(path))
+        # Журнал очищается только после появления сегмента
+        self.journal.truncate(0)
+        self.journal.seek(0)
+        self.memtable = _Memtable()
+
+        if len(self.segments) > self.max_segments:
+            self.compact()
+        bloom_capacity = self.bloom.bits * math.log(2) / self.bloom.hashes
+        if len(self) > bloom_capacity:
+            self._rebuild_bloom(2 * len(self))
+
+    def compact(self) -> None:
+        """Сливает все сегменты в один (сначала сбросьте журнал через flush)."""
+        if len(self.segments) < 2:
+            return
+        paths = [segment.path for segment in self.segments]
+        target = paths[-1] + ".tmp"
+        merge_sorted_indexes(target, self.segments)
+        for segment in self.segments:
+            segment.close()
+        # Слитый сегмент получает номер последнего: нумерация не сбивается
+        os.replace(target, paths[-1])
+        for path in paths[:-1]:
+            os.remove(path)
+        self.segments = [SortedHashIndex(paths[-1])]
+
+    def _rebuild_bloom(self, expected: int) -> None:
+        """Пересоздает переполненный фильтр Блума большего размера."""
+        path = self._path(BLOOM_FILE)
+        create_bloom_filter(path + ".tmp", expected, self.error_rate)
+        bloom = BloomFilter(path + ".tmp", writable=True)
+        try:
+            for segment in self.segments:
+                for digest in segment.iter_records():
+                    bloom.add_hash(digest)
+            for digest in self.memtable:
+                bloom.add_hash(digest)
+            bloom.flush()
+        finally:
+            bloom.close()
+        self.bloom.close()
+        os.replace(path + ".tmp", path)
+        self.bloom = BloomFilter(path, writable=True)
+
+    def close(self) -> None:
+        """Сбрасывает журнал и освобождает индекс."""
+        if self.journal.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self.journal.close()
+            self.bloom.close()
+            for segment in self.segments:
+                segment.close()
+            self._release_lock()
+
+    def _release_lock(self) -> None:
+        try:
+            _unlock_file(self._lock_handle)
+        finally:
+            os.close(self._lock_handle)
+
+    def __enter__(self) -> "IssuedIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
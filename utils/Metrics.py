@@ -0,0 +1,223 @@
+"""
+Модуль метрик и профилирования горячих путей.
+
+Функции, помеченные декоратором timed, при включенном сборе метрик
+считают вызовы и записывают задержку (perf_counter_ns) в гистограмму
+с логарифмическими корзинами. При выключенном сборе обертка сводится
+к проверке одного флага. Дополнительно можно включить выборочное
+профилирование cProfile части вызовов.
+
+Метрики собираются в пределах процесса (рабочие процессы пулов ведут
+собственную статистику). Включение: enable() или переменная окружения
+PASSGEN_METRICS=1.
+"""
+
+import _thread
+import functools
+import itertools
+import os
+import time
+from typing import Callable, Dict, List, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+# Границы корзин гистограммы: 2^8 нс (256 нс) ... 2^34 нс (~17 с)
+BUCKET_BOUNDS_NS: List[int] = [1 << power for power in range(8, 35)]
+
+_enabled = os.environ.get("PASSGEN_METRICS", "") not in ("", "0")
+# Профилируется каждый _profile_every-й вызов (0 - профилирование выключено)
+_profile_every = 0
+_profiler = None
+# Низкоуровневая блокировка: модуль не тянет threading при импорте
+_lock = _thread.allocate_lock()
+# Одновременно профилируется только один вызов
+_profile_lock = _thread.allocate_lock()
+
+
+class Histogram:
+    """Счетчик вызовов и гистограмма задержек одной операции."""
+
+    __slots__ = ("count", "errors", "total_ns", "max_ns", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        # Последняя корзина - значения больше последней границы
+        self.buckets = [0] * (len(BUCKET_BOUNDS_NS) + 1)
+
+    def record(self, elapsed_ns: int, failed: bool = False) -> None:
+        index = max(0, elapsed_ns.bit_length() - 8)
+        if elapsed_ns and elapsed_ns == 1 << (elapsed_ns.bit_length() - 1):
+            # Точная степень двойки попадает в корзину со своей границей
+            index = max(0, index - 1)
+        self.buckets[min(index, len(BUCKET_BOUNDS_NS))] += 1
+        self.count += 1
+        self.errors += failed
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    def quantile(self, fraction: float) -> float:
+        """Оценка квантиля задержки в нс (по верхней границе корзины)."""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index, number in enumerate(self.buckets):
+            seen += number
+            if seen >= target:
+                if index < len(BUCKET_BOUNDS_NS):
+                    return float(BUCKET_BOUNDS_NS[index])
+                return float(self.max_ns)
+        return float(self.max_ns)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ns": self.total_ns / self.count if self.count else 0.0,
+            "p50_ns": self.quantile(0.50),
+            "p99_ns": self.quantile(0.99),
+            "max_ns": self.max_ns,
+        }
+
+
+_histograms: Dict[str, Histogram] = {}
+
+
+def enable(flag: bool = True) -> None:
+    """Включает или выключает сбор метрик."""
+    global _enabled
+    _enabled = flag
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def enable_profiling(every: int = 100) -> None:
+    """
+    Включает выборочное профилирование: каждый every-й вызов отмеченных
+    функций выполняется под cProfile (0 - выключить).
+    """
+    global _profile_every, _profiler
+    if every < 0:
+        raise ValueError("Период профилирования не может быть отрицательным")
+    if every and _profiler is None:
+        import cProfile
+        _profiler = cProfile.Profile()
+    _profile_every = every
+
+
+def dump_profile(path: str) -> None:
+    """Сохраняет накопленный профиль (формат pstats)."""
+    if _profiler is None:
+        raise ValueError("Профилирование не включено")
+    with _profile_lock:
+        _profiler.dump_stats(path)
+
+
+def record(name: str, elapsed_ns: int, failed: bool = False) -> None:
+    """Записывает одно измерение операции name."""
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.record(elapsed_ns, failed)
+
+
+def _call_profiled(function: Callable, args: tuple, kwargs: dict):
+    # Вложенные и параллельные вызовы выполняются без профилировщика
+    if not _profile_lock.acquire(blocking=False):
+        return function(*args, **kwargs)
+    try:
+        return _profiler.runcall(function, *args, **kwargs)
+    finally:
+        _profile_lock.release()
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Декоратор: измеряет вызовы функции под именем name."""
+    def decorate(function: F) -> F:
+        # Свой счетчик у каждой функции: вложенные вызовы не сбивают выборку
+        calls = itertools.count(1)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            failed = True
+            started = time.perf_counter_ns()
+            try:
+                if _profile_every and not next(calls) % _profile_every:
+                    result = _call_profiled(function, args, kwargs)
+                else:
+                    result = function(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                record(name, time.perf_counter_ns() - started, failed)
+        return wrapper
+    return decorate
+
+
+def get_stats() -> Dict[str, Dict[str, float]]:
+    """Возвращает сводку по всем операциям."""
+    with _lock:
+        return {name: histogram.as_dict()
+                for name, histogram in sorted(_histograms.items())}
+
+
+def reset() -> None:
+    """Сбрасывает все метрики."""
+    with _lock:
+        _histograms.clear()
+
+
+def format_stats() -> str:
+    """Форматирует сводку в виде таблицы для консоли."""
+    lines = [f"{'операция':<28}{'вызовов':>10}{'ошибок':>8}"
+             f"{'среднее, мкс':>14}{'p50, мкс':>11}{'p99, мкс':>11}"]
+    for name, stats in get_stats().items():
+        lines.append(
+            f"{name:<28}{stats['count']:>10}{stats['errors']:>8}"
+            f"{stats['mean_ns'] / 1000:>14.2f}{stats['p50_ns'] / 1000:>11.2f}"
+            f"{stats['p99_ns'] / 1000:>11.2f}"
+        )
+    return "\n".join(lines)
+
+
+def format_prometheus(prefix: str = "passgen") -> str:
+    """Возвращает метрики в текстовом формате Prometheus."""
+    with _lock:
+        snapshot = {name: (histogram.count, histogram.errors, histogram.total_ns,
+                           list(histogram.buckets))
+                    for name, histogram in sorted(_histograms.items())}
+
+    lines = [f"# TYPE {prefix}_calls_total counter"]
+    for name, (count, _, _, _) in snapshot.items():
+        lines.append(f'{prefix}_calls_total{{op="{name}"}} {count}')
+    lines.append(f"# TYPE {prefix}_errors_total counter")
+    for name, (_, errors, _, _) in snapshot.items():
+        lines.append(f'{prefix}_errors_total{{op="{name}"}} {errors}')
+    lines.append(f"# TYPE {prefix}_latency_seconds histogram")
+    for name, (count, _, total_ns, buckets) in snapshot.items():
+        cumulative = 0
+        for bound, number in zip(BUCKET_BOUNDS_NS, buckets):
+            cumulative += number
+            lines.append(f'{prefix}_latency_seconds_bucket{{op="{name}",'
+                         f'le="{bound / 1e9:.9g}"}} {cumulative}')
+        lines.append(f'{prefix}_latency_seconds_bucket{{op="{name}",le="+Inf"}} {count}')
+        lines.append(f'{prefix}_latency_seconds_sum{{op="{name}"}} {total_ns / 1e9:.9g}')
+        lines.append(f'{prefix}_latency_seconds_count{{op="{name}"}} {count}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: str, prefix: str = "passgen") -> None:
+    """Записывает метрики в файл (атомарно, через временный файл)."""
+    temporary = path + ".tmp"
+    with open(temporary, "w", encoding="utf-8") as stream:
+        stream.write(format_prometheus(prefix))
+    os.replace(temporary, path)
@@ -0,0 +1,79 @@
+"""
+Модуль упорядоченной обработки заданий в пуле процессов.
+
+Задания отправляются в пул по мере освобождения места в окне ограниченного
+размера, а результаты выдаются строго в порядке отправки. Это позволяет
+обрабатывать потоки произвольной длины с ограниченным расходом памяти.
+
+Процессы, в которых уже работают посторонние потоки (например, GUI на
+Tk), не должны создавать пул через fork: дочерний процесс наследует
+состояние чужих потоков и их блокировок. Для них служит
+thread_safe_start_method.
+"""
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Iterable, Iterator, Optional, Tuple
+
+
+def default_workers() -> int:
+    """Возвращает количество рабочих процессов по умолчанию (число ядер)."""
+    return os.cpu_count() or 1
+
+
+def thread_safe_start_method() -> str:
+    """
+    Способ запуска процессов, безопасный для многопоточного родителя.
+
+    forkserver (процессы порождаются из отдельного чистого сервера), если
+    он доступен на платформе, иначе spawn.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return "forkserver"
+    return "spawn"
+
+
+def imap_ordered(function: Callable[..., Any], tasks: Iterable[Tuple],
+                 workers: Optional[int] = None,
+                 initializer: Optional[Callable[..., None]] = None,
+                 initargs: Tuple = (),
+                 start_method: Optional[str] = None) -> Iterator[Any]:
+    """
+    Применяет function к каждому кортежу аргументов из tasks.
+
+    При workers == 1 задания выполняются в текущем процессе. Иначе
+    одновременно в работе находится не более 2 * workers заданий.
+    start_method - способ запуска процессов ("fork", "spawn",
+    "forkserver"; None - способ по умолчанию для платформы).
+    """
+    workers = workers or default_workers()
+    if workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for task in tasks:
+            yield function(*task)
+        return
+
+    max_pending = workers * 2
+    pending: Deque[Future] = deque()
+    tasks = iter(tasks)
+    exhausted = False
+
+    context = multiprocessing.get_context(start_method) if start_method else None
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=initializer, initargs=initargs) as executor:
+        try:
+            while pending or not exhausted:
+                while not exhausted and len(pending) < max_pending:
+                    task = next(tasks, None)
+                    if task is None:
+                        exhausted = True
+                    else:
+                        pending.append(executor.submit(function, *task))
+                if pending:
+                    yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()